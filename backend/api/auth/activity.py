@@ -0,0 +1,144 @@
+"""
+Write-behind buffer for login bookkeeping (last_login, last_login_ip).
+
+Logins used to save the user row synchronously, so a login storm (every
+mobile client reconnecting at once) turned into a stream of single-row
+UPDATEs on hot auth_user rows. record_login() instead stamps the instance
+for the response and queues the values in this process; a background thread
+writes everything queued every LOGIN_ACTIVITY_FLUSH_INTERVAL seconds as
+batched
+
+    UPDATE auth_user SET ... FROM (VALUES (id, last_login, ip), ...) v
+    WHERE auth_user.id = v.id AND last_login is older
+
+statements, ordered by id so concurrent workers lock rows in the same order.
+Repeated logins of one user between flushes collapse into one row.
+
+The queue is flushed at interpreter exit, so a graceful worker shutdown
+(SIGTERM, reload) loses nothing; a killed process loses at most one interval
+of login timestamps, which are informational only.
+"""
+
+import atexit
+import ipaddress
+import logging
+import os
+import threading
+
+from django.db import connection, transaction
+
+from api.common.cache import bump_objects
+
+from .authentication import invalidate_cached_user
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+LOGIN_ACTIVITY_FLUSH_INTERVAL = 5
+LOGIN_ACTIVITY_BATCH_SIZE = 1000
+
+_pending = {}
+_pending_lock = threading.Lock()
+_flusher_pid = None
+_stop = threading.Event()
+
+
+def _valid_ip(value):
+    """Normalised address, or None for a missing or malformed X-Forwarded-For value"""
+    try:
+        return str(ipaddress.ip_address((value or '').strip()))
+    except ValueError:
+        return None
+
+
+def record_login(user, ip, when):
+    """Stamp ``user`` with the login and queue the row update"""
+    ip = _valid_ip(ip)
+    user.last_login = when
+    if ip is not None:
+        user.last_login_ip = ip
+    with _pending_lock:
+        previous = _pending.get(user.pk)
+        if previous is None or previous[0] <= when:
+            _pending[user.pk] = (when, ip if ip is not None else (previous[1] if previous else None))
+    _ensure_flusher()
+
+
+def write_logins(entries):
+    """
+    Apply {user_id: (last_login, last_login_ip)} in batched UPDATE ... FROM
+    (VALUES ...) statements. An older timestamp never overwrites a newer one,
+    and a missing IP keeps the stored one.
+    """
+    table = connection.ops.quote_name(User._meta.db_table)
+    ordered = sorted(entries.items())
+    for start in range(0, len(ordered), LOGIN_ACTIVITY_BATCH_SIZE):
+        batch = ordered[start:start + LOGIN_ACTIVITY_BATCH_SIZE]
+        values = ', '.join(['(%s, %s::timestamptz, %s::inet)'] * len(batch))
+        params = [value for user_id, (when, ip) in batch for value in (user_id, when, ip)]
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} AS u '
+                f'SET last_login = v.last_login, last_login_ip = COALESCE(v.last_login_ip, u.last_login_ip) '
+                f'FROM (VALUES {values}) AS v (id, last_login, last_login_ip) '
+                f'WHERE u.id = v.id AND (u.last_login IS NULL OR u.last_login < v.last_login)',
+                params,
+            )
+
+    # What post_save would have refreshed: the cached auth user and the freelancer page (shows last_login)
+    user_ids = [user_id for user_id, _ in ordered]
+    for user_id in user_ids:
+        invalidate_cached_user(user_id)
+    bump_objects('user', user_ids)
+
+
+def flush_logins():
+    """Write out everything queued in this process; returns the number of users written"""
+    with _pending_lock:
+        entries = dict(_pending)
+        _pending.clear()
+    if not entries:
+        return 0
+    try:
+        write_logins(entries)
+    except Exception:
+        # Put the batch back (newer logins queued meanwhile win) and retry on the next tick
+        with _pending_lock:
+            for user_id, entry in entries.items():
+                if user_id not in _pending or _pending[user_id][0] < entry[0]:
+                    _pending[user_id] = entry
+        raise
+    return len(entries)
+
+
+def _flush_periodically():
+    while not _stop.wait(LOGIN_ACTIVITY_FLUSH_INTERVAL):
+        try:
+            flush_logins()
+        except Exception as e:
+            logger.error(f"Error flushing login activity: {str(e)}")
+        finally:
+            connection.close()  # this thread's connection; idle until the next tick
+
+
+def _flush_at_exit():
+    _stop.set()
+    try:
+        flush_logins()
+    except Exception as e:
+        logger.error(f"Login activity lost at shutdown: {str(e)}")
+
+
+def _ensure_flusher():
+    # Threads do not survive a fork, so each worker process starts its own
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    with _pending_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+        threading.Thread(target=_flush_periodically, name='login-activity-flusher', daemon=True).start()
+
+
+atexit.register(_flush_at_exit)
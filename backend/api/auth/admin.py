@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
-from .models import User
+from .authentication import invalidate_cached_user
+from .matching import record_freelancer_changes
+from .models import Freelancer, User
 
 
 @admin.register(User)
@@ -64,7 +66,12 @@ class UserAdmin(BaseUserAdmin):
         """
         Mark selected users as active
         """
+        user_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=True)
+        # queryset.update() skips post_save, so drop the cached auth users and re-index explicitly
+        for user_id in user_ids:
+            invalidate_cached_user(user_id)
+        record_freelancer_changes(Freelancer.objects.filter(user_id__in=user_ids).values_list('pk', flat=True))
         self.message_user(request, f'{updated} users were successfully marked as active.')
     make_active.short_description = "Mark selected users as active"
     
@@ -72,7 +79,12 @@ class UserAdmin(BaseUserAdmin):
         """
         Mark selected users as inactive
         """
+        user_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=False)
+        # queryset.update() skips post_save, so drop the cached auth users and re-index explicitly
+        for user_id in user_ids:
+            invalidate_cached_user(user_id)
+        record_freelancer_changes(Freelancer.objects.filter(user_id__in=user_ids).values_list('pk', flat=True))
         self.message_user(request, f'{updated} users were successfully marked as inactive.')
     make_inactive.short_description = "Mark selected users as inactive"
     
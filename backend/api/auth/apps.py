@@ -5,4 +5,8 @@ class AuthConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api.auth'
     label = 'api_auth'  # This prevents conflicts with Django's built-in auth
-    verbose_name = 'Authentication'
\ No newline at end of file
+    verbose_name = 'Authentication'
+
+    def ready(self):
+        # Register model signal handlers
+        from . import signals  # noqa: F401
\ No newline at end of file
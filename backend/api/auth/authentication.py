@@ -0,0 +1,158 @@
+"""
+JWT authentication with a cached user loader.
+
+SimpleJWT's JWTAuthentication reads the User row on every request, and views
+then follow user.client_profile / user.freelancer_profile with one more query
+each. CachedJWTAuthentication rebuilds the user, with its role profiles, from a
+two-tier cache instead:
+
+    L1  per-process dict, AUTH_USER_LOCAL_TIMEOUT seconds
+    L2  shared Django cache (Redis), AUTH_USER_CACHE_TIMEOUT seconds
+
+so a warm request authenticates without touching the database. The role
+profiles are cached with the user and attached to it, so
+``user.client_profile`` / ``user.freelancer_profile`` are free as well.
+Secrets (password hash, email verification token) are never cached; they are
+left deferred and loaded from the database if a view reads them.
+
+api.auth.signals drops the entry when the user, one of its profiles or its
+password changes. Other processes may serve their L1 copy for up to
+AUTH_USER_LOCAL_TIMEOUT seconds after that.
+"""
+
+import threading
+import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+AUTH_USER_CACHE_KEY = 'auth_user:{}'
+AUTH_USER_CACHE_TIMEOUT = 60
+AUTH_USER_LOCAL_TIMEOUT = 5
+AUTH_USER_LOCAL_MAX_ENTRIES = 10000
+
+# Reverse one-to-one accessors of the role profiles
+PROFILE_RELATIONS = ('client_profile', 'freelancer_profile', 'admin_profile')
+
+# Never copied into the cache; loaded from the database if a view reads them
+UNCACHED_USER_FIELDS = ('password', 'email_verification_token')
+
+_local = {}
+_local_lock = threading.Lock()
+
+
+def _cached_field_names():
+    return [
+        field.attname for field in User._meta.concrete_fields
+        if field.attname not in UNCACHED_USER_FIELDS
+    ]
+
+
+def _profile_field_names(relation):
+    """Concrete fields of a role profile except the user link, which is set from the cached user"""
+    model = getattr(User, relation).related.related_model
+    return [field.attname for field in model._meta.concrete_fields if field.attname != 'user_id']
+
+
+def _load_entry(user_id):
+    """One query: the user's cacheable columns plus each role profile, LEFT JOINed"""
+    fields = _cached_field_names()
+    profile_fields = {relation: _profile_field_names(relation) for relation in PROFILE_RELATIONS}
+    row = (
+        User.objects.filter(pk=user_id)
+        .values(*fields, *(
+            f'{relation}__{name}' for relation, names in profile_fields.items() for name in names
+        ))
+        .first()
+    )
+    if row is None:
+        return None
+    profiles = {}
+    for relation, names in profile_fields.items():
+        values = {name: row[f'{relation}__{name}'] for name in names}
+        profiles[relation] = values if values['id'] is not None else None
+    return {'fields': {name: row[name] for name in fields}, 'profiles': profiles}
+
+
+def _from_values(model, values):
+    """Model instance from an attname -> value dict; missing columns are deferred"""
+    names = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+    return model.from_db(model.objects.db, names, [values[name] for name in names])
+
+
+def _build_user(entry):
+    """User instance (secrets deferred) with its role profiles attached"""
+    user = _from_values(User, entry['fields'])
+    for relation, values in entry['profiles'].items():
+        descriptor = getattr(User, relation)
+        profile = None
+        if values is not None:
+            profile = _from_values(descriptor.related.related_model, {**values, 'user_id': user.pk})
+            descriptor.related.field.set_cached_value(profile, user)
+        descriptor.related.set_cached_value(user, profile)
+    return user
+
+
+def get_cached_user_entry(user_id):
+    """Cached entry for a user id (L1, then L2, then one query); None when the user does not exist"""
+    now = time.monotonic()
+    local = _local.get(user_id)
+    if local is not None and local[0] > now:
+        return local[1]
+
+    key = AUTH_USER_CACHE_KEY.format(user_id)
+    entry = cache.get(key)
+    if entry is None:
+        entry = _load_entry(user_id)
+        if entry is None:
+            return None
+        cache.set(key, entry, AUTH_USER_CACHE_TIMEOUT)
+
+    with _local_lock:
+        if len(_local) >= AUTH_USER_LOCAL_MAX_ENTRIES:
+            _local.clear()
+        _local[user_id] = (now + AUTH_USER_LOCAL_TIMEOUT, entry)
+    return entry
+
+
+def get_cached_user(user_id):
+    """User (with role profiles attached) from the user cache; None when it does not exist"""
+    entry = get_cached_user_entry(user_id)
+    return _build_user(entry) if entry is not None else None
+
+
+def invalidate_cached_user(user_id):
+    """Drop a user's entry from the shared cache and this process' L1"""
+    cache.delete(AUTH_USER_CACHE_KEY.format(user_id))
+    with _local_lock:
+        _local.pop(user_id, None)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication whose user lookup is served from the two-tier user cache"""
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != 'id':
+            # Revocation compares the password hash, which is deliberately not cached
+            return super().get_user(validated_token)
+
+        try:
+            user_id = int(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        except (TypeError, ValueError):
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        entry = get_cached_user_entry(user_id)
+        if entry is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        user = _build_user(entry)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
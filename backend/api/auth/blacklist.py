@@ -0,0 +1,283 @@
+"""
+Refresh-token blacklist: pruning and an in-process membership filter.
+
+With ROTATE_REFRESH_TOKENS and BLACKLIST_AFTER_ROTATION every refresh
+blacklists the token it consumed, and every refresh first checks that its own
+token is not blacklisted (one query joining token_blacklist_blacklistedtoken
+to token_blacklist_outstandingtoken). The blacklist only ever grows, so:
+
+* prune_expired_tokens() deletes outstanding tokens past their expiry, and
+  their blacklist rows with them, in short batches (``manage.py
+  prune_token_blacklist``, scheduled daily in render.yaml). An expired token
+  is rejected on its ``exp`` claim, so its blacklist row serves no purpose.
+
+* Each process keeps a Bloom filter of the unexpired blacklisted jtis. A
+  negative answer means "definitely not blacklisted" and skips the query; a
+  positive answer (a real hit or a false positive, TOKEN_BLACKLIST_FILTER_ERROR_RATE
+  of the time) falls through to the database. New entries reach every
+  process through a Redis pub/sub channel, and the filter is rebuilt from the
+  database every TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL seconds, which also
+  drops pruned jtis.
+
+The filter is only trusted while its listener is subscribed and no rebuild is
+in progress; otherwise might_be_blacklisted() answers True and the caller
+queries the database, exactly as stock SimpleJWT does. Each announcement
+increments a generation counter in Redis (atomically with the publish) and
+carries the new value. Every TOKEN_BLACKLIST_FILTER_CHECK_INTERVAL seconds a
+listener reads the counter; if it has not applied the generation read at the
+previous check by then, a message was lost and the filter is rebuilt. A jti
+that could not be announced at all is retried by this process' listener. A
+jti blacklisted in another process is visible here once its message arrives
+(normally well under a millisecond after commit).
+
+Rotation does not depend on the filter alone: RoleRefreshToken.blacklist()
+refuses a token whose blacklist row already existed.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+logger = logging.getLogger(__name__)
+
+TOKEN_BLACKLIST_CHANNEL = 'freelancehub:token_blacklist'
+TOKEN_BLACKLIST_GENERATION_KEY = 'freelancehub:token_blacklist:generation'
+
+# Sizing: the filter is rebuilt larger if the blacklist outgrows the capacity
+TOKEN_BLACKLIST_FILTER_CAPACITY = 1_000_000
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = 0.001
+TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL = 600
+TOKEN_BLACKLIST_FILTER_RETRY_DELAY = 5
+TOKEN_BLACKLIST_FILTER_CHECK_INTERVAL = 1
+
+PRUNE_BATCH_SIZE = 5000
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one blake2b digest)"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+def blacklisted_jtis():
+    """jtis of the blacklisted tokens that have not expired yet"""
+    return (
+        BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        .values_list('token__jti', flat=True)
+        .iterator(chunk_size=PRUNE_BATCH_SIZE)
+    )
+
+
+def build_filter():
+    count = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).count()
+    bloom = BloomFilter(max(TOKEN_BLACKLIST_FILTER_CAPACITY, count * 2), TOKEN_BLACKLIST_FILTER_ERROR_RATE)
+    for jti in blacklisted_jtis():
+        bloom.add(jti)
+    return bloom
+
+
+class _BlacklistFilter:
+    """This process' filter and the pub/sub listener thread that maintains it"""
+
+    def __init__(self):
+        self.bloom = None
+        self.ready = False
+        self.generation = 0
+        self.expected = 0
+        self.unannounced = []
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def might_be_blacklisted(self, jti):
+        self.ensure_listening()
+        bloom = self.bloom
+        if not self.ready or bloom is None:
+            return True
+        return jti in bloom
+
+    def add(self, jti):
+        bloom = self.bloom
+        if bloom is not None:
+            bloom.add(jti)
+
+    def ensure_listening(self):
+        # Threads do not survive a fork, so each worker process starts its own
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.bloom = None
+            self.ready = False
+            self.unannounced = []
+            threading.Thread(target=self._listen, name='token-blacklist-filter', daemon=True).start()
+
+    def _apply(self, message):
+        generation, _, jti = message['data'].decode().partition(':')
+        self.add(jti)
+        self.generation = max(self.generation, int(generation))
+
+    def _rebuild(self, pubsub):
+        """
+        Load a fresh filter; the pub/sub subscription is already open, so
+        messages published meanwhile wait in the socket and are applied
+        before the filter is trusted again.
+        """
+        self.ready = False
+        # Read before loading: every announcement up to here is in the database
+        self.generation = _generation()
+        try:
+            self.bloom = build_filter()
+        finally:
+            connection.close()  # this thread's connection; it is idle until the next rebuild
+        while True:
+            message = pubsub.get_message(timeout=0)
+            if message is None:
+                break
+            self._apply(message)
+        self.expected = self.generation
+        self.ready = True
+        return time.monotonic()
+
+    def _announce_pending(self):
+        while self.unannounced:
+            _announce(self.unannounced[0])
+            self.unannounced.pop(0)
+
+    def _check_generation(self, pubsub):
+        """
+        Compare with the counter read at the previous check: announcements
+        made before it have had a whole check interval to arrive, so one that
+        is still missing was lost and the filter is rebuilt. Returns the
+        rebuild time, or None.
+        """
+        expected, self.expected = self.expected, _generation()
+        if self.generation >= expected:
+            return None
+        logger.warning("Token blacklist announcements were lost, rebuilding the filter")
+        return self._rebuild(pubsub)
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = _redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(TOKEN_BLACKLIST_CHANNEL)
+                built_at = checked_at = self._rebuild(pubsub)
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._apply(message)
+                    if time.monotonic() - checked_at > TOKEN_BLACKLIST_FILTER_CHECK_INTERVAL:
+                        checked_at = time.monotonic()
+                        self._announce_pending()
+                        built_at = self._check_generation(pubsub) or built_at
+                    if time.monotonic() - built_at > TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL:
+                        built_at = self._rebuild(pubsub)
+            except Exception as e:
+                self.ready = False
+                logger.warning(f"Token blacklist filter unavailable, checking the database: {str(e)}")
+                time.sleep(TOKEN_BLACKLIST_FILTER_RETRY_DELAY)
+
+
+_filter = _BlacklistFilter()
+_client = None
+
+
+def _redis():
+    """Process-wide Redis client (redis-py pools and reuses its connections)"""
+    global _client
+    if _client is None:
+        import redis
+
+        _client = redis.Redis.from_url(settings.TOKEN_BLACKLIST_FILTER_REDIS_URL)
+    return _client
+
+
+def _generation():
+    return int(_redis().get(TOKEN_BLACKLIST_GENERATION_KEY) or 0)
+
+
+def _announce(jti):
+    """Increment the generation and publish ``<generation>:<jti>``, atomically (one Lua script)"""
+    script = _redis().register_script(
+        "local generation = redis.call('INCR', KEYS[1]) "
+        "redis.call('PUBLISH', ARGV[1], generation .. ':' .. ARGV[2]) "
+        "return generation"
+    )
+    return script(keys=[TOKEN_BLACKLIST_GENERATION_KEY], args=[TOKEN_BLACKLIST_CHANNEL, jti])
+
+
+def might_be_blacklisted(jti):
+    """False only when the jti is definitely not blacklisted"""
+    if not settings.TOKEN_BLACKLIST_FILTER_ENABLED:
+        return True
+    return _filter.might_be_blacklisted(jti)
+
+
+def prime_filter():
+    """
+    Build this process' filter now and trust it without a listener. Only for
+    benchmarks and one-off scripts: nothing keeps a primed filter current.
+    """
+    _filter.pid = os.getpid()
+    _filter.bloom = build_filter()
+    _filter.ready = True
+
+
+def publish_blacklisted(jti):
+    """Add a newly blacklisted jti to this process' filter and announce it to the others"""
+    if not settings.TOKEN_BLACKLIST_FILTER_ENABLED:
+        return
+    _filter.add(jti)
+    try:
+        _announce(jti)
+    except Exception as e:
+        # This process' listener retries it; until then other processes' filters lack the jti
+        _filter.unannounced.append(jti)
+        logger.warning(f"Could not publish blacklisted token: {str(e)}")
+
+
+def prune_expired_tokens(batch_size=PRUNE_BATCH_SIZE, now=None):
+    """
+    Delete outstanding tokens that expired before ``now``, together with their
+    blacklist rows, ``batch_size`` rows per statement. Returns the number of
+    outstanding tokens deleted.
+    """
+    now = now or timezone.now()
+    deleted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by('expires_at').values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        OutstandingToken.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
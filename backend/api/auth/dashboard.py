@@ -0,0 +1,93 @@
+"""
+Dashboard statistics, one query per role and cached per profile.
+
+The dashboard is the first call after every login. Its numbers used to take
+one COUNT per job status plus a payments aggregate; here each role's stats
+come from a single statement that cross-joins one-row aggregates (jobs by
+status with FILTER clauses, completed payments, the user's unread chat
+message counters).
+
+Snapshots are cached per client / freelancer profile through cache_object()
+and dropped with bump_objects('client_stats' / 'freelancer_stats', ids) once
+a transaction that changed a job, payment or chat message commits (see
+api.auth.signals and chat.views).
+"""
+
+from django.db import connection, transaction
+
+from api.common.cache import bump_objects, cache_object
+from chat.models import UnreadCounter
+from payment.models import Payment
+
+from .models import Client, Freelancer, Job
+
+
+def _table(model):
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def _unread_messages_sql(profile_model):
+    """The profile's user's unread messages, summed from the chat.unread counters"""
+    return (
+        f'SELECT COALESCE(SUM(uc.unread), 0) AS unread_messages FROM {_table(UnreadCounter)} AS uc '
+        f'WHERE uc.user_id = (SELECT user_id FROM {_table(profile_model)} WHERE id = %s)'
+    )
+
+
+def _fetch(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return dict(zip(columns, cursor.fetchone()))
+
+
+@cache_object('dashboard_stats:client', kind='client_stats')
+def client_stats(client_id):
+    stats = _fetch(
+        f"SELECT j.total_jobs_posted, j.active_jobs, j.completed_jobs, p.total_spent, m.unread_messages "
+        f"FROM (SELECT COUNT(*) FILTER (WHERE status = 'open') AS total_jobs_posted, "
+        f"             COUNT(*) FILTER (WHERE status = 'in_progress') AS active_jobs, "
+        f"             COUNT(*) FILTER (WHERE status = 'completed') AS completed_jobs "
+        f"      FROM {_table(Job)} WHERE client_id = %s) AS j "
+        f"CROSS JOIN (SELECT COALESCE(SUM(amount), 0) AS total_spent "
+        f"            FROM {_table(Payment)} WHERE client_id = %s AND status = 'completed') AS p "
+        f"CROSS JOIN ({_unread_messages_sql(Client)}) AS m",
+        [client_id, client_id, client_id],
+    )
+    stats['total_spent'] = float(stats['total_spent'])
+    return stats, []
+
+
+@cache_object('dashboard_stats:freelancer', kind='freelancer_stats')
+def freelancer_stats(freelancer_id):
+    stats = _fetch(
+        f"SELECT p.total_earned, 0 AS active_jobs, p.completed_jobs, m.unread_messages "
+        f"FROM (SELECT COALESCE(SUM(amount), 0) AS total_earned, COUNT(*) AS completed_jobs "
+        f"      FROM {_table(Payment)} WHERE freelancer_id = %s AND status = 'completed') AS p "
+        f"CROSS JOIN ({_unread_messages_sql(Freelancer)}) AS m",
+        [freelancer_id, freelancer_id],
+    )
+    stats['total_earned'] = float(stats['total_earned'])
+    return stats, []
+
+
+def dashboard_stats(identity):
+    """Stats for a TokenIdentity; {} for admins and users without a role profile"""
+    if identity.is_client and identity.client_id:
+        return client_stats(identity.client_id)[0]
+    if identity.is_freelancer and identity.freelancer_id:
+        return freelancer_stats(identity.freelancer_id)[0]
+    return {}
+
+
+def invalidate_dashboard_stats(client_ids=(), freelancer_ids=()):
+    """Drop the cached snapshots of the given profiles once the current transaction commits"""
+    client_ids = [pk for pk in client_ids if pk is not None]
+    freelancer_ids = [pk for pk in freelancer_ids if pk is not None]
+
+    def bump():
+        bump_objects('client_stats', client_ids)
+        bump_objects('freelancer_stats', freelancer_ids)
+
+    if client_ids or freelancer_ids:
+        transaction.on_commit(bump)
@@ -0,0 +1,128 @@
+"""
+Public job and freelancer detail payloads.
+
+The rendered payload of each page is cached per object and tied to the
+versions of the rows it was built from (the job, its client and the client's
+user; the freelancer and their user), which the model signals bump. A change
+to one job therefore only drops that job's page, and ?fields= is applied to
+the cached full payload.
+
+The ?ids= batch variants build the same payloads for many objects from one
+primary-key IN query.
+"""
+
+from api.common.cache import cache_object, object_ref
+
+from .models import Freelancer, Job
+
+# Upper bound on ?ids= per batch request
+MAX_BATCH_IDS = 200
+
+
+class InvalidIds(ValueError):
+    """Raised when ?ids= is missing, malformed or too long"""
+
+
+def parse_ids(raw, limit=MAX_BATCH_IDS):
+    """Parse a comma-separated id list, keeping the first occurrence of each id"""
+    try:
+        ids = [int(value) for value in (raw or '').split(',') if value.strip()]
+    except ValueError:
+        raise InvalidIds('ids must be a comma-separated list of integers')
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        raise InvalidIds('ids is required')
+    if len(ids) > limit:
+        raise InvalidIds(f'At most {limit} ids can be requested at once')
+    return ids
+
+
+def _active_jobs():
+    return Job.objects.select_related('client__user').defer('search_vector').filter(
+        status__in=['open', 'in_progress']  # Only show active jobs
+    )
+
+
+def _active_freelancers():
+    return Freelancer.objects.select_related('user').defer('user__bio').filter(
+        user__is_active=True  # Only show active freelancers
+    )
+
+
+@cache_object('job_detail', kind='job')
+def job_detail(job_id):
+    """Detail payload of an active job; raises Job.DoesNotExist otherwise"""
+    job = _active_jobs().get(id=job_id)
+    return _job_payload(job), [object_ref('client', job.client_id), object_ref('user', job.client.user_id)]
+
+
+def job_details(job_ids):
+    """Detail payloads of the active jobs among ``job_ids``, keyed by id"""
+    return {job.id: _job_payload(job) for job in _active_jobs().filter(id__in=job_ids)}
+
+
+def _job_payload(job):
+    client_name = f"{job.client.user.first_name} {job.client.user.last_name}".strip()
+    return {
+        'id': job.id,
+        'title': job.title,
+        'description': job.description,
+        'budget_min': float(job.budget_min) if job.budget_min else None,
+        'budget_max': float(job.budget_max) if job.budget_max else None,
+        'duration': job.duration,
+        'category': job.category,
+        'skills': job.skills,
+        'skills_list': [skill.strip() for skill in job.skills.split(',')] if job.skills else [],
+        'requirements': job.requirements,
+        'project_details': job.project_details,
+        'status': job.status,
+        'proposals_count': job.proposals_count,
+        'created_at': job.created_at.isoformat(),
+        'client': {
+            'id': job.client.id,
+            'name': client_name,
+            'username': job.client.user.username,
+            'company_name': job.client.company_name or client_name,
+            'email': job.client.user.email,
+            'created_at': job.client.user.date_joined.isoformat(),
+        }
+    }
+
+
+@cache_object('freelancer_detail', kind='freelancer')
+def freelancer_detail(freelancer_id):
+    """Detail payload of an active freelancer; raises Freelancer.DoesNotExist otherwise"""
+    freelancer = _active_freelancers().get(id=freelancer_id)
+    return _freelancer_payload(freelancer), [object_ref('user', freelancer.user_id)]
+
+
+def freelancer_details(freelancer_ids):
+    """Detail payloads of the active freelancers among ``freelancer_ids``, keyed by id"""
+    return {
+        freelancer.id: _freelancer_payload(freelancer)
+        for freelancer in _active_freelancers().filter(id__in=freelancer_ids)
+    }
+
+
+def _freelancer_payload(freelancer):
+    user = freelancer.user
+    return {
+        'id': freelancer.id,
+        'user_id': user.id,
+        'name': f"{user.first_name} {user.last_name}".strip(),
+        'username': user.username,
+        'email': user.email,
+        'title': freelancer.title,
+        'category': freelancer.category,
+        'rate': float(freelancer.rate) if freelancer.rate else None,
+        'skills': freelancer.skills,
+        'skills_list': [skill.strip() for skill in freelancer.skills.split(',')] if freelancer.skills else [],
+        'bio': freelancer.bio,
+        'location': freelancer.location,
+        'profile_picture': user.profile_picture,
+        'created_at': freelancer.created_at.isoformat(),
+        'user_created_at': user.date_joined.isoformat(),
+        'last_login': user.last_login.isoformat() if user.last_login else None,
+        'is_active': user.is_active,
+        'email_verified': user.email_verified,
+    }
@@ -0,0 +1,298 @@
+"""
+Public NDJSON feeds and sitemaps of open jobs and active freelancers.
+
+Rows are read from the listing projections in primary-key shards of
+SHARD_SIZE ids through server-side cursors, so memory use does not grow with
+the table. Each shard has a cheap fingerprint (row count, sum of exported
+ids, latest ``refreshed_at``) taken from one GROUP BY over the projection.
+
+The export endpoint streams every shard straight from the database
+(stream_shard()) and sends the fingerprint as its ETag and the latest
+``refreshed_at`` as Last-Modified, so crawlers re-download only the shards
+whose rows changed. Nothing has to be generated ahead of time, which matters
+on hosts whose web filesystem is ephemeral.
+
+``manage.py export_listings`` writes the same files to a directory (e.g. for
+a CDN or static bucket); a re-run only rewrites the shards whose fingerprint
+changed since its manifest was last written. Layout of EXPORT_ROOT:
+    manifest.json              shard fingerprints and file list
+    sitemap.xml                sitemap index pointing at the shard sitemaps
+    jobs-00000.ndjson / .xml   one NDJSON feed and one sitemap per shard
+"""
+
+import json
+import os
+import re
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Count, F, Max, Q, Sum
+from django.utils import timezone
+
+from .models import FreelancerListing, JobListing
+
+# Ids per shard; sitemaps allow at most 50,000 URLs per file
+SHARD_SIZE = 10000
+
+EXPORT_CHUNK_SIZE = 2000
+
+MANIFEST_NAME = 'manifest.json'
+SITEMAP_INDEX_NAME = 'sitemap.xml'
+
+# Shard files the export endpoint serves, besides SITEMAP_INDEX_NAME
+SHARD_FILE_PATTERN = re.compile(r'^(?P<kind>jobs|freelancers)-(?P<shard>\d{5})\.(?P<extension>ndjson|xml)$')
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+SITEMAP_HEADER = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'
+SITEMAP_FOOTER = '</urlset>\n'
+
+
+def _number(value):
+    return float(value) if value is not None else None
+
+
+def _job_record(row, site_url):
+    return {
+        'id': row.job_id,
+        'url': f'{site_url}/jobs/{row.job_id}',
+        'title': row.title,
+        'description': row.description,
+        'category': row.category,
+        'budget_min': _number(row.budget_min),
+        'budget_max': _number(row.budget_max),
+        'duration': row.duration,
+        'skills': row.skills_list,
+        'proposals_count': row.proposals_count,
+        'client_name': row.client_name,
+        'created_at': row.created_at.isoformat(),
+        'updated_at': row.refreshed_at.isoformat(),
+    }
+
+
+def _freelancer_record(row, site_url):
+    return {
+        'id': row.freelancer_id,
+        'url': f'{site_url}/freelancers/{row.freelancer_id}',
+        'name': row.name,
+        'username': row.username,
+        'title': row.title,
+        'category': row.category,
+        'rate': _number(row.rate),
+        'skills': row.skills_list,
+        'location': row.location,
+        'profile_picture': row.profile_picture,
+        'bio': row.bio,
+        'created_at': row.created_at.isoformat(),
+        'updated_at': row.refreshed_at.isoformat(),
+    }
+
+
+# kind -> (projection model, filter selecting public rows, record builder)
+EXPORT_KINDS = {
+    'jobs': (JobListing, Q(status='open'), _job_record),
+    'freelancers': (FreelancerListing, Q(freelancer__user__is_active=True), _freelancer_record),
+}
+
+
+def shard_name(kind, shard, extension):
+    return f'{kind}-{shard:05d}.{extension}'
+
+
+def parse_shard_name(name):
+    """(kind, shard, extension) of a shard file name, or None"""
+    match = SHARD_FILE_PATTERN.match(name)
+    if match is None:
+        return None
+    return match['kind'], int(match['shard']), match['extension']
+
+
+def shard_stats(kind, shard=None):
+    """
+    {shard: {'fingerprint', 'rows', 'updated_at'}} for every shard holding at
+    least one projection row, or for ``shard`` alone
+    """
+    model, public, _ = EXPORT_KINDS[kind]
+    rows = model.objects.order_by()
+    if shard is not None:
+        rows = rows.filter(pk__gte=shard * SHARD_SIZE, pk__lt=(shard + 1) * SHARD_SIZE)
+    shards = (
+        rows.annotate(shard=F('pk') / SHARD_SIZE)
+        .values('shard')
+        .annotate(
+            exported=Count('pk', filter=public),
+            id_sum=Sum('pk', filter=public),
+            last_change=Max('refreshed_at'),
+            total=Count('pk'),
+        )
+    )
+    return {
+        entry['shard']: {
+            'fingerprint': '{}:{}:{}:{}'.format(
+                entry['total'], entry['exported'], entry['id_sum'] or 0, entry['last_change'].isoformat(),
+            ),
+            'rows': entry['exported'],
+            'updated_at': entry['last_change'],
+        }
+        for entry in shards
+    }
+
+
+def live_manifest():
+    """The manifest of the files the export endpoint streams, from the projections' current rows"""
+    return {
+        'generated_at': timezone.now().isoformat(),
+        'kinds': {
+            kind: {
+                str(shard): {'rows': stats['rows'], 'updated_at': stats['updated_at'].isoformat()}
+                for shard, stats in shard_stats(kind).items()
+            }
+            for kind in EXPORT_KINDS
+        },
+    }
+
+
+def _shard_rows(kind, shard):
+    model, public, _ = EXPORT_KINDS[kind]
+    return model.objects.filter(public, pk__gte=shard * SHARD_SIZE, pk__lt=(shard + 1) * SHARD_SIZE).order_by('pk')
+
+
+def _ndjson_line(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def _sitemap_line(row, data):
+    return f'<url><loc>{escape(data["url"])}</loc><lastmod>{row.refreshed_at.date().isoformat()}</lastmod></url>\n'
+
+
+async def stream_shard(kind, shard, extension, site_url):
+    """
+    One shard's NDJSON feed or sitemap, read through a server-side cursor and
+    yielded EXPORT_CHUNK_SIZE rows at a time. Asynchronous, as ASGI servers
+    would otherwise buffer a synchronous iterator whole before sending it.
+    """
+    record = EXPORT_KINDS[kind][2]
+    if extension == 'xml':
+        yield SITEMAP_HEADER
+    chunk = []
+    async for row in _shard_rows(kind, shard).aiterator(chunk_size=EXPORT_CHUNK_SIZE):
+        data = record(row, site_url)
+        chunk.append(_ndjson_line(data) if extension == 'ndjson' else _sitemap_line(row, data))
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+    if extension == 'xml':
+        yield SITEMAP_FOOTER
+
+
+def _replace(path, lines):
+    """Write lines to path through a temporary file so readers never see a partial shard"""
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as handle:
+        handle.writelines(lines)
+    os.replace(temporary, path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def write_shard(kind, shard, root, site_url):
+    """Stream one shard to its NDJSON and sitemap files; returns the number of rows"""
+    record = EXPORT_KINDS[kind][2]
+    rows = _shard_rows(kind, shard).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    ndjson_path = os.path.join(root, shard_name(kind, shard, 'ndjson'))
+    sitemap_path = os.path.join(root, shard_name(kind, shard, 'xml'))
+    count = 0
+    with open(f'{ndjson_path}.tmp', 'w', encoding='utf-8') as ndjson, \
+            open(f'{sitemap_path}.tmp', 'w', encoding='utf-8') as sitemap:
+        sitemap.write(SITEMAP_HEADER)
+        for row in rows:
+            data = record(row, site_url)
+            ndjson.write(_ndjson_line(data))
+            sitemap.write(_sitemap_line(row, data))
+            count += 1
+        sitemap.write(SITEMAP_FOOTER)
+
+    if count:
+        os.replace(f'{ndjson_path}.tmp', ndjson_path)
+        os.replace(f'{sitemap_path}.tmp', sitemap_path)
+    else:
+        for path in (ndjson_path, sitemap_path):
+            _remove(f'{path}.tmp')
+            _remove(path)
+    return count
+
+
+def load_manifest(root=None):
+    root = root or settings.EXPORT_ROOT
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), encoding='utf-8') as handle:
+            return json.load(handle)
+    except (FileNotFoundError, ValueError):
+        return {'kinds': {}}
+
+
+def export_listings(kinds=tuple(EXPORT_KINDS), full=False, root=None, site_url=None, log=None):
+    """
+    Bring the exported files up to date and return {kind: (written, unchanged)}.
+
+    ``full`` ignores the previous manifest and rewrites every shard.
+    """
+    root = root or settings.EXPORT_ROOT
+    site_url = (site_url or settings.PUBLIC_SITE_URL).rstrip('/')
+    os.makedirs(root, exist_ok=True)
+
+    manifest = load_manifest(root)
+    if manifest.get('site_url') != site_url or manifest.get('shard_size') != SHARD_SIZE:
+        full = True  # URLs or shard boundaries changed: nothing on disk can be reused
+    now = timezone.now().isoformat()
+    summary = {}
+
+    for kind in kinds:
+        previous = {} if full else manifest['kinds'].get(kind, {})
+        current = {}
+        written = unchanged = 0
+        for shard, stats in sorted(shard_stats(kind).items()):
+            fingerprint = stats['fingerprint']
+            entry = previous.get(str(shard))
+            if entry and entry['fingerprint'] == fingerprint:
+                current[str(shard)] = entry
+                unchanged += 1
+                continue
+            count = write_shard(kind, shard, root, site_url)
+            written += 1
+            current[str(shard)] = {'fingerprint': fingerprint, 'rows': count, 'updated_at': now}
+            if log:
+                log(f'  {shard_name(kind, shard, "ndjson")}: {count} rows')
+
+        # Shards that lost all their projection rows
+        for shard in set(manifest['kinds'].get(kind, {})) - set(current):
+            for extension in ('ndjson', 'xml'):
+                _remove(os.path.join(root, shard_name(kind, int(shard), extension)))
+
+        manifest['kinds'][kind] = current
+        summary[kind] = (written, unchanged)
+
+    manifest.update(site_url=site_url, shard_size=SHARD_SIZE, generated_at=now)
+    _replace(os.path.join(root, MANIFEST_NAME), [json.dumps(manifest, indent=2, sort_keys=True)])
+    _replace(os.path.join(root, SITEMAP_INDEX_NAME), sitemap_index(manifest))
+    return summary
+
+
+def sitemap_index(manifest):
+    """Sitemap index lines; sitemap URLs point at the export endpoint"""
+    base = settings.EXPORT_PUBLIC_URL.rstrip('/')
+    yield f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">\n'
+    for kind, shards in sorted(manifest['kinds'].items()):
+        for shard, entry in sorted(shards.items(), key=lambda item: int(item[0])):
+            if not entry['rows']:
+                continue
+            location = escape(f'{base}/{shard_name(kind, int(shard), "xml")}')
+            yield f'<sitemap><loc>{location}</loc><lastmod>{entry["updated_at"]}</lastmod></sitemap>\n'
+    yield '</sitemapindex>\n'
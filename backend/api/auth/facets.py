@@ -0,0 +1,94 @@
+"""
+Facet aggregates for the public job board
+"""
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.db.models.functions import Coalesce
+
+from api.common.cache import namespaced_key
+
+FACET_CACHE_TIMEOUT = 300
+
+# Budget histogram edges, applied to budget_max (or budget_min when no max is set)
+BUDGET_BUCKETS = (
+    (None, 500),
+    (500, 1000),
+    (1000, 5000),
+    (5000, 10000),
+    (10000, None),
+)
+
+# Category and duration are free text; only the most common values are returned
+MAX_FACET_VALUES = 20
+
+
+def _bucket_label(low, high):
+    if low is None:
+        return f'<{high}'
+    if high is None:
+        return f'{low}+'
+    return f'{low}-{high}'
+
+
+def _bucket_filter(low, high):
+    condition = Q()
+    if low is not None:
+        condition &= Q(facet_budget__gte=low)
+    if high is not None:
+        condition &= Q(facet_budget__lt=high)
+    return condition
+
+
+def _top_values(counts):
+    ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0] or ''))
+    return [{'value': value, 'count': count} for value, count in ordered[:MAX_FACET_VALUES]]
+
+
+def compute_job_facets(queryset):
+    """
+    Category counts, budget histogram and duration counts for a Job queryset.
+
+    Runs a single GROUP BY (category, duration) query with one conditional
+    COUNT per budget bucket, then folds the groups together in Python.
+    """
+    bucket_aggregates = {
+        f'budget_{index}': Count('id', filter=_bucket_filter(low, high))
+        for index, (low, high) in enumerate(BUDGET_BUCKETS)
+    }
+    groups = (
+        queryset.order_by()
+        .annotate(facet_budget=Coalesce('budget_max', 'budget_min'))
+        .values('category', 'duration')
+        .annotate(total=Count('id'), **bucket_aggregates)
+    )
+
+    categories, durations = {}, {}
+    budget_counts = [0] * len(BUDGET_BUCKETS)
+    for group in groups:
+        categories[group['category']] = categories.get(group['category'], 0) + group['total']
+        durations[group['duration']] = durations.get(group['duration'], 0) + group['total']
+        for index in range(len(BUDGET_BUCKETS)):
+            budget_counts[index] += group[f'budget_{index}']
+
+    return {
+        'categories': _top_values(categories),
+        'budget': [
+            {'range': _bucket_label(low, high), 'min': low, 'max': high, 'count': count}
+            for (low, high), count in zip(BUDGET_BUCKETS, budget_counts)
+        ],
+        'duration': _top_values(durations),
+    }
+
+
+def job_facets(queryset, signature):
+    """
+    Facets for the given filter signature, cached until a job, client or user
+    change bumps the 'job_pages' namespace.
+    """
+    key = namespaced_key('job_facets', 'job_pages', signature)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_job_facets(queryset)
+        cache.set(key, facets, FACET_CACHE_TIMEOUT)
+    return facets
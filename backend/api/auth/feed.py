@@ -0,0 +1,120 @@
+"""
+"Jobs for you" feeds, materialized by fan-out on approve.
+
+When an admin approves a job, the matching index picks the freelancers it
+fits and one JobFeedEntry per freelancer is written, FEED_FANOUT_BATCH_SIZE
+freelancers per INSERT. Each of those feeds is then trimmed to its newest
+FEED_MAX_ENTRIES rows, so reading a feed is a keyset scan over (freelancer,
+created_at) regardless of how many jobs exist. Entries are removed again when
+the job leaves the open state.
+
+The fan-out runs after the approval commits, on one background thread per
+process, so approving a job costs the admin a single UPDATE.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from .matching import freelancer_index
+from .models import Job, JobFeedEntry
+
+logger = logging.getLogger(__name__)
+
+# Feed length cap per freelancer
+FEED_MAX_ENTRIES = 200
+
+# Upper bound on freelancers a single job is pushed to
+FEED_FANOUT_LIMIT = 2000
+
+# Feeds written and trimmed per statement
+FEED_FANOUT_BATCH_SIZE = 500
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _fan_out_executor():
+    """This process' fan-out thread (threads do not survive a fork, so each worker starts its own)"""
+    global _executor, _executor_pid
+    if _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='feed-fan-out')
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def schedule_fan_out(job_id):
+    """Fan an approved job out in the background once the current transaction commits"""
+    transaction.on_commit(lambda: _fan_out_executor().submit(_fan_out_in_background, job_id))
+
+
+def _fan_out_in_background(job_id):
+    try:
+        job = Job.objects.filter(pk=job_id, status='open').prefetch_related('skill_tags').first()
+        if job is not None:
+            fan_out_job(job)
+    except Exception as e:
+        logger.error(f"Error fanning out job {job_id}: {str(e)}")
+    finally:
+        connection.close()  # this thread's connection; idle until the next approval
+
+
+def fan_out_job(job):
+    """
+    Push an approved job into the feeds of the freelancers it matches: any
+    skill overlap or the same category. Returns the number of feeds reached.
+    """
+    with freelancer_index.lock:
+        freelancer_index.sync()
+        matches = freelancer_index.rank(
+            [skill.pk for skill in job.skill_tags.all()],
+            job.category,
+            job.budget_min,
+            job.budget_max,
+            limit=FEED_FANOUT_LIMIT,
+        )
+
+    entries = [
+        JobFeedEntry(freelancer_id=freelancer_id, job_id=job.pk, score=score)
+        for freelancer_id, score, components in matches
+        if components['skills'] > 0 or components['category'] > 0
+    ]
+    for start in range(0, len(entries), FEED_FANOUT_BATCH_SIZE):
+        batch = entries[start:start + FEED_FANOUT_BATCH_SIZE]
+        JobFeedEntry.objects.bulk_create(batch, ignore_conflicts=True)
+        trim_feeds([entry.freelancer_id for entry in batch])
+
+    # Closed while this ran: its withdrawal may have preceded these inserts
+    if not Job.objects.filter(pk=job.pk, status='open').exists():
+        withdraw_job(job.pk)
+    return len(entries)
+
+
+def trim_feeds(freelancer_ids):
+    """Delete everything past the newest FEED_MAX_ENTRIES entries of each feed"""
+    if not freelancer_ids:
+        return 0
+    ranked = JobFeedEntry.objects.filter(freelancer_id__in=freelancer_ids).annotate(
+        position=Window(
+            RowNumber(),
+            partition_by=[F('freelancer_id')],
+            order_by=[F('created_at').desc(), F('id').desc()],
+        )
+    )
+    overflow = list(ranked.filter(position__gt=FEED_MAX_ENTRIES).values_list('id', flat=True))
+    if overflow:
+        JobFeedEntry.objects.filter(pk__in=overflow).delete()
+    return len(overflow)
+
+
+def withdraw_job(job_id):
+    """Remove a job that is no longer open from every feed"""
+    return JobFeedEntry.objects.filter(job_id=job_id).delete()[0]
@@ -0,0 +1,292 @@
+"""
+Bulk import of users with their freelancer or client profiles.
+
+Registering users one by one costs two uniqueness queries, a password hash
+and several INSERTs (plus every post_save receiver) per row. import_users()
+does the same work for a whole CSV or NDJSON file in bulk:
+
+* every row is validated with UserImportSerializer, which runs no queries;
+* usernames and emails are checked for duplicates within the file, then
+  against the database with ``username IN (...)`` / ``email IN (...)``
+  queries, IMPORT_LOOKUP_BATCH_SIZE values at a time;
+* passwords are hashed on a process pool (USER_IMPORT_HASH_WORKERS) by
+  ``manage.py import_users``, as hashing dominates the cost of an import.
+  The admin upload hashes inline and is limited to USER_IMPORT_MAX_ROWS rows
+  so it finishes within the request timeout. Rows without a password get an
+  unusable one and have to go through password reset;
+* users and their profiles are written with bulk_create, one transaction
+  per ``batch_size`` rows, so a failure only loses its own batch. A batch
+  that hits a concurrent registration is re-checked and retried once
+  without the conflicting rows.
+
+bulk_create skips post_save, so the skill tags, listing projections, match
+index and cached pages the signals would have refreshed are refreshed here
+once each batch commits. The result is a report with one entry per rejected
+row: {'row': line number, 'username': ..., 'errors': {field: [messages]}}.
+"""
+
+import csv
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+
+from api.common.cache import bump_namespace
+
+from .listings import refresh_freelancer_listings
+from .matching import record_freelancer_changes
+from .models import Client, Freelancer, User
+from .serializers import UserImportSerializer
+from .skills import bulk_sync_skill_tags
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+IMPORT_BATCH_SIZE = 500
+IMPORT_LOOKUP_BATCH_SIZE = 1000
+
+USER_FIELDS = ('username', 'email', 'first_name', 'last_name', 'role', 'phone', 'bio')
+FREELANCER_FIELDS = ('title', 'category', 'rate', 'skills', 'location')
+CLIENT_FIELDS = ('company_name',)
+
+
+class ImportFormatError(ValueError):
+    """Raised when the input cannot be read as the requested format"""
+
+
+def detect_format(name, sample=''):
+    """'csv' or 'ndjson', from the file name or else the first character of the content"""
+    name = (name or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.ndjson', '.jsonl', '.json')):
+        return 'ndjson'
+    return 'ndjson' if sample.lstrip().startswith('{') else 'csv'
+
+
+def read_rows(lines, fmt):
+    """
+    Yield (line number, row) for each record; ``row`` is a dict of strings or
+    the error message for a line that is not a valid record.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        if not reader.fieldnames:
+            return
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        try:
+            for row in reader:
+                yield reader.line_num, {key: value.strip() for key, value in row.items() if key and value is not None}
+        except csv.Error as e:
+            raise ImportFormatError(f"Line {reader.line_num}: {str(e)}")
+    elif fmt == 'ndjson':
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, f"Invalid JSON: {str(e)}"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, "Each line must be a JSON object."
+                continue
+            yield line_number, {key: (value.strip() if isinstance(value, str) else value) for key, value in row.items()}
+    else:
+        raise ImportFormatError(f"Unknown format '{fmt}'. Choose one of: {', '.join(IMPORT_FORMATS)}.")
+
+
+def existing_values(field, values):
+    """The subset of ``values`` already taken in auth_user.<field>"""
+    values = list(values)
+    taken = set()
+    for start in range(0, len(values), IMPORT_LOOKUP_BATCH_SIZE):
+        batch = values[start:start + IMPORT_LOOKUP_BATCH_SIZE]
+        taken.update(User.objects.filter(**{f'{field}__in': batch}).values_list(field, flat=True))
+    return taken
+
+
+class _Hasher:
+    """make_password over a process pool, or inline for a single worker"""
+
+    def __init__(self, workers):
+        self.workers = max(workers, 1)
+        self.executor = None
+
+    def __enter__(self):
+        if self.workers > 1:
+            # spawn, not fork: the importing process may be a threaded web worker. The
+            # workers only import django (not this module, which needs the app registry)
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=django.setup,
+            )
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def hash_all(self, passwords):
+        hashed = [None] * len(passwords)
+        todo = [(i, password) for i, password in enumerate(passwords) if password]
+        if self.executor is None:
+            results = [make_password(password) for _, password in todo]
+        else:
+            chunksize = max(len(todo) // (self.workers * 4), 1)
+            results = self.executor.map(make_password, [password for _, password in todo], chunksize=chunksize)
+        for (i, _), result in zip(todo, results):
+            hashed[i] = result
+        # No password: unusable, so the account has to be claimed through a reset
+        return [value if value is not None else make_password(None) for value in hashed]
+
+
+class ImportReport:
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.errors = []
+
+    def reject(self, line_number, username, errors):
+        self.errors.append({'row': line_number, 'username': username, 'errors': errors})
+
+    def as_dict(self, dry_run=False):
+        return {
+            'total': self.total,
+            'created': self.created,
+            'failed': len(self.errors),
+            'dry_run': dry_run,
+            'errors': sorted(self.errors, key=lambda error: error['row']),
+        }
+
+
+def _validate(rows, report):
+    """Serializer validation plus duplicate detection within the file; returns [(line number, data)]"""
+    valid = []
+    seen_usernames = {}
+    seen_emails = {}
+    for line_number, row in rows:
+        report.total += 1
+        if isinstance(row, str):
+            report.reject(line_number, None, {'non_field_errors': [row]})
+            continue
+
+        serializer = UserImportSerializer(data=row)
+        if not serializer.is_valid():
+            report.reject(line_number, row.get('username'), serializer.errors)
+            continue
+
+        data = serializer.validated_data
+        errors = {}
+        if data['username'] in seen_usernames:
+            errors['username'] = [f"Duplicate of row {seen_usernames[data['username']]}."]
+        if data['email'] in seen_emails:
+            errors['email'] = [f"Duplicate of row {seen_emails[data['email']]}."]
+        if errors:
+            report.reject(line_number, data['username'], errors)
+            continue
+
+        seen_usernames[data['username']] = line_number
+        seen_emails[data['email']] = line_number
+        valid.append((line_number, data))
+    return valid
+
+
+def _drop_taken(rows, report):
+    """Reject rows whose username or email is already in the database"""
+    taken_usernames = existing_values('username', [data['username'] for _, data in rows])
+    taken_emails = existing_values('email', [data['email'] for _, data in rows])
+    remaining = []
+    for line_number, data in rows:
+        errors = {}
+        if data['username'] in taken_usernames:
+            errors['username'] = ["A user with this username already exists."]
+        if data['email'] in taken_emails:
+            errors['email'] = ["A user with this email already exists."]
+        if errors:
+            report.reject(line_number, data['username'], errors)
+        else:
+            remaining.append((line_number, data))
+    return remaining
+
+
+def _profile_values(data, fields):
+    return {field: data[field] for field in fields if data.get(field) not in (None, '')}
+
+
+def _insert_batch(rows, passwords):
+    """Create the users and their profiles; returns the new freelancer ids"""
+    users = User.objects.bulk_create([
+        User(password=password, **_profile_values(data, USER_FIELDS))
+        for (_, data), password in zip(rows, passwords)
+    ])
+
+    freelancers = []
+    clients = []
+    for (_, data), user in zip(rows, users):
+        if data['role'] == 'freelancer':
+            freelancers.append(Freelancer(user_id=user.pk, **_profile_values(data, FREELANCER_FIELDS)))
+        else:
+            clients.append(Client(user_id=user.pk, **_profile_values(data, CLIENT_FIELDS)))
+    freelancers = Freelancer.objects.bulk_create(freelancers)
+    Client.objects.bulk_create(clients)
+
+    bulk_sync_skill_tags(Freelancer, [(freelancer.pk, freelancer.skills) for freelancer in freelancers if freelancer.skills])
+    return [freelancer.pk for freelancer in freelancers]
+
+
+def _freelancers_created(freelancer_ids):
+    """Refresh what post_save would have refreshed for the new freelancers"""
+    def refresh():
+        refresh_freelancer_listings(freelancer_ids)
+        bump_namespace('freelancers', 'freelancer_pages')
+
+    if freelancer_ids:
+        record_freelancer_changes(freelancer_ids)
+        transaction.on_commit(refresh)
+
+
+def _write_batch(rows, passwords, report):
+    """Insert one batch in its own transaction, retrying once without rows taken meanwhile"""
+    for attempt in range(2):
+        try:
+            with transaction.atomic():
+                _freelancers_created(_insert_batch(rows, passwords))
+            report.created += len(rows)
+            return
+        except IntegrityError as e:
+            if attempt:
+                for line_number, data in rows:
+                    report.reject(line_number, data['username'], {'non_field_errors': [f"Could not be saved: {str(e)}"]})
+                return
+            # A concurrent registration took a username or email after the up-front check
+            hashed = {line_number: password for (line_number, _), password in zip(rows, passwords)}
+            rows = _drop_taken(rows, report)
+            passwords = [hashed[line_number] for line_number, _ in rows]
+            if not rows:
+                return
+
+
+def import_users(rows, batch_size=IMPORT_BATCH_SIZE, workers=None, dry_run=False, log=None):
+    """
+    Validate and create users from ``rows`` (as yielded by read_rows()).
+    With ``dry_run`` nothing is hashed or written and the report lists the
+    rows that would be rejected. Returns the report as a dict.
+    """
+    report = ImportReport()
+    pending = _drop_taken(_validate(rows, report), report)
+    if dry_run or not pending:
+        return report.as_dict(dry_run)
+
+    workers = settings.USER_IMPORT_HASH_WORKERS if workers is None else workers
+    with _Hasher(workers) as hasher:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            passwords = hasher.hash_all([data.get('password') for _, data in batch])
+            _write_batch(batch, passwords, report)
+            if log:
+                log(f'{min(start + batch_size, len(pending))}/{len(pending)} rows processed, {report.created} created')
+    return report.as_dict(dry_run)
@@ -0,0 +1,171 @@
+"""
+Listing projections: flat, precomputed card rows for the public job board and
+freelancer directory.
+
+The listing views still filter and paginate on Job/Freelancer (where the
+search and partial indexes live), but only read primary keys there; the card
+payload is then fetched from job_listings / freelancer_listings by primary key,
+with no joins and no per-row skills parsing. Rows are refreshed from post_save
+signals and rebuilt on demand when missing (e.g. after bulk_create).
+"""
+
+from functools import wraps
+from itertools import islice
+
+from django.db.models import QuerySet
+from django.db.models.functions import Left
+
+from .models import Freelancer, FreelancerListing, Job, JobListing
+from .skills import skill_names
+
+JOB_LISTING_FIELDS = (
+    'title', 'description', 'category', 'budget_min', 'budget_max', 'duration', 'status',
+    'skills_list', 'created_at', 'proposals_count', 'client_name', 'client_username',
+)
+
+# Upsert-only columns (set by auto_now on every refresh)
+LISTING_BOOKKEEPING_FIELDS = ('refreshed_at',)
+
+FREELANCER_LISTING_FIELDS = (
+    'name', 'username', 'email', 'title', 'category', 'rate', 'skills_list', 'location',
+    'profile_picture', 'bio', 'created_at',
+)
+
+
+# Compact "card" presets for ?fields=card; the long text field is cut to an excerpt
+CARD_TEXT_LENGTH = 200
+
+JOB_CARD_FIELDS = (
+    'id', 'title', 'description', 'category', 'budget_min', 'budget_max', 'duration',
+    'skills_list', 'created_at', 'proposals_count', 'client_name',
+)
+
+FREELANCER_CARD_FIELDS = (
+    'id', 'name', 'username', 'title', 'category', 'rate', 'skills_list', 'location',
+    'profile_picture', 'bio',
+)
+
+
+# Ids upserted per statement, so a client with many jobs is refreshed in bounded memory
+REFRESH_BATCH_SIZE = 2000
+
+
+def _in_batches(refresh):
+    """
+    Run ``refresh`` over REFRESH_BATCH_SIZE ids at a time. A queryset of ids
+    is streamed rather than materialized, so neither the ids nor the rows
+    of more than one batch are held at once.
+    """
+    @wraps(refresh)
+    def wrapper(ids):
+        if isinstance(ids, QuerySet):
+            ids = ids.iterator(chunk_size=REFRESH_BATCH_SIZE)
+        ids = iter(ids)
+        total = 0
+        while batch := list(islice(ids, REFRESH_BATCH_SIZE)):
+            total += refresh(batch)
+        return total
+    return wrapper
+
+
+@_in_batches
+def refresh_job_listings(job_ids):
+    """Upsert the listing rows for the given job ids"""
+    jobs = Job.objects.filter(pk__in=job_ids).select_related('client__user').prefetch_related('skill_tags')
+    rows = [
+        JobListing(
+            job_id=job.pk,
+            title=job.title,
+            description=job.description,
+            category=job.category,
+            budget_min=job.budget_min,
+            budget_max=job.budget_max,
+            duration=job.duration,
+            status=job.status,
+            skills_list=skill_names(job),
+            created_at=job.created_at,
+            proposals_count=job.proposals_count,
+            client_name=job.client.user.get_full_name(),
+            client_username=job.client.user.username,
+        )
+        for job in jobs
+    ]
+    JobListing.objects.bulk_create(
+        rows, update_conflicts=True, unique_fields=['job'], update_fields=JOB_LISTING_FIELDS + LISTING_BOOKKEEPING_FIELDS,
+    )
+    return len(rows)
+
+
+@_in_batches
+def refresh_freelancer_listings(freelancer_ids):
+    """Upsert the directory rows for the given freelancer ids"""
+    freelancers = Freelancer.objects.filter(pk__in=freelancer_ids).select_related('user').prefetch_related('skill_tags')
+    rows = [
+        FreelancerListing(
+            freelancer_id=freelancer.pk,
+            name=freelancer.user.get_full_name(),
+            username=freelancer.user.username,
+            email=freelancer.user.email,
+            title=freelancer.title,
+            category=freelancer.category,
+            rate=freelancer.rate,
+            skills_list=skill_names(freelancer),
+            location=freelancer.location,
+            profile_picture=freelancer.user.profile_picture,
+            bio=freelancer.user.bio,
+            created_at=freelancer.created_at,
+        )
+        for freelancer in freelancers
+    ]
+    FreelancerListing.objects.bulk_create(
+        rows, update_conflicts=True, unique_fields=['freelancer'], update_fields=FREELANCER_LISTING_FIELDS + LISTING_BOOKKEEPING_FIELDS,
+    )
+    return len(rows)
+
+
+def _listing_rows(model, refresh, ids, fields=None, excerpt=None):
+    """
+    Projection rows for ``ids`` in the given order. ``fields`` limits the
+    columns read; ``excerpt`` names a text column that is read as a
+    CARD_TEXT_LENGTH prefix (``<field>_excerpt``) instead of in full.
+    """
+    queryset = model.objects.all()
+    if fields is not None:
+        columns = [name for name in fields if name != 'id' and name != excerpt]
+        queryset = queryset.only(*(columns or ['pk']))
+    if excerpt is not None:
+        # One extra character tells listing_text whether the value was cut
+        queryset = queryset.defer(excerpt).annotate(**{f'{excerpt}_excerpt': Left(excerpt, CARD_TEXT_LENGTH + 1)})
+
+    rows = queryset.in_bulk(ids)
+    missing = [pk for pk in ids if pk not in rows]
+    if missing:
+        refresh(missing)
+        rows.update(queryset.in_bulk(missing))
+    return [rows[pk] for pk in ids if pk in rows]
+
+
+def listing_text(row, field):
+    """Full text, or the truncated excerpt when the row was read for a card"""
+    excerpt = getattr(row, f'{field}_excerpt', None)
+    if excerpt is None:
+        return getattr(row, field)
+    if len(excerpt) > CARD_TEXT_LENGTH:
+        return excerpt[:CARD_TEXT_LENGTH].rstrip() + '…'
+    return excerpt
+
+
+def job_listing_rows(jobs, fields=None, excerpt=False):
+    """Listing rows for a page of jobs, in page order"""
+    return _listing_rows(
+        JobListing, refresh_job_listings, [job.pk for job in jobs],
+        fields=fields, excerpt='description' if excerpt else None,
+    )
+
+
+def freelancer_listing_rows(freelancers, fields=None, excerpt=False):
+    """Directory rows for a page of freelancers, in page order"""
+    return _listing_rows(
+        FreelancerListing, refresh_freelancer_listings, [freelancer.pk for freelancer in freelancers],
+        fields=fields, excerpt='bio' if excerpt else None,
+    )
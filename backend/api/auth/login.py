@@ -0,0 +1,218 @@
+"""
+Password verification on a bounded hashing pool, for the async login views.
+
+Under ASGI, Django runs every sync view on one shared thread per worker, so
+PBKDF2 work in a sync view (hundreds of milliseconds per attempt) would stall
+every other sync request during a burst of logins. The login views
+(AsyncLoginView / AsyncAdminLoginView) are async, keep the event loop free
+and verify passwords here instead:
+
+* HashingPool runs hashing on LOGIN_HASH_WORKERS dedicated threads. The
+  hashers Django ships (PBKDF2 via hashlib, argon2, bcrypt) release the GIL
+  while hashing, so threads give real parallelism without a process pool.
+* At most LOGIN_HASH_QUEUE_LIMIT attempts wait behind the running ones;
+  anything beyond that fails fast with PoolSaturated, which the views turn
+  into 503 + Retry-After instead of letting latency grow without bound.
+* Every hash records how long it queued and how long it hashed, in shared
+  cache counters with latency buckets (login_metrics()), so a slow login can
+  be attributed to saturation or to the hasher's cost. The counters are
+  written once the hash has finished, so the hashing threads only hash.
+
+authenticate_credentials() mirrors ModelBackend: a dummy hash for unknown
+users, hash upgrades on successful logins (skipped while the pool is
+saturated; the next login retries), inactive users rejected and
+user_login_failed sent on failure.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from django.contrib.auth.signals import user_login_failed
+from django.core.cache import cache
+
+from .models import User
+
+LOGIN_METRICS_KEY = 'login_metrics:{}'
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LOGIN_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+LOGIN_TIMINGS = ('queue_wait', 'hash')
+
+
+class PoolSaturated(Exception):
+    """Raised when the hashing pool's queue is full"""
+
+
+def _incr(key, delta=1):
+    key = LOGIN_METRICS_KEY.format(key)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.set(key, delta, timeout=None)
+
+
+def _bucket(milliseconds):
+    for bound in LOGIN_LATENCY_BUCKETS_MS:
+        if milliseconds <= bound:
+            return str(bound)
+    return 'inf'
+
+
+def record_login_timing(name, seconds):
+    """Add one observation to the named latency histogram"""
+    milliseconds = seconds * 1000
+    _incr(f'{name}:count')
+    _incr(f'{name}:total_us', int(milliseconds * 1000))
+    _incr(f'{name}:le_{_bucket(milliseconds)}')
+
+
+def record_login_timings(queue_wait, hash_time):
+    record_login_timing('queue_wait', queue_wait)
+    record_login_timing('hash', hash_time)
+
+
+def _quantile(buckets, count, share):
+    """Upper bound of the bucket holding the given share of observations"""
+    seen = 0
+    for bound, observed in buckets.items():
+        seen += observed
+        if seen >= share * count:
+            return bound
+    return None
+
+
+def login_metrics():
+    """Queue-wait and hash-time histograms plus the shed count, across all workers"""
+    bounds = [str(bound) for bound in LOGIN_LATENCY_BUCKETS_MS] + ['inf']
+    names = ['shed'] + [
+        f'{name}:{suffix}' for name in LOGIN_TIMINGS
+        for suffix in ['count', 'total_us'] + [f'le_{bound}' for bound in bounds]
+    ]
+    counters = cache.get_many([LOGIN_METRICS_KEY.format(name) for name in names])
+    value = lambda name: counters.get(LOGIN_METRICS_KEY.format(name), 0)
+
+    metrics = {'shed': value('shed')}
+    for name in LOGIN_TIMINGS:
+        count = value(f'{name}:count')
+        buckets = {bound: value(f'{name}:le_{bound}') for bound in bounds}
+        metrics[name] = {
+            'count': count,
+            'avg_ms': round(value(f'{name}:total_us') / count / 1000, 2) if count else None,
+            'p50_ms_le': _quantile(buckets, count, 0.5) if count else None,
+            'p95_ms_le': _quantile(buckets, count, 0.95) if count else None,
+            'p99_ms_le': _quantile(buckets, count, 0.99) if count else None,
+            'buckets_ms': buckets,
+        }
+    return metrics
+
+
+def reset_login_metrics():
+    bounds = [str(bound) for bound in LOGIN_LATENCY_BUCKETS_MS] + ['inf']
+    cache.delete_many([LOGIN_METRICS_KEY.format('shed')] + [
+        LOGIN_METRICS_KEY.format(f'{name}:{suffix}') for name in LOGIN_TIMINGS
+        for suffix in ['count', 'total_us'] + [f'le_{bound}' for bound in bounds]
+    ])
+
+
+class HashingPool:
+    """Fixed set of hashing threads with a bounded number of waiting attempts"""
+
+    def __init__(self, workers, queue_limit):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.depth = 0  # running + waiting
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='login-hash')
+
+    @staticmethod
+    def _timed(fn, args):
+        """Runs on a hashing thread: the result, and when the work started and finished"""
+        started = time.perf_counter()
+        return fn(*args), started, time.perf_counter()
+
+    async def run(self, fn, *args):
+        with self.lock:
+            if self.depth >= self.workers + self.queue_limit:
+                saturated = True
+            else:
+                saturated = False
+                self.depth += 1
+        if saturated:
+            await sync_to_async(_incr, thread_sensitive=False)('shed')
+            raise PoolSaturated()
+        enqueued = time.perf_counter()
+        try:
+            result, started, finished = await asyncio.wrap_future(self.executor.submit(self._timed, fn, args))
+        finally:
+            with self.lock:
+                self.depth -= 1
+        # The counters are cache round trips, kept off both the hashing threads and the event loop
+        await sync_to_async(record_login_timings, thread_sensitive=False)(started - enqueued, finished - started)
+        return result
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def hashing_pool():
+    """This process' pool (threads do not survive a fork, so each worker builds its own)"""
+    global _pool, _pool_pid
+    if _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool_pid != os.getpid():
+                _pool = HashingPool(settings.LOGIN_HASH_WORKERS, settings.LOGIN_HASH_QUEUE_LIMIT)
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def _find_user(username):
+    """The user a login identifier names (email or username), as the sync serializer resolves it"""
+    try:
+        if '@' in username:
+            return User.objects.get(email=username.lower())
+        return User._default_manager.get_by_natural_key(username)
+    except User.DoesNotExist:
+        return None
+
+
+def _dummy_hash(password):
+    # Same cost as a real check, so response time does not reveal whether the user exists
+    User().set_password(password)
+
+
+async def authenticate_credentials(username, password, request=None):
+    """The active user matching the credentials, or None; raises PoolSaturated when shedding"""
+    user = await sync_to_async(_find_user)(username)
+    pool = hashing_pool()
+
+    if user is None:
+        await pool.run(_dummy_hash, password)
+        verified = False
+    else:
+        outdated = []
+        verified = await pool.run(check_password, password, user.password, outdated.append)
+        if verified and outdated:
+            # The hasher or its work factor changed since this password was set. The
+            # upgrade is optional work: under saturation the next login does it instead
+            try:
+                await pool.run(user.set_password, password)
+            except PoolSaturated:
+                pass
+            else:
+                await sync_to_async(user.save)(update_fields=['password'])
+
+    if verified and user.is_active:
+        return user
+
+    await sync_to_async(user_login_failed.send)(
+        sender=__name__, credentials={'username': username, 'password': '********************'}, request=request
+    )
+    return None
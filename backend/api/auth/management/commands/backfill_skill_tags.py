@@ -0,0 +1,57 @@
+"""
+Convert legacy free-text skills into normalized skill tags.
+
+The command is resumable: it only selects rows that have skills text but no
+tags yet, walking them in primary-key order, so an interrupted run can simply
+be started again (or continued explicitly with --after-id).
+
+Usage:
+    python manage.py backfill_skill_tags --model all --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.auth.models import Freelancer, Job
+from api.auth.skills import bulk_sync_skill_tags
+
+MODELS = {
+    'jobs': Job,
+    'freelancers': Freelancer,
+}
+
+
+class Command(BaseCommand):
+    help = 'Backfill skill tags for jobs and freelancers from their skills text, in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', choices=['all', *MODELS], default='all')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--after-id', type=int, default=0, help='Resume after this primary key')
+
+    def handle(self, *args, **options):
+        targets = MODELS.values() if options['model'] == 'all' else [MODELS[options['model']]]
+        for model in targets:
+            self.backfill(model, options['batch_size'], options['after_id'])
+
+    def backfill(self, model, batch_size, after_id):
+        label = model._meta.db_table
+        pending = model.objects.filter(skill_tags__isnull=True).exclude(skills__isnull=True).exclude(skills='')
+
+        last_id = after_id
+        total = 0
+        while True:
+            batch = list(
+                pending.filter(pk__gt=last_id).order_by('pk').values_list('pk', 'skills')[:batch_size]
+            )
+            if not batch:
+                break
+
+            with transaction.atomic():
+                bulk_sync_skill_tags(model, batch)
+
+            last_id = batch[-1][0]
+            total += len(batch)
+            self.stdout.write(f'{label}: {total} rows tagged (last id {last_id})')
+
+        self.stdout.write(self.style.SUCCESS(f'{label}: backfill complete, {total} rows processed'))
@@ -0,0 +1,190 @@
+"""
+Benchmark listing search paths against a synthetic dataset.
+
+Usage:
+    python manage.py benchmark_search --target jobs --rows 1000000 --seed
+    python manage.py benchmark_search --target freelancers --rows 500000 --seed
+"""
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from api.auth.models import Client, Freelancer, Job, User
+from api.auth.search import search_freelancers, search_jobs, update_job_search_vectors
+
+WORDS = [
+    'react', 'django', 'python', 'design', 'logo', 'mobile', 'android', 'ios', 'seo',
+    'wordpress', 'shopify', 'data', 'analytics', 'machine', 'learning', 'writing',
+    'copywriting', 'video', 'editing', 'marketing', 'backend', 'frontend', 'api',
+    'postgres', 'devops', 'aws', 'figma', 'illustration', 'translation', 'support',
+]
+# Long tail of filler tokens so common terms have realistic selectivity
+FILLER = [f'term{i:04d}' for i in range(5000)]
+CATEGORIES = ['Web Development', 'Design', 'Writing', 'Marketing', 'Data Science', 'Mobile Apps']
+DEFAULT_TERMS = ['react', 'python backend', 'logo design', 'seo', 'machine learning', 'video editing']
+
+ROLES = ['Python Developer', 'React Developer', 'Graphic Designer', 'Data Scientist', 'Copywriter',
+         'SEO Specialist', 'Video Editor', 'Mobile Developer', 'DevOps Engineer', 'Illustrator']
+LOCATIONS = ['Bengaluru', 'Mumbai', 'New Delhi', 'Hyderabad', 'Chennai', 'Pune', 'Kolkata', 'London',
+             'Berlin', 'New York', 'San Francisco', 'Toronto', 'Singapore', 'Remote']
+# Misspellings and alternate names the trigram path should still match
+DEFAULT_FREELANCER_TERMS = ['bengalru', 'pyhton developer', 'graphic desginer', 'mumbia', 'data scientst', 'berlin']
+
+
+class Command(BaseCommand):
+    help = 'Compare p50/p95 latency of the legacy icontains filters with the indexed search path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=['jobs', 'freelancers'], default='jobs')
+        parser.add_argument('--rows', type=int, default=1_000_000, help='Dataset size to seed up to')
+        parser.add_argument('--seed', action='store_true', help='Create synthetic rows until --rows exist')
+        parser.add_argument('--iterations', type=int, default=50, help='Runs per search term and path')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--terms', nargs='*', help='Search terms (defaults depend on --target)')
+
+    def handle(self, *args, **options):
+        if options['target'] == 'freelancers':
+            if options['seed']:
+                self.seed_freelancers(options['rows'], options['batch_size'])
+            paths = {
+                'icontains': self.legacy_freelancer_query,
+                'trigram': self.trigram_freelancer_query,
+            }
+            terms = options['terms'] or DEFAULT_FREELANCER_TERMS
+        else:
+            if options['seed']:
+                self.seed_jobs(options['rows'], options['batch_size'])
+            paths = {
+                'icontains': self.legacy_job_query,
+                'fulltext': self.fulltext_job_query,
+            }
+            terms = options['terms'] or DEFAULT_TERMS
+
+        self.report(paths, terms, options['iterations'])
+
+    # ------------------------------------------------------------------ jobs
+
+    def legacy_job_query(self, term):
+        jobs = Job.objects.filter(status='open').order_by('-created_at')
+        return jobs.filter(Q(category__icontains=term) | Q(skills__icontains=term))
+
+    def fulltext_job_query(self, term):
+        return search_jobs(Job.objects.filter(status='open'), term)
+
+    def seed_jobs(self, rows, batch_size):
+        existing = Job.objects.count()
+        if existing >= rows:
+            self.stdout.write(f'{existing} jobs already present, skipping seed')
+            return
+
+        client = self.get_bench_client()
+        rng = random.Random(42)
+        remaining = rows - existing
+        self.stdout.write(f'Seeding {remaining} jobs...')
+
+        while remaining > 0:
+            count = min(batch_size, remaining)
+            batch = []
+            for _ in range(count):
+                batch.append(Job(
+                    client=client,
+                    title=f'{rng.choice(WORDS)} {rng.choice(FILLER)} {rng.choice(FILLER)}'.title(),
+                    description=' '.join(rng.choices(FILLER, k=55) + rng.choices(WORDS, k=2)),
+                    requirements=' '.join(rng.choices(FILLER, k=15)),
+                    skills=', '.join(rng.sample(WORDS, 2) + rng.sample(FILLER, 2)),
+                    category=rng.choice(CATEGORIES),
+                    budget_min=rng.randint(50, 500),
+                    budget_max=rng.randint(500, 5000),
+                    status='open',
+                ))
+            with transaction.atomic():
+                created = Job.objects.bulk_create(batch)
+                # bulk_create skips post_save, so populate the vectors explicitly
+                update_job_search_vectors([job.pk for job in created])
+            remaining -= count
+            self.stdout.write(f'  {rows - remaining} / {rows}')
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Job._meta.db_table}')
+
+    def get_bench_client(self):
+        user, _ = User.objects.get_or_create(
+            username='bench_client',
+            defaults={'email': 'bench_client@example.com', 'role': 'client'},
+        )
+        client, _ = Client.objects.get_or_create(user=user, defaults={'company_name': 'Benchmark Co'})
+        return client
+
+    # ----------------------------------------------------------- freelancers
+
+    def legacy_freelancer_query(self, term):
+        freelancers = Freelancer.objects.order_by('-created_at')
+        return freelancers.filter(
+            Q(title__icontains=term) | Q(location__icontains=term) | Q(category__icontains=term)
+        )
+
+    def trigram_freelancer_query(self, term):
+        return search_freelancers(Freelancer.objects.all(), term)
+
+    def seed_freelancers(self, rows, batch_size):
+        existing = Freelancer.objects.count()
+        if existing >= rows:
+            self.stdout.write(f'{existing} freelancers already present, skipping seed')
+            return
+
+        rng = random.Random(42)
+        start = User.objects.filter(username__startswith='bench_fl_').count()
+        remaining = rows - existing
+        self.stdout.write(f'Seeding {remaining} freelancers...')
+
+        while remaining > 0:
+            count = min(batch_size, remaining)
+            numbers = range(start, start + count)
+            with transaction.atomic():
+                users = User.objects.bulk_create([
+                    User(
+                        username=f'bench_fl_{n}',
+                        email=f'bench_fl_{n}@example.com',
+                        role='freelancer',
+                        password='!',  # unusable password
+                    )
+                    for n in numbers
+                ])
+                Freelancer.objects.bulk_create([
+                    Freelancer(
+                        user=user,
+                        title=f'{rng.choice(ROLES)} {rng.choice(FILLER)}',
+                        category=rng.choice(CATEGORIES),
+                        location=rng.choice(LOCATIONS),
+                        skills=', '.join(rng.sample(WORDS, 3)),
+                        rate=rng.randint(10, 150),
+                    )
+                    for user in users
+                ])
+            start += count
+            remaining -= count
+            self.stdout.write(f'  {rows - remaining} / {rows}')
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Freelancer._meta.db_table}')
+
+    # --------------------------------------------------------------- shared
+
+    def report(self, paths, terms, iterations):
+        self.stdout.write(f"{'path':<12} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+        for name, build_query in paths.items():
+            timings = []
+            for term in terms:
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    list(build_query(term)[:20])
+                    timings.append((time.perf_counter() - started) * 1000)
+            quantiles = statistics.quantiles(timings, n=100)
+            self.stdout.write(
+                f'{name:<12} {quantiles[49]:>10.2f} {quantiles[94]:>10.2f} {max(timings):>10.2f}'
+            )
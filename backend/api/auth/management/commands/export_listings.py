@@ -0,0 +1,31 @@
+"""
+Write the public NDJSON feeds and sitemaps of open jobs and active freelancers
+to a directory, e.g. to publish them from a CDN or static bucket. The export
+endpoint streams the same files from the database and does not need them.
+
+Only shards whose rows changed since the previous run are rewritten, so the
+command is cheap to schedule frequently (e.g. every 15 minutes from cron).
+
+Usage:
+    python manage.py export_listings
+    python manage.py export_listings --kind jobs --full
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.auth.exports import EXPORT_KINDS, export_listings
+
+
+class Command(BaseCommand):
+    help = 'Export open jobs and active freelancers as sharded NDJSON feeds and sitemaps'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=['all', *EXPORT_KINDS], default='all')
+        parser.add_argument('--full', action='store_true', help='Rewrite every shard, ignoring the manifest')
+        parser.add_argument('--root', help='Output directory (defaults to settings.EXPORT_ROOT)')
+
+    def handle(self, *args, **options):
+        kinds = tuple(EXPORT_KINDS) if options['kind'] == 'all' else (options['kind'],)
+        summary = export_listings(kinds=kinds, full=options['full'], root=options['root'], log=self.stdout.write)
+        for kind, (written, unchanged) in summary.items():
+            self.stdout.write(self.style.SUCCESS(f'{kind}: {written} shards written, {unchanged} unchanged'))
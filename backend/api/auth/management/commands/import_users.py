@@ -0,0 +1,68 @@
+"""
+Create users and their freelancer/client profiles from a CSV or NDJSON file.
+
+Columns (CSV header or NDJSON keys): username, email, password, first_name,
+last_name, role (freelancer or client), phone, bio; company_name for clients;
+title, category, rate, skills, location for freelancers. Rows without a
+password get an unusable one. Rejected rows are listed with their line
+number and errors; the other rows are still imported.
+
+Usage:
+    python manage.py import_users users.csv
+    python manage.py import_users users.ndjson --dry-run --report errors.json
+    python manage.py import_users - --format ndjson --workers 8 < users.ndjson
+"""
+
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.auth.imports import IMPORT_BATCH_SIZE, IMPORT_FORMATS, ImportFormatError, detect_format, import_users, read_rows
+
+
+class Command(BaseCommand):
+    help = 'Bulk-create users with their freelancer or client profiles from a CSV or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to import, or '-' for standard input")
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help='Defaults to the file extension')
+        parser.add_argument('--dry-run', action='store_true', help='Validate only; nothing is written')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help='Rows per transaction')
+        parser.add_argument('--workers', type=int, help='Password hashing processes (defaults to USER_IMPORT_HASH_WORKERS)')
+        parser.add_argument('--report', help='Write the full JSON report to this file')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        try:
+            stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8-sig')
+        except OSError as e:
+            raise CommandError(f'Cannot open {path}: {e}')
+
+        with stream:
+            fmt = options['format'] or detect_format(path if path != '-' else '')
+            try:
+                report = import_users(
+                    read_rows(stream, fmt),
+                    batch_size=options['batch_size'],
+                    workers=options['workers'],
+                    dry_run=options['dry_run'],
+                    log=self.stdout.write,
+                )
+            except ImportFormatError as e:
+                raise CommandError(str(e))
+
+        for error in report['errors'][:20]:
+            self.stderr.write(f"Row {error['row']} ({error['username'] or '-'}): {json.dumps(error['errors'])}")
+        if report['failed'] > 20:
+            self.stderr.write(f"... {report['failed'] - 20} more rejected rows")
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+
+        verb = 'would be created' if options['dry_run'] else 'created'
+        self.stdout.write(self.style.SUCCESS(
+            f"{report['total']} rows read: {report['total'] - report['failed'] if options['dry_run'] else report['created']} {verb}, "
+            f"{report['failed']} rejected"
+        ))
@@ -0,0 +1,26 @@
+"""
+Delete expired refresh tokens from the SimpleJWT blacklist tables.
+
+Every refresh adds an outstanding token and blacklists the one it replaced;
+rows are useless once the token has expired. Scheduled daily (see the cron
+job in render.yaml); deletes run in short batches so refreshes are never
+blocked for long.
+
+Usage:
+    python manage.py prune_token_blacklist --batch-size 5000
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.auth.blacklist import PRUNE_BATCH_SIZE, prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = 'Delete expired outstanding and blacklisted refresh tokens'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PRUNE_BATCH_SIZE, help='Tokens deleted per statement')
+
+    def handle(self, *args, **options):
+        deleted = prune_expired_tokens(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} expired tokens'))
@@ -0,0 +1,42 @@
+"""
+Rebuild the listing projections (job_listings / freelancer_listings).
+
+Usage:
+    python manage.py rebuild_listings --model all --batch-size 2000
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.auth.listings import REFRESH_BATCH_SIZE, refresh_freelancer_listings, refresh_job_listings
+from api.auth.models import Freelancer, Job
+
+
+class Command(BaseCommand):
+    help = 'Recompute listing projection rows for jobs and/or freelancers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', choices=['all', 'jobs', 'freelancers'], default='all')
+        parser.add_argument('--batch-size', type=int, default=REFRESH_BATCH_SIZE)
+        parser.add_argument('--after-id', type=int, default=0, help='Resume after this primary key')
+
+    def handle(self, *args, **options):
+        targets = {
+            'jobs': (Job, refresh_job_listings),
+            'freelancers': (Freelancer, refresh_freelancer_listings),
+        }
+        for name, (model, refresh) in targets.items():
+            if options['model'] not in ('all', name):
+                continue
+            last_id = options['after_id']
+            total = 0
+            while True:
+                ids = list(
+                    model.objects.filter(pk__gt=last_id).order_by('pk')
+                    .values_list('pk', flat=True)[:options['batch_size']]
+                )
+                if not ids:
+                    break
+                total += refresh(ids)
+                last_id = ids[-1]
+                self.stdout.write(f'  {name}: {total} rows (last id {last_id})')
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt {total} {name} listing rows'))
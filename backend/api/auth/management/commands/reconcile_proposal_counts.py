@@ -0,0 +1,36 @@
+"""
+Repair drift between Job.proposals_count and the proposals table.
+
+Meant to run periodically (e.g. nightly from cron); jobs are scanned in
+primary-key ranges so each transaction stays short.
+
+Usage:
+    python manage.py reconcile_proposal_counts --batch-size 5000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from api.auth.models import Job
+from api.auth.proposals import reconcile_proposal_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute Job.proposals_count where it differs from the number of proposals'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='Job id range per transaction')
+        parser.add_argument('--after-id', type=int, default=0, help='Resume after this primary key')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        max_id = Job.objects.aggregate(max_id=Max('pk'))['max_id'] or 0
+        start = options['after_id'] + 1
+        fixed = 0
+        while start <= max_id:
+            drifted = reconcile_proposal_counts(start, start + batch_size)
+            fixed += len(drifted)
+            if drifted:
+                self.stdout.write(f'  fixed {len(drifted)} jobs in [{start}, {start + batch_size})')
+            start += batch_size
+        self.stdout.write(self.style.SUCCESS(f'Reconciled proposals_count: {fixed} jobs corrected'))
@@ -0,0 +1,391 @@
+"""
+Freelancer recommendations for a job.
+
+Each process keeps an in-memory index with one row per freelancer in NumPy
+arrays (rate, category code, created_at) and an inverted index from skill id
+to row positions. Ranking a job is a few vectorized passes over those arrays
+followed by a partial sort, which stays in the millisecond range for ~1M
+freelancers.
+
+The index holds active freelancers only and is built lazily from the
+database. Freelancer changes (including a user being deactivated) are
+recorded after commit in a shared, versioned change log in the Django cache;
+every process replays the log before its next query. Updated freelancers get
+a fresh row and their old row is tombstoned; tombstoned rows are taken out of
+the skill postings, so the idf weights count live freelancers only.
+
+Only the first build blocks a query. When the log has expired or tombstones
+pile up, a fresh index is built in a background thread and swapped in, and
+the current one keeps answering queries meanwhile.
+"""
+
+import logging
+import math
+import threading
+import time
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from .models import Freelancer
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each signal in the final score (they sum to 1)
+MATCH_WEIGHTS = {'skills': 0.55, 'category': 0.2, 'rate': 0.15, 'recency': 0.1}
+
+# Profile age at which the recency signal halves; the signal is recomputed hourly
+RECENCY_HALF_LIFE_DAYS = 90
+RECENCY_REFRESH_SECONDS = 3600
+
+# Neutral score when a job has no budget or a freelancer has no rate
+UNKNOWN_RATE_FIT = 0.5
+
+DEFAULT_MATCH_LIMIT = 20
+MAX_MATCH_LIMIT = 100
+
+CHANGE_VERSION_KEY = 'matching:freelancers:version'
+CHANGE_LOG_KEY = 'matching:freelancers:changes:{}'
+CHANGE_LOG_TIMEOUT = 3600
+
+# Rebuild once tombstoned rows make up this share of the index
+MAX_DEAD_RATIO = 0.25
+
+
+def _category_key(value):
+    return ' '.join((value or '').split()).lower()
+
+
+def _recency(created, now):
+    age_days = np.maximum(now - created, 0.0) / 86400.0
+    return np.exp2(-age_days / RECENCY_HALF_LIFE_DAYS).astype(np.float32)
+
+
+def _rate_fit(rates, budget_min, budget_max):
+    """1 inside [budget_min, budget_max], decaying linearly with the distance outside it"""
+    if budget_min is None and budget_max is None:
+        return np.full(len(rates), UNKNOWN_RATE_FIT, dtype=np.float32)
+    low = float(budget_min if budget_min is not None else budget_max)
+    high = float(budget_max if budget_max is not None else budget_min)
+    # In place on one float32 buffer: max(|rate - mid| - half_width, 0) is the distance to the range
+    fit = np.abs(rates - np.float32((low + high) / 2))
+    fit -= np.float32((high - low) / 2)
+    np.maximum(fit, 0, out=fit)
+    fit *= np.float32(-1.0 / max(high, 1.0))
+    fit += 1
+    np.maximum(fit, 0, out=fit)
+    return np.nan_to_num(fit, copy=False, nan=UNKNOWN_RATE_FIT)
+
+
+class FreelancerMatchIndex:
+    """Columnar freelancer index with a skill -> rows inverted index"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.version = None  # change-log version this index reflects; None until built
+        self.rebuilding = False
+        self.clear()
+
+    def clear(self, capacity=0):
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.rates = np.full(capacity, np.nan, dtype=np.float32)
+        self.categories = np.full(capacity, -1, dtype=np.int32)
+        self.created = np.zeros(capacity)
+        self.recency = np.zeros(capacity, dtype=np.float32)
+        self.recency_at = time.time()
+        self.size = 0
+        self.live = 0
+        self.rows = {}           # freelancer id -> current row
+        self.dead = []           # tombstoned rows
+        self.postings = {}       # skill id -> int array of live rows
+        self.skill_offsets = np.zeros(1, dtype=np.int64)  # loaded row -> its slice of skill_values
+        self.skill_values = np.zeros(0, dtype=np.int64)
+        self.row_skills = {}     # appended row -> skill ids
+        self.category_codes = {}
+
+    def _category_code(self, value):
+        key = _category_key(value)
+        if not key:
+            return -1
+        return self.category_codes.setdefault(key, len(self.category_codes))
+
+    # ------------------------------------------------------------- building
+
+    def load_arrays(self, ids, rates, categories, created, link_ids, link_skills):
+        """
+        Replace the index contents.
+
+        ``ids``/``rates``/``categories``/``created`` describe one freelancer per
+        position (rates may contain NaN, created is epoch seconds); the
+        ``link_*`` arrays are parallel (freelancer id, skill id) pairs.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        self.clear(len(ids))
+        self.size = self.live = len(ids)
+        self.ids[:] = ids
+        self.rates[:] = np.asarray(rates, dtype=float)
+        self.categories[:] = [self._category_code(value) for value in categories]
+        self.created[:] = np.asarray(created, dtype=float)
+        self.recency[:] = _recency(self.created, self.recency_at)
+        self.rows = dict(zip(ids.tolist(), range(len(ids))))
+
+        link_ids = np.asarray(link_ids, dtype=np.int64)
+        link_skills = np.asarray(link_skills, dtype=np.int64)
+        if len(link_ids):
+            order = np.argsort(ids, kind='stable')
+            positions = np.searchsorted(ids, link_ids, sorter=order)
+            positions = np.clip(positions, 0, len(ids) - 1)
+            rows = order[positions]
+            known = ids[rows] == link_ids
+            rows, skills = rows[known], link_skills[known]
+
+            # Each row's skills, so remove() can find the postings to take it out of
+            by_row = np.argsort(rows, kind='stable')
+            self.skill_values = skills[by_row]
+            self.skill_offsets = np.searchsorted(rows[by_row], np.arange(len(ids) + 1))
+
+            by_skill = np.argsort(skills, kind='stable')
+            rows, skills = rows[by_skill], skills[by_skill]
+            boundaries = np.flatnonzero(np.diff(skills)) + 1
+            for skill_rows, skill in zip(np.split(rows, boundaries), skills[np.r_[0, boundaries]]):
+                self.postings[int(skill)] = skill_rows
+
+    def load(self):
+        """Build the index from the database"""
+        freelancers = Freelancer.objects.filter(user__is_active=True).order_by('pk').values_list('pk', 'rate', 'category', 'created_at')
+        ids, rates, categories, created = [], [], [], []
+        for pk, rate, category, created_at in freelancers.iterator(chunk_size=10000):
+            ids.append(pk)
+            rates.append(float(rate) if rate is not None else math.nan)
+            categories.append(category)
+            created.append(created_at.timestamp())
+
+        links = Freelancer.skill_tags.through.objects.filter(freelancer__user__is_active=True).values_list(
+            'freelancer_id', 'skill_id',
+        )
+        link_ids, link_skills = [], []
+        for freelancer_id, skill_id in links.iterator(chunk_size=50000):
+            link_ids.append(freelancer_id)
+            link_skills.append(skill_id)
+
+        self.load_arrays(ids, rates, categories, created, link_ids, link_skills)
+
+    def _grow(self):
+        capacity = max(16, len(self.ids) * 2)
+        for name, fill in (('ids', 0), ('rates', np.nan), ('categories', -1), ('created', 0), ('recency', 0)):
+            current = getattr(self, name)
+            grown = np.full(capacity, fill, dtype=current.dtype)
+            grown[:len(current)] = current
+            setattr(self, name, grown)
+
+    def _skills_of(self, row):
+        if row < len(self.skill_offsets) - 1:
+            return self.skill_values[self.skill_offsets[row]:self.skill_offsets[row + 1]].tolist()
+        return self.row_skills.get(row, ())
+
+    def remove(self, freelancer_id):
+        """Tombstone the freelancer's row and take it out of its skills' postings"""
+        row = self.rows.pop(freelancer_id, None)
+        if row is None:
+            return
+        self.dead.append(row)
+        self.live -= 1
+        for skill_id in self._skills_of(row):
+            rows = self.postings.get(skill_id)
+            if rows is None:
+                continue
+            rows = rows[rows != row]
+            if len(rows):
+                self.postings[skill_id] = rows
+            else:
+                del self.postings[skill_id]
+
+    def upsert(self, freelancer_id, rate, category, created_at, skill_ids):
+        """Tombstone the freelancer's current row (if any) and append a fresh one"""
+        self.remove(freelancer_id)
+        if self.size == len(self.ids):
+            self._grow()
+        row = self.size
+        self.size += 1
+        self.live += 1
+        self.ids[row] = freelancer_id
+        self.rates[row] = float(rate) if rate is not None else np.nan
+        self.categories[row] = self._category_code(category)
+        self.created[row] = created_at.timestamp()
+        self.recency[row] = _recency(self.created[row], self.recency_at)
+        self.rows[freelancer_id] = row
+        self.row_skills[row] = list(skill_ids)
+        for skill_id in skill_ids:
+            current = self.postings.get(skill_id)
+            self.postings[skill_id] = np.append(current, row) if current is not None else np.array([row])
+
+    def refresh(self, freelancer_ids):
+        """Re-read the given freelancers from the database; deleted or deactivated ones are removed"""
+        found = set()
+        freelancers = Freelancer.objects.filter(pk__in=freelancer_ids, user__is_active=True).prefetch_related('skill_tags')
+        for freelancer in freelancers:
+            found.add(freelancer.pk)
+            self.upsert(
+                freelancer.pk, freelancer.rate, freelancer.category, freelancer.created_at,
+                [skill.pk for skill in freelancer.skill_tags.all()],
+            )
+        for freelancer_id in set(freelancer_ids) - found:
+            self.remove(freelancer_id)
+
+    @classmethod
+    def build(cls, version):
+        """A new index loaded from the database; ``version`` must be read before loading"""
+        index = cls()
+        index.load()
+        index.version = version
+        return index
+
+    def install(self, fresh):
+        """Swap in the contents of a freshly built index"""
+        with self.lock:
+            for name, value in vars(fresh).items():
+                if name not in ('lock', 'rebuilding'):
+                    setattr(self, name, value)
+
+    def rebuild_in_background(self, version):
+        """Build a replacement in a thread; this index keeps serving until it is installed"""
+        if self.rebuilding:
+            return
+        self.rebuilding = True
+        threading.Thread(target=self._rebuild, args=(version,), name='match-index-rebuild', daemon=True).start()
+
+    def _rebuild(self, version):
+        try:
+            self.install(self.build(version))
+        except Exception as e:
+            logger.warning(f"Match index rebuild failed, serving the current index: {str(e)}")
+        finally:
+            self.rebuilding = False
+            connection.close()  # this thread's connection
+
+    def _changes_since(self, shared):
+        """Freelancer ids changed after this index's version, or None when the log cannot say"""
+        if shared < self.version:
+            return None  # the version counter was reset
+        changed = set()
+        for version in range(self.version + 1, shared + 1):
+            entry = cache.get(CHANGE_LOG_KEY.format(version))
+            if entry is None:
+                return None  # expired
+            changed.update(entry)
+        return changed
+
+    def sync(self):
+        """Bring the index up to date with the shared change log"""
+        with self.lock:
+            shared = cache.get(CHANGE_VERSION_KEY, 0)
+            if self.version is None:
+                # Nothing to serve yet: the first build blocks
+                self.install(self.build(shared))
+                return
+            if shared == self.version:
+                return
+
+            changed = self._changes_since(shared)
+            if changed is None:
+                self.rebuild_in_background(shared)
+                return
+            self.refresh(changed)
+            self.version = shared
+            if self.size - self.live > MAX_DEAD_RATIO * max(self.size, 1):
+                self.rebuild_in_background(shared)
+
+    # -------------------------------------------------------------- scoring
+
+    def rank(self, skill_ids, category, budget_min, budget_max, limit=DEFAULT_MATCH_LIMIT, now=None):
+        """
+        Top ``limit`` freelancers for a job profile.
+
+        Returns a list of (freelancer_id, score, components) tuples, best first.
+        """
+        size = self.size
+        if size == 0 or self.live == 0:
+            return []
+        now = time.time() if now is None else now
+        if now - self.recency_at > RECENCY_REFRESH_SECONDS:
+            self.recency[:size] = _recency(self.created[:size], now)
+            self.recency_at = now
+
+        # Skill overlap weighted by rarity (idf over live rows), normalized to [0, 1]
+        skills = np.zeros(size, dtype=np.float32)
+        total_weight = 0.0
+        for skill_id in set(skill_ids):
+            rows = self.postings.get(skill_id)
+            frequency = 0 if rows is None else len(rows)
+            weight = math.log(1.0 + self.live / (1.0 + frequency))
+            total_weight += weight
+            if rows is not None:
+                skills[rows] += weight
+        if total_weight:
+            skills /= total_weight
+
+        # Lookup table instead of a comparison mask; code -1 (no category) hits the trailing 0
+        category_table = np.zeros(len(self.category_codes) + 1, dtype=np.float32)
+        code = self.category_codes.get(_category_key(category))
+        if code is not None:
+            category_table[code] = 1.0
+        category_match = np.take(category_table, self.categories[:size])
+        rate_fit = _rate_fit(self.rates[:size], budget_min, budget_max)
+        recency = self.recency[:size]
+
+        score = skills * np.float32(MATCH_WEIGHTS['skills'])
+        score += category_match * np.float32(MATCH_WEIGHTS['category'])
+        score += rate_fit * np.float32(MATCH_WEIGHTS['rate'])
+        score += recency * np.float32(MATCH_WEIGHTS['recency'])
+        if self.dead:
+            score[np.asarray(self.dead, dtype=np.intp)] = -np.inf
+
+        count = min(limit, self.live)
+        top = np.argpartition(score, size - count)[size - count:]
+        top = top[np.argsort(-score[top], kind='stable')]
+        return [
+            (
+                int(self.ids[row]),
+                round(float(score[row]), 4),
+                {
+                    'skills': round(float(skills[row]), 4),
+                    'category': float(category_match[row]),
+                    'rate': round(float(rate_fit[row]), 4),
+                    'recency': round(float(recency[row]), 4),
+                },
+            )
+            for row in top
+        ]
+
+
+freelancer_index = FreelancerMatchIndex()
+
+
+def record_freelancer_changes(freelancer_ids):
+    """Append changed freelancer ids to the shared change log once the transaction commits"""
+    freelancer_ids = list(freelancer_ids)
+
+    def publish():
+        # Write the entry first, into the next free slot (add() claims it atomically), and
+        # only then advance the version, so no reader sees a version whose entry is missing
+        version = cache.get(CHANGE_VERSION_KEY, 0) + 1
+        while not cache.add(CHANGE_LOG_KEY.format(version), freelancer_ids, CHANGE_LOG_TIMEOUT):
+            version += 1
+        cache.add(CHANGE_VERSION_KEY, version - 1, timeout=None)
+        cache.incr(CHANGE_VERSION_KEY)
+
+    transaction.on_commit(publish)
+
+
+def recommend_freelancers(job, limit=DEFAULT_MATCH_LIMIT):
+    """Ranked (freelancer_id, score, components) tuples for a job"""
+    with freelancer_index.lock:
+        freelancer_index.sync()
+        return freelancer_index.rank(
+            [skill.pk for skill in job.skill_tags.all()],
+            job.category,
+            job.budget_min,
+            job.budget_max,
+            limit=limit,
+        )
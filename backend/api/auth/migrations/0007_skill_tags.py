@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_auth', '0006_job_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Display name as first entered', max_length=100)),
+                ('normalized_name', models.CharField(help_text='Lowercased, whitespace-collapsed name', max_length=100, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'skills',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='freelancer',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, db_table='freelancer_skills', related_name='freelancers', to='api_auth.skill'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, db_table='job_skills', related_name='jobs', to='api_auth.skill'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:29
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_auth', '0007_skill_tags'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='freelancer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='freelancers_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='freelancer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['location'], name='freelancers_location_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='freelancer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['category'], name='freelancers_category_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
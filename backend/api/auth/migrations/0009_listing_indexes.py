@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built CONCURRENTLY so existing tables stay writable
+    atomic = False
+
+    dependencies = [
+        ('api_auth', '0008_freelancer_trigram_search'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='freelancer',
+            index=models.Index(fields=['rate', 'id'], name='freelancers_rate_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='freelancer',
+            index=models.Index(fields=['created_at', 'id'], name='freelancers_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['-created_at', '-id'], name='jobs_open_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['budget_min'], name='jobs_open_budget_min_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['budget_max'], name='jobs_open_budget_max_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-created_at', '-id'], name='jobs_pending_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['client', '-created_at'], name='jobs_client_created_idx'),
+        ),
+    ]
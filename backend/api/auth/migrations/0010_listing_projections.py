@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_auth', '0009_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FreelancerListing',
+            fields=[
+                ('freelancer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='listing', serialize=False, to='api_auth.freelancer')),
+                ('name', models.CharField(blank=True, max_length=301)),
+                ('username', models.CharField(max_length=150)),
+                ('email', models.EmailField(max_length=254)),
+                ('title', models.CharField(blank=True, max_length=255, null=True)),
+                ('category', models.CharField(blank=True, max_length=255, null=True)),
+                ('rate', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('skills_list', models.JSONField(default=list)),
+                ('location', models.CharField(blank=True, max_length=255, null=True)),
+                ('profile_picture', models.URLField(blank=True, null=True)),
+                ('bio', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'freelancer_listings',
+            },
+        ),
+        migrations.CreateModel(
+            name='JobListing',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='listing', serialize=False, to='api_auth.job')),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('category', models.CharField(blank=True, max_length=255, null=True)),
+                ('budget_min', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('budget_max', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('duration', models.CharField(blank=True, max_length=255, null=True)),
+                ('status', models.CharField(max_length=50)),
+                ('skills_list', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField()),
+                ('proposals_count', models.IntegerField(default=0)),
+                ('client_name', models.CharField(blank=True, max_length=301)),
+                ('client_username', models.CharField(max_length=150)),
+            ],
+            options={
+                'db_table': 'job_listings',
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_auth', '0010_listing_projections'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFeedEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(help_text='Match score at fan-out time')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('freelancer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_entries', to='api_auth.freelancer')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_entries', to='api_auth.job')),
+            ],
+            options={
+                'db_table': 'job_feed_entries',
+                'indexes': [models.Index(fields=['freelancer', '-created_at', '-id'], name='job_feed_page_idx')],
+                'constraints': [models.UniqueConstraint(fields=('freelancer', 'job'), name='job_feed_unique_entry')],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_auth', '0011_job_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Proposal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cover_letter', models.TextField(blank=True, null=True)),
+                ('bid_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'proposals',
+            },
+        ),
+        migrations.AddField(
+            model_name='proposal',
+            name='freelancer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='proposals', to='api_auth.freelancer'),
+        ),
+        migrations.AddField(
+            model_name='proposal',
+            name='job',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='proposals', to='api_auth.job'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['job', '-created_at'], name='proposals_job_created_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='proposal',
+            constraint=models.UniqueConstraint(fields=('job', 'freelancer'), name='proposals_unique_job_freelancer'),
+        ),
+    ]
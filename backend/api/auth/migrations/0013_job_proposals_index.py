@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:45
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Built CONCURRENTLY so the jobs table stays writable
+    atomic = False
+
+    dependencies = [
+        ('api_auth', '0012_proposals'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['proposals_count', 'id'], name='jobs_open_proposals_idx'),
+        ),
+    ]
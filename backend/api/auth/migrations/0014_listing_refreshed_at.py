@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-17 05:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_auth', '0013_job_proposals_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='freelancerlisting',
+            name='refreshed_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='Last upsert; drives incremental exports'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='refreshed_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='Last upsert; drives incremental exports'),
+            preserve_default=False,
+        ),
+    ]
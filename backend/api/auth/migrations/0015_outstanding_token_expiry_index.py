@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 09:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Built CONCURRENTLY so refreshes keep writing to the blacklist tables
+    atomic = False
+
+    dependencies = [
+        ('api_auth', '0014_listing_refreshed_at'),
+        ('token_blacklist', '0013_alter_blacklistedtoken_options_and_more'),
+    ]
+
+    operations = [
+        # token_blacklist ships no index on expires_at; prune_token_blacklist scans by it
+        migrations.RunSQL(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS token_blacklist_outstanding_expires_idx '
+                'ON token_blacklist_outstandingtoken (expires_at)',
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS token_blacklist_outstanding_expires_idx',
+        ),
+    ]
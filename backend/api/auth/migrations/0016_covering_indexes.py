@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-17 05:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built CONCURRENTLY so existing tables stay writable; the
+    # covering replacements are in place before the old indexes are dropped
+    atomic = False
+
+    dependencies = [
+        ('api_auth', '0015_outstanding_token_expiry_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='freelancer',
+            index=models.Index(fields=['rate', 'id'], include=('created_at',), name='freelancers_rate_cov_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='freelancer',
+            index=models.Index(fields=['created_at', 'id'], include=('rate',), name='freelancers_created_cov_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['client', '-created_at'], include=('status',), name='jobs_client_created_cov_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='freelancer',
+            name='freelancers_rate_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='freelancer',
+            name='freelancers_created_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='job',
+            name='jobs_client_created_idx',
+        ),
+        # The plain client_id index is redundant with jobs_client_created_cov_idx
+        migrations.AlterField(
+            model_name='job',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='api_auth.client'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
 
 
 class User(AbstractUser):
@@ -94,6 +97,21 @@ class User(AbstractUser):
         super().save(*args, **kwargs)
 
 
+# ---------------------- SKILLS -------------------------
+class Skill(models.Model):
+    """Normalized skill tag shared by jobs and freelancers"""
+    name = models.CharField(max_length=100, help_text='Display name as first entered')
+    normalized_name = models.CharField(max_length=100, unique=True, help_text='Lowercased, whitespace-collapsed name')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'skills'
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
 # ---------------------- FREELANCERS --------------------
 class Freelancer(models.Model):
     """Stores freelancer-specific details (one-to-one with User)"""
@@ -102,12 +120,23 @@ class Freelancer(models.Model):
     category = models.CharField(max_length=255, blank=True, null=True)
     rate = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     skills = models.TextField(blank=True, null=True, help_text='Comma-separated or JSON array')
+    skill_tags = models.ManyToManyField(Skill, blank=True, related_name='freelancers', db_table='freelancer_skills')
     bio = models.TextField(blank=True, null=True)
     location = models.CharField(max_length=255, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'freelancers'
+        # Trigram indexes behind the fuzzy ?q= search (api.auth.search.search_freelancers)
+        indexes = [
+            # Directory orderings (rate / created_at, with id as the keyset tie-breaker). The
+            # directory reads only id, rate and created_at, so these cover it (index-only scans)
+            models.Index(fields=['rate', 'id'], include=['created_at'], name='freelancers_rate_cov_idx'),
+            models.Index(fields=['created_at', 'id'], include=['rate'], name='freelancers_created_cov_idx'),
+            GinIndex(fields=['title'], name='freelancers_title_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['location'], name='freelancers_location_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['category'], name='freelancers_category_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return f"Freelancer: {self.user.username}"
@@ -144,7 +173,8 @@ class AdminProfile(models.Model):
 # ---------------------- JOBS ---------------------------
 class Job(models.Model):
     """Job listings created by clients and visible to freelancers"""
-    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='jobs')
+    # Indexed through jobs_client_created_cov_idx, which leads with client_id
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='jobs', db_index=False)
     title = models.CharField(max_length=255)
     description = models.TextField()
     budget_min = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
@@ -152,19 +182,139 @@ class Job(models.Model):
     duration = models.CharField(max_length=255, blank=True, null=True)
     category = models.CharField(max_length=255, blank=True, null=True)
     skills = models.TextField(blank=True, null=True, help_text='Comma-separated or JSON array')
+    skill_tags = models.ManyToManyField(Skill, blank=True, related_name='jobs', db_table='job_skills')
     requirements = models.TextField(blank=True, null=True)
     project_details = models.TextField(blank=True, null=True)
     status = models.CharField(max_length=50, default='pending', help_text='pending | open | in_progress | completed | cancelled')
     proposals_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Weighted tsvector over title/skills/description/requirements, kept current by api.auth.signals
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
 
     class Meta:
         db_table = 'jobs'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='jobs_search_vector_gin'),
+            # Public board: status='open' ORDER BY created_at DESC, id DESC (plus budget range filters)
+            models.Index(fields=['-created_at', '-id'], name='jobs_open_created_idx', condition=Q(status='open')),
+            models.Index(fields=['budget_min'], name='jobs_open_budget_min_idx', condition=Q(status='open')),
+            models.Index(fields=['budget_max'], name='jobs_open_budget_max_idx', condition=Q(status='open')),
+            # Admin moderation queue
+            models.Index(fields=['-created_at', '-id'], name='jobs_pending_created_idx', condition=Q(status='pending')),
+            # Client job history; status is included for the dashboard's per-status counts
+            models.Index(fields=['client', '-created_at'], include=['status'], name='jobs_client_created_cov_idx'),
+            # Public board sorted by fewest proposals: ORDER BY proposals_count, id
+            models.Index(fields=['proposals_count', 'id'], name='jobs_open_proposals_idx', condition=Q(status='open')),
+        ]
 
     def __str__(self):
         return f"Job: {self.title} (client={self.client.user.username})"
 
 
+# ---------------------- PROPOSALS ----------------------
+class Proposal(models.Model):
+    """
+    A freelancer's proposal for a job (at most one per job and freelancer).
+    Job.proposals_count is maintained alongside by api.auth.proposals.
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='proposals')
+    freelancer = models.ForeignKey(Freelancer, on_delete=models.CASCADE, related_name='proposals')
+    cover_letter = models.TextField(blank=True, null=True)
+    bid_amount = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'proposals'
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'freelancer'], name='proposals_unique_job_freelancer'),
+        ]
+        indexes = [
+            # Proposals of a job, newest first (the unique index also serves job_id lookups)
+            models.Index(fields=['job', '-created_at'], name='proposals_job_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"Proposal: job={self.job_id} freelancer={self.freelancer_id}"
+
+
+# ---------------------- LISTING PROJECTIONS -----------
+class JobListing(models.Model):
+    """
+    Denormalized listing card for a job (the JobListSerializer payload), kept
+    current by api.auth.listings from Job, Client and User saves
+    """
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='listing')
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    category = models.CharField(max_length=255, blank=True, null=True)
+    budget_min = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    budget_max = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    duration = models.CharField(max_length=255, blank=True, null=True)
+    status = models.CharField(max_length=50)
+    skills_list = models.JSONField(default=list)
+    created_at = models.DateTimeField()
+    proposals_count = models.IntegerField(default=0)
+    client_name = models.CharField(max_length=301, blank=True)
+    client_username = models.CharField(max_length=150)
+    refreshed_at = models.DateTimeField(auto_now=True, help_text='Last upsert; drives incremental exports')
+
+    class Meta:
+        db_table = 'job_listings'
+
+    def __str__(self):
+        return f"JobListing: {self.title}"
+
+
+class FreelancerListing(models.Model):
+    """
+    Denormalized directory card for a freelancer (the FreelancerListSerializer
+    payload), kept current by api.auth.listings from Freelancer and User saves
+    """
+    freelancer = models.OneToOneField(Freelancer, on_delete=models.CASCADE, primary_key=True, related_name='listing')
+    name = models.CharField(max_length=301, blank=True)
+    username = models.CharField(max_length=150)
+    email = models.EmailField()
+    title = models.CharField(max_length=255, blank=True, null=True)
+    category = models.CharField(max_length=255, blank=True, null=True)
+    rate = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    skills_list = models.JSONField(default=list)
+    location = models.CharField(max_length=255, blank=True, null=True)
+    profile_picture = models.URLField(blank=True, null=True)
+    bio = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+    refreshed_at = models.DateTimeField(auto_now=True, help_text='Last upsert; drives incremental exports')
+
+    class Meta:
+        db_table = 'freelancer_listings'
+
+    def __str__(self):
+        return f"FreelancerListing: {self.username}"
+
+
+# ---------------------- JOB FEED -----------------------
+class JobFeedEntry(models.Model):
+    """
+    A job pushed into a freelancer's "jobs for you" feed when it was approved
+    (fan-out on approve, see api.auth.feed). Each feed is capped in length.
+    """
+    freelancer = models.ForeignKey(Freelancer, on_delete=models.CASCADE, related_name='feed_entries')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='feed_entries')
+    score = models.FloatField(help_text='Match score at fan-out time')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'job_feed_entries'
+        constraints = [
+            models.UniqueConstraint(fields=['freelancer', 'job'], name='job_feed_unique_entry'),
+        ]
+        indexes = [
+            models.Index(fields=['freelancer', '-created_at', '-id'], name='job_feed_page_idx'),
+        ]
+
+    def __str__(self):
+        return f"JobFeedEntry: job={self.job_id} -> freelancer={self.freelancer_id}"
+
+
 # ---------------------- CHAT THREADS -------------------
 class ChatThread(models.Model):
     client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='chat_threads')
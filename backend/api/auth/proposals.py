@@ -0,0 +1,76 @@
+"""
+Proposal bookkeeping and Job.proposals_count.
+
+The count is adjusted with an F() expression in the same transaction as the
+proposal row, so concurrent submissions never lose an increment. Queryset
+updates skip post_save, so the listing projection and the caches derived
+from the job are refreshed here once the transaction commits.
+reconcile_proposal_counts() repairs any drift (e.g. rows deleted in bulk).
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from api.common.cache import bump_namespace, bump_objects
+
+from .listings import refresh_job_listings
+from .models import Job, Proposal
+
+
+def _job_counts_changed(job_ids):
+    """Refresh what post_save would have refreshed for the given jobs"""
+    job_ids = list(job_ids)
+
+    def refresh():
+        refresh_job_listings(job_ids)
+        bump_objects('job', job_ids)
+        bump_namespace('job_pages')
+
+    if job_ids:
+        transaction.on_commit(refresh)
+
+
+def submit_proposal(job, freelancer, **fields):
+    """
+    Record a freelancer's proposal for a job.
+
+    Returns (proposal, created); a second submission for the same job returns
+    the existing proposal and leaves the count alone.
+    """
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                proposal = Proposal.objects.create(job=job, freelancer=freelancer, **fields)
+        except IntegrityError:
+            return Proposal.objects.get(job=job, freelancer=freelancer), False
+
+        Job.objects.filter(pk=job.pk).update(proposals_count=F('proposals_count') + 1)
+        _job_counts_changed([job.pk])
+    return proposal, True
+
+
+def reconcile_proposal_counts(start_id, end_id):
+    """
+    Set proposals_count to the actual number of proposals for jobs with
+    start_id <= id < end_id. Only rows that drifted are written; returns
+    their ids.
+    """
+    actual = Coalesce(
+        Subquery(
+            Proposal.objects.filter(job=OuterRef('pk')).order_by()
+            .values('job').annotate(total=Count('id')).values('total'),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+    with transaction.atomic():
+        drifted = list(
+            Job.objects.filter(pk__gte=start_id, pk__lt=end_id)
+            .annotate(actual=actual).exclude(proposals_count=F('actual'))
+            .select_for_update(of=('self',)).values_list('pk', flat=True)
+        )
+        if drifted:
+            Job.objects.filter(pk__in=drifted).update(proposals_count=actual)
+            _job_counts_changed(drifted)
+    return drifted
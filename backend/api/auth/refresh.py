@@ -0,0 +1,85 @@
+"""
+Single-flight coalescing of refresh-token rotation.
+
+With ROTATE_REFRESH_TOKENS and BLACKLIST_AFTER_ROTATION a refresh token is
+good for exactly one refresh. When the frontend reopens several tabs they all
+refresh the same token at once: one wins, the rest hit the blacklist and log
+the user out, and every attempt costs blacklist writes.
+
+coalesced_refresh() lets the first request for a token (keyed by its jti,
+after the signature and expiry have been checked) perform the rotation while
+concurrent requests for the same token wait for it, then hands all of them
+the same rotated pair. The pair stays available for REFRESH_GRACE_SECONDS,
+so a tab arriving shortly after the rotation gets it too instead of a 401.
+Only holders of the original, validly signed token can collect it.
+
+Waiting is asynchronous (asyncio.sleep between cache polls), so a coalesced
+request occupies no thread while another worker rotates its token.
+"""
+
+import asyncio
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
+
+from .tokens import RoleRefreshToken
+
+REFRESH_GRACE_SECONDS = 30
+REFRESH_FLIGHT_TIMEOUT = 10  # lock lifetime if the rotating process dies mid-flight
+REFRESH_FLIGHT_WAIT = 2.0
+REFRESH_FLIGHT_POLL_INTERVAL = 0.02
+
+REFRESH_RESULT_KEY = 'token_refresh:{}:result'
+REFRESH_FLIGHT_KEY = 'token_refresh:{}:flight'
+
+
+def refresh_token_jti(raw):
+    """jti of a validly signed, unexpired refresh token; None otherwise"""
+    try:
+        payload = token_backend.decode(raw, verify=True)
+    except TokenBackendError:
+        return None
+    if payload.get(api_settings.TOKEN_TYPE_CLAIM) != RoleRefreshToken.token_type:
+        return None
+    return payload.get(api_settings.JTI_CLAIM)
+
+
+async def coalesced_refresh(raw, rotate):
+    """
+    Await ``rotate()`` (a coroutine function that validates and rotates
+    ``raw`` and returns the new pair) at most once per token across all
+    workers; concurrent and grace-window callers get the stored result.
+    Errors from ``rotate()`` propagate and are not shared.
+    """
+    jti = refresh_token_jti(raw) if isinstance(raw, str) else None
+    if not jti:
+        return await rotate()  # let the serializer report the malformed or expired token
+
+    result_key = REFRESH_RESULT_KEY.format(jti)
+    flight_key = REFRESH_FLIGHT_KEY.format(jti)
+
+    result = await cache.aget(result_key)
+    if result is not None:
+        return result
+
+    if await cache.aadd(flight_key, 1, REFRESH_FLIGHT_TIMEOUT):
+        try:
+            result = await rotate()
+            await cache.aset(result_key, result, REFRESH_GRACE_SECONDS)
+            return result
+        finally:
+            await cache.adelete(flight_key)
+
+    # Another worker is rotating this token; a refresh takes milliseconds
+    deadline = time.monotonic() + REFRESH_FLIGHT_WAIT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(REFRESH_FLIGHT_POLL_INTERVAL)
+        result = await cache.aget(result_key)
+        if result is not None:
+            return result
+        if not await cache.aget(flight_key):
+            break  # the rotation failed; rotating again reports why
+    return await rotate()
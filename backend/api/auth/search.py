@@ -0,0 +1,110 @@
+"""
+Search helpers for the public job board and freelancer directory
+"""
+
+from itertools import islice, product
+
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast, Greatest
+
+from .models import Job
+
+# Text search configuration used for both indexing and querying
+SEARCH_CONFIG = 'english'
+
+# Fields folded into Job.search_vector; saving any of these refreshes the vector
+JOB_SEARCH_FIELDS = ('title', 'skills', 'description', 'requirements')
+
+
+def job_search_vector():
+    """
+    Weighted tsvector expression for a job row (title > skills > description > requirements)
+    """
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector('skills', weight='B', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='C', config=SEARCH_CONFIG)
+        + SearchVector('requirements', weight='D', config=SEARCH_CONFIG)
+    )
+
+
+def update_job_search_vectors(job_ids):
+    """
+    Recompute the stored search vector for the given job ids in a single UPDATE
+    """
+    return Job.objects.filter(pk__in=job_ids).update(search_vector=job_search_vector())
+
+
+def search_jobs(queryset, term):
+    """
+    Filter a Job queryset by a web-style search term, ranked by relevance.
+
+    Uses the GIN index on search_vector; supports quoted phrases, OR and -exclusions.
+    """
+    query = SearchQuery(term, search_type='websearch', config=SEARCH_CONFIG)
+    # ts_rank returns float4; widen it so the value round-trips exactly through pagination cursors
+    return queryset.filter(search_vector=query).annotate(
+        rank=Cast(SearchRank(F('search_vector'), query), FloatField())
+    ).order_by('-rank', '-created_at', '-id')
+
+
+# Freelancer fields covered by pg_trgm GIN indexes (see Freelancer.Meta.indexes)
+FREELANCER_SEARCH_FIELDS = ('title', 'location', 'category')
+
+# Names that mean the same place; trigram similarity alone cannot bridge a renaming
+SEARCH_ALIASES = (
+    ('bangalore', 'bengaluru'),
+    ('bombay', 'mumbai'),
+    ('madras', 'chennai'),
+    ('calcutta', 'kolkata'),
+    ('gurgaon', 'gurugram'),
+    ('poona', 'pune'),
+    ('mysore', 'mysuru'),
+    ('baroda', 'vadodara'),
+    ('trivandrum', 'thiruvananthapuram'),
+    ('cochin', 'kochi'),
+)
+
+_ALIASES = {name: group for group in SEARCH_ALIASES for name in group}
+
+# Upper bound on the spellings one term expands to
+MAX_SEARCH_VARIANTS = 4
+
+
+def search_variants(term):
+    """
+    The term followed by its spellings with aliased words swapped for their
+    other names: "Bangalore python" also yields "bengaluru python".
+    """
+    options = [
+        [word] + [name for name in _ALIASES.get(word.lower(), ()) if name != word.lower()]
+        for word in term.split()
+    ]
+    return [' '.join(words) for words in islice(product(*options), MAX_SEARCH_VARIANTS)]
+
+
+def search_freelancers(queryset, term):
+    """
+    Typo-tolerant filter over freelancer title, location and category, ranked
+    by the best trigram word similarity of the three.
+
+    The ``trigram_word_similar`` lookups (``%>``) are served by the trigram
+    GIN indexes and match when the term is close to any word run in the
+    field, so "pyhton developer" finds "Python Developer". Each spelling
+    from search_variants() is matched too, so "Bangalore" finds "Bengaluru".
+    """
+    variants = search_variants(term)
+    matches = Q()
+    for variant in variants:
+        for field in FREELANCER_SEARCH_FIELDS:
+            matches |= Q(**{f'{field}__trigram_word_similar': variant})
+    similarity = Greatest(*(
+        TrigramWordSimilarity(variant, field) for variant in variants for field in FREELANCER_SEARCH_FIELDS
+    ))
+    # word_similarity returns float4; widen it for exact cursor round-trips as with job rank
+    return queryset.filter(matches).annotate(
+        similarity=Cast(similarity, FloatField())
+    ).order_by('-similarity', '-created_at', '-id')
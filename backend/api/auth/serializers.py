@@ -1,8 +1,12 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import User
-from .models import Freelancer, Client, Job
+from .models import Freelancer, Client, Job, JobListing, FreelancerListing
+from .listings import listing_text
+from .skills import skill_names
+from api.common.fieldsets import SparseFieldsSerializerMixin
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -73,8 +77,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         # Extract password for secure handling
         password = validated_data.pop('password')
         
-        # Create user instance
-        user = User.objects.create(**validated_data)
+        # Create user instance, hashing the password before the INSERT
+        user = User(**validated_data)
         
         # Set password securely using Django's built-in method
         user.set_password(password)
@@ -83,6 +87,38 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return user
 
 
+class UserImportSerializer(serializers.Serializer):
+    """
+    One row of a bulk user import (see api.auth.imports). Uniqueness is
+    checked for the whole file at once, so there are no per-row queries here.
+    """
+    username = serializers.CharField(max_length=150, validators=[UnicodeUsernameValidator()])
+    email = serializers.EmailField(max_length=254)
+    password = serializers.CharField(required=False, allow_blank=True, write_only=True)
+    first_name = serializers.CharField(max_length=150)
+    last_name = serializers.CharField(max_length=150)
+    role = serializers.ChoiceField(choices=['freelancer', 'client'])
+    phone = serializers.CharField(max_length=15, required=False, allow_blank=True)
+    bio = serializers.CharField(required=False, allow_blank=True)
+    # Client profile
+    company_name = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    # Freelancer profile
+    title = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    category = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    rate = serializers.DecimalField(max_digits=10, decimal_places=2, required=False, allow_null=True)
+    skills = serializers.CharField(required=False, allow_blank=True)
+    location = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    
+    def validate_email(self, value):
+        return value.lower()
+    
+    def to_internal_value(self, data):
+        # CSV cells are always strings; an empty rate means "not set"
+        if data.get('rate') == '':
+            data = {**data, 'rate': None}
+        return super().to_internal_value(data)
+
+
 class UserLoginSerializer(serializers.Serializer):
     """
     Serializer for user login
@@ -117,13 +153,19 @@ class UserLoginSerializer(serializers.Serializer):
             if not user:
                 raise serializers.ValidationError("Invalid credentials.")
             
-            if not user.is_active:
-                raise serializers.ValidationError("User account is disabled.")
+            self.validate_user(user)
             
             attrs['user'] = user
             return attrs
         else:
             raise serializers.ValidationError("Both username and password are required.")
+    
+    def validate_user(self, user):
+        """
+        Checks applied to an authenticated user (shared with the async login views)
+        """
+        if not user.is_active:
+            raise serializers.ValidationError("User account is disabled.")
 
 
 class AdminLoginSerializer(UserLoginSerializer):
@@ -131,17 +173,14 @@ class AdminLoginSerializer(UserLoginSerializer):
     Serializer for admin login - extends UserLoginSerializer with admin check
     """
     
-    def validate(self, attrs):
+    def validate_user(self, user):
         """
         Validate admin credentials
         """
-        attrs = super().validate(attrs)
-        user = attrs['user']
+        super().validate_user(user)
         
         if not (user.role == 'admin' or user.is_superuser):
             raise serializers.ValidationError("Access denied. Admin privileges required.")
-        
-        return attrs
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
@@ -363,15 +402,8 @@ class JobListSerializer(serializers.ModelSerializer):
         )
     
     def get_skills_list(self, obj):
-        """Convert skills field to list format"""
-        if obj.skills:
-            # Handle both comma-separated and JSON array formats
-            try:
-                import json
-                return json.loads(obj.skills) if obj.skills.startswith('[') else obj.skills.split(',')
-            except:
-                return obj.skills.split(',') if ',' in obj.skills else [obj.skills]
-        return []
+        """Skill names from the prefetched skill tags"""
+        return skill_names(obj)
 
 
 class FreelancerListSerializer(serializers.ModelSerializer):
@@ -391,15 +423,38 @@ class FreelancerListSerializer(serializers.ModelSerializer):
         )
     
     def get_skills_list(self, obj):
-        """Convert skills field to list format"""
-        if obj.skills:
-            # Handle both comma-separated and JSON array formats
-            try:
-                import json
-                return json.loads(obj.skills) if obj.skills.startswith('[') else obj.skills.split(',')
-            except:
-                return obj.skills.split(',') if ',' in obj.skills else [obj.skills]
-        return []
+        """Skill names from the prefetched skill tags"""
+        return skill_names(obj)
+
+
+class JobListingSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Job cards read from the job_listings projection (same payload as JobListSerializer)"""
+    id = serializers.IntegerField(source='job_id', read_only=True)
+    description = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = JobListing
+        fields = JobListSerializer.Meta.fields
+    
+    def get_description(self, obj):
+        """Full description, or an excerpt for the card preset"""
+        return listing_text(obj, 'description')
+
+
+class FreelancerListingSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Freelancer cards read from the freelancer_listings projection (same payload as FreelancerListSerializer)"""
+    id = serializers.IntegerField(source='freelancer_id', read_only=True)
+    email = serializers.CharField(read_only=True)
+    profile_picture = serializers.CharField(read_only=True)
+    bio = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = FreelancerListing
+        fields = FreelancerListSerializer.Meta.fields
+    
+    def get_bio(self, obj):
+        """Full bio, or an excerpt for the card preset"""
+        return listing_text(obj, 'bio')
 
 
 # ---------------------- DISPUTE SERIALIZERS -------------------------
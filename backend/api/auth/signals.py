@@ -0,0 +1,219 @@
+"""
+Model signal handlers for the auth app
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from api.common.cache import bump_namespace, bump_objects
+from chat.models import ChatMessage, ChatThread
+from payment.models import Payment
+
+from .authentication import invalidate_cached_user
+from .blacklist import publish_blacklisted
+from .dashboard import invalidate_dashboard_stats
+from .feed import withdraw_job
+from .listings import refresh_freelancer_listings, refresh_job_listings
+from .matching import record_freelancer_changes
+from .models import AdminProfile, Client, Freelancer, Job, User
+from .search import JOB_SEARCH_FIELDS, update_job_search_vectors
+from .skills import sync_skill_tags
+
+
+def _touches(update_fields, fields):
+    """True when a save may have changed any of the given fields"""
+    return update_fields is None or bool(set(update_fields) & set(fields))
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_search_vector(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the job's search vector in step with its text fields on create and moderation"""
+    if not _touches(update_fields, JOB_SEARCH_FIELDS):
+        return
+    update_job_search_vectors([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=Freelancer)
+def refresh_skill_tags(sender, instance, created, update_fields=None, **kwargs):
+    """Mirror the free-text skills field into normalized skill tags"""
+    if _touches(update_fields, ['skills']):
+        sync_skill_tags(instance)
+
+
+# User fields copied into the listing projections
+USER_LISTING_FIELDS = ('first_name', 'last_name', 'username', 'email', 'profile_picture', 'bio')
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_listing(sender, instance, created, **kwargs):
+    """Registered after refresh_skill_tags so the projected skills_list is current"""
+    refresh_job_listings([instance.pk])
+
+
+@receiver(post_save, sender=Client)
+def refresh_client_job_listings(sender, instance, created, **kwargs):
+    if not created:
+        refresh_job_listings(instance.jobs.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Freelancer)
+def refresh_freelancer_listing(sender, instance, created, **kwargs):
+    refresh_freelancer_listings([instance.pk])
+
+
+@receiver(post_save, sender=Freelancer)
+@receiver(post_delete, sender=Freelancer)
+def update_match_index(sender, instance, **kwargs):
+    """Registered after refresh_skill_tags so the match index sees the new tags"""
+    record_freelancer_changes([instance.pk])
+
+
+@receiver(post_init, sender=User)
+def remember_user_active(sender, instance, **kwargs):
+    """Keep the loaded is_active so post_save can tell whether it changed"""
+    instance._original_is_active = instance.__dict__.get('is_active')
+
+
+@receiver(post_save, sender=User)
+def update_match_index_for_user(sender, instance, created, **kwargs):
+    """Deactivated freelancers leave the match index and reactivated ones return"""
+    if not created and instance.is_active != getattr(instance, '_original_is_active', instance.is_active):
+        record_freelancer_changes(Freelancer.objects.filter(user=instance).values_list('pk', flat=True))
+    instance._original_is_active = instance.is_active
+
+
+@receiver(post_save, sender=User)
+def refresh_user_listings(sender, instance, created, update_fields=None, **kwargs):
+    """Names, usernames and avatars are copied into the client's jobs and the freelancer card"""
+    if created or not _touches(update_fields, USER_LISTING_FIELDS):
+        return
+    refresh_job_listings(Job.objects.filter(client__user=instance).values_list('pk', flat=True))
+    refresh_freelancer_listings(Freelancer.objects.filter(user=instance).values_list('pk', flat=True))
+
+
+# Saves that only record a login do not change anything the public pages show
+LOGIN_BOOKKEEPING_FIELDS = {'last_login', 'last_login_ip'}
+
+
+@receiver(post_init, sender=Job)
+def remember_job_status(sender, instance, **kwargs):
+    """Keep the loaded status so post_save can tell whether it changed"""
+    instance._original_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=Job)
+def withdraw_closed_job(sender, instance, created, **kwargs):
+    """Drop a job from freelancer feeds once it is no longer open"""
+    if not created and getattr(instance, '_original_status', None) == 'open' and instance.status != 'open':
+        withdraw_job(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+def invalidate_job_listings(sender, instance, created, **kwargs):
+    """Listing counts only depend on which jobs exist and their status"""
+    if created or instance.status != getattr(instance, '_original_status', None):
+        bump_namespace('jobs')
+    instance._original_status = instance.status
+
+
+@receiver(post_delete, sender=Job)
+def invalidate_deleted_job_listings(sender, instance, **kwargs):
+    bump_namespace('jobs', 'job_pages')
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=Client)
+@receiver(post_delete, sender=Client)
+def invalidate_job_pages(sender, instance, **kwargs):
+    """Cached job listing responses embed job and client fields"""
+    bump_namespace('job_pages')
+
+
+@receiver(post_save, sender=Freelancer)
+@receiver(post_delete, sender=Freelancer)
+def invalidate_freelancer_listings(sender, instance, **kwargs):
+    """Any profile change may move a freelancer in or out of a filtered listing"""
+    bump_namespace('freelancers', 'freelancer_pages')
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_pages(sender, instance, created, update_fields=None, **kwargs):
+    """Names, avatars and account flags appear on both job and freelancer pages"""
+    if created or (update_fields is not None and set(update_fields) <= LOGIN_BOOKKEEPING_FIELDS):
+        return
+    bump_namespace('job_pages', 'freelancer_pages')
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=Client)
+@receiver(post_delete, sender=Client)
+@receiver(post_save, sender=Freelancer)
+@receiver(post_delete, sender=Freelancer)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_detail_pages(sender, instance, **kwargs):
+    """
+    Detail payloads are versioned by the rows they were rendered from; login
+    saves count too, as the freelancer page shows last_login.
+    """
+    bump_objects(sender._meta.model_name, [instance.pk])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_auth_user(sender, instance, **kwargs):
+    """Any user save (profile edits, deactivation, set_password() + save()) refreshes the auth cache"""
+    invalidate_cached_user(instance.pk)
+
+
+@receiver(post_save, sender=Client)
+@receiver(post_delete, sender=Client)
+@receiver(post_save, sender=Freelancer)
+@receiver(post_delete, sender=Freelancer)
+@receiver(post_save, sender=AdminProfile)
+@receiver(post_delete, sender=AdminProfile)
+def invalidate_auth_user_profiles(sender, instance, **kwargs):
+    """The cached user carries its role-profile ids"""
+    invalidate_cached_user(instance.user_id)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def announce_blacklisted_token(sender, instance, created, **kwargs):
+    """Every process' blacklist filter learns the jti once the row is committed"""
+    if created:
+        jti = instance.token.jti
+        transaction.on_commit(lambda: publish_blacklisted(jti))
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_client_dashboard(sender, instance, **kwargs):
+    """Job counts by status"""
+    invalidate_dashboard_stats(client_ids=[instance.client_id])
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+@receiver(post_delete, sender=ChatThread)
+def invalidate_participant_dashboards(sender, instance, **kwargs):
+    """Amounts spent and earned, and unread messages of a deleted thread"""
+    invalidate_dashboard_stats(client_ids=[instance.client_id], freelancer_ids=[instance.freelancer_id])
+
+
+@receiver(post_save, sender=ChatMessage)
+def invalidate_unread_message_dashboards(sender, instance, **kwargs):
+    """ChatMessage.save() loads the thread, so its participants are at hand"""
+    thread = instance.thread
+    invalidate_dashboard_stats(client_ids=[thread.client_id], freelancer_ids=[thread.freelancer_id])
+
+
+@receiver(post_delete, sender=ChatMessage)
+def invalidate_deleted_message_dashboards(sender, instance, **kwargs):
+    """Messages deleted with their thread are covered by the thread's receiver"""
+    if not instance.is_read and ChatMessage.thread.is_cached(instance):
+        thread = instance.thread
+        invalidate_dashboard_stats(client_ids=[thread.client_id], freelancer_ids=[thread.freelancer_id])
@@ -0,0 +1,133 @@
+"""
+Skill tag parsing, normalization and filtering helpers
+"""
+
+import json
+
+from django.db.models import Count
+
+from .models import Skill
+
+SKILL_NAME_MAX_LENGTH = 100
+
+
+def normalize_skill(name):
+    """Lowercase and collapse whitespace so 'React  JS' and 'react js' share a tag"""
+    return ' '.join(name.split()).lower()[:SKILL_NAME_MAX_LENGTH]
+
+
+def parse_skills(raw):
+    """
+    Parse a free-text skills value (comma-separated or JSON array) into a
+    de-duplicated list of display names, preserving the first spelling seen.
+    """
+    if not raw:
+        return []
+
+    items = None
+    if raw.lstrip().startswith('['):
+        try:
+            items = json.loads(raw)
+        except ValueError:
+            items = None
+    if not isinstance(items, list):
+        items = raw.split(',')
+
+    names = []
+    seen = set()
+    for item in items:
+        name = ' '.join(str(item).split())[:SKILL_NAME_MAX_LENGTH]
+        key = normalize_skill(name)
+        if key and key not in seen:
+            seen.add(key)
+            names.append(name)
+    return names
+
+
+def get_or_create_skills(names):
+    """
+    Resolve display names to Skill rows, creating any that are missing.
+    Returns a dict of normalized name -> Skill.
+    """
+    wanted = {}
+    for name in names:
+        wanted.setdefault(normalize_skill(name), name)
+    if not wanted:
+        return {}
+
+    skills = {skill.normalized_name: skill for skill in Skill.objects.filter(normalized_name__in=wanted)}
+    missing = [
+        Skill(name=name, normalized_name=key)
+        for key, name in wanted.items()
+        if key not in skills
+    ]
+    if missing:
+        # Concurrent writers may create the same tag; re-read instead of failing
+        Skill.objects.bulk_create(missing, ignore_conflicts=True)
+        skills.update({
+            skill.normalized_name: skill
+            for skill in Skill.objects.filter(normalized_name__in=[s.normalized_name for s in missing])
+        })
+    return skills
+
+
+def sync_skill_tags(instance):
+    """Rebuild the skill_tags links of a Job or Freelancer from its skills text"""
+    names = parse_skills(instance.skills)
+    skills = get_or_create_skills(names)
+    instance.skill_tags.set([skills[normalize_skill(name)] for name in names])
+
+
+def bulk_sync_skill_tags(model, rows):
+    """
+    Link many Job or Freelancer rows to their skill tags in one pass.
+    ``rows`` is an iterable of (pk, skills text); existing links are kept.
+    """
+    parsed = [(pk, parse_skills(raw)) for pk, raw in rows]
+    skills = get_or_create_skills([name for _, names in parsed for name in names])
+    through = model.skill_tags.through
+    owner_field = f'{model._meta.model_name}_id'
+    through.objects.bulk_create(
+        [
+            through(**{owner_field: pk, 'skill_id': skills[normalize_skill(name)].pk})
+            for pk, names in parsed
+            for name in names
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def skill_names(instance):
+    """
+    Skill display names for a Job or Freelancer.
+
+    Reads the (ideally prefetched) skill_tags and falls back to parsing the
+    text field for rows the backfill has not reached yet.
+    """
+    tags = [skill.name for skill in instance.skill_tags.all()]
+    return tags or parse_skills(instance.skills)
+
+
+def filter_by_skills(queryset, names, match='any'):
+    """
+    Restrict a Job or Freelancer queryset to rows tagged with any (or all) of
+    the given skills, using the (skill_id, owner_id) link table index.
+    """
+    keys = {normalize_skill(name) for name in names} - {''}
+    if not keys:
+        return queryset
+
+    through = queryset.model.skill_tags.through
+    owner_field = f'{queryset.model._meta.model_name}_id'
+    skill_ids = list(Skill.objects.filter(normalized_name__in=keys).values_list('id', flat=True))
+
+    if match == 'all':
+        if len(skill_ids) < len(keys):
+            return queryset.none()
+        owners = through.objects.filter(skill_id__in=skill_ids).values(owner_field).annotate(
+            matched=Count('skill_id')
+        ).filter(matched=len(skill_ids)).values(owner_field)
+    else:
+        owners = through.objects.filter(skill_id__in=skill_ids).values(owner_field)
+
+    return queryset.filter(pk__in=owners)
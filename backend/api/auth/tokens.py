@@ -0,0 +1,148 @@
+"""
+JWT tokens carrying the user's role and profile ids.
+
+Tokens minted at login and on refresh carry three extra claims:
+
+    role            the user's role ('client', 'freelancer' or 'admin')
+    client_id       primary key of the client profile, or null
+    freelancer_id   primary key of the freelancer profile, or null
+
+so hot views can filter by foreign key id straight from the token, without
+loading the User row or following ``user.client_profile``. The claims are
+re-stamped from the user cache on every refresh; a profile created after
+login therefore shows up in the next access token at the latest, and
+request_identity() falls back to the user for tokens that predate it.
+"""
+
+from typing import NamedTuple, Optional
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .authentication import get_cached_user_entry
+from .blacklist import might_be_blacklisted
+
+ROLE_CLAIMS = ('role', 'client_id', 'freelancer_id')
+
+
+def _profile_id(profile):
+    return profile.pk if profile is not None else None
+
+
+def role_claims(user):
+    """{claim: value} for a user instance"""
+    return {
+        'role': user.role,
+        'client_id': _profile_id(getattr(user, 'client_profile', None)),
+        'freelancer_id': _profile_id(getattr(user, 'freelancer_profile', None)),
+    }
+
+
+def _entry_claims(entry):
+    """{claim: value} for a cached user entry (see api.auth.authentication)"""
+    profiles = entry['profiles']
+    return {
+        'role': entry['fields']['role'],
+        'client_id': (profiles['client_profile'] or {}).get('id'),
+        'freelancer_id': (profiles['freelancer_profile'] or {}).get('id'),
+    }
+
+
+class RoleRefreshToken(RefreshToken):
+    """RefreshToken whose access tokens carry the role claims"""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim, value in role_claims(user).items():
+            token[claim] = value
+        return token
+
+    def stamp_role_claims(self):
+        """Refresh the role claims from the user cache; no-op for unknown users"""
+        try:
+            entry = get_cached_user_entry(int(self[api_settings.USER_ID_CLAIM]))
+        except (KeyError, TypeError, ValueError):
+            return
+        if entry is not None:
+            for claim, value in _entry_claims(entry).items():
+                self[claim] = value
+
+    def check_blacklist(self):
+        # The in-process filter rules most tokens out without a query
+        if might_be_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
+
+    def blacklist(self):
+        blacklisted, created = super().blacklist()
+        if not created:
+            # Blacklisted since check_blacklist() (or missed by the filter): refuse to
+            # rotate it again, so a token never yields two pairs
+            raise TokenError(_("Token is blacklisted"))
+        return blacklisted, created
+
+    @property
+    def access_token(self):
+        # The refresh token keeps the stamped claims, so a rotated token carries them too
+        self.stamp_role_claims()
+        return super().access_token
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    """TokenRefreshSerializer issuing RoleRefreshToken pairs"""
+    token_class = RoleRefreshToken
+
+
+class TokenIdentity(NamedTuple):
+    user_id: int
+    role: str
+    client_id: Optional[int]
+    freelancer_id: Optional[int]
+
+    @property
+    def is_client(self):
+        return self.role == 'client'
+
+    @property
+    def is_freelancer(self):
+        return self.role == 'freelancer'
+
+    @property
+    def is_admin(self):
+        return self.role == 'admin'
+
+
+def token_identity(token):
+    """TokenIdentity from a validated token, or None when it lacks the role claims"""
+    if token is None or any(claim not in token for claim in ROLE_CLAIMS):
+        return None
+    try:
+        user_id = int(token[api_settings.USER_ID_CLAIM])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return TokenIdentity(user_id, token['role'], token['client_id'], token['freelancer_id'])
+
+
+def request_identity(request):
+    """
+    Role and profile ids of the authenticated user.
+
+    Read from the access token's claims when present. Tokens issued before the
+    claims existed, or before the user's role profile was created, fall back
+    to the user and its cached profiles.
+    """
+    identity = token_identity(request.auth)
+    if identity is not None:
+        missing_profile = (
+            (identity.is_client and identity.client_id is None)
+            or (identity.is_freelancer and identity.freelancer_id is None)
+        )
+        if not missing_profile:
+            return identity
+
+    user = request.user
+    claims = role_claims(user)
+    return TokenIdentity(user.pk, claims['role'], claims['client_id'], claims['freelancer_id'])
@@ -3,8 +3,6 @@ from rest_framework_simplejwt.views import TokenVerifyView
 
 from .views import (
     RegisterAPIView,
-    LoginAPIView,
-    AdminLoginAPIView,
     LogoutAPIView,
     ProfileAPIView,
     PasswordChangeAPIView,
@@ -23,7 +21,12 @@ from .views import (
     AllJobsAPIView,
     AllFreelancersAPIView,
     JobDetailAPIView,
+    JobBatchAPIView,
     FreelancerDetailAPIView,
+    FreelancerBatchAPIView,
+    ListingExportAPIView,
+    JobMatchesAPIView,
+    JobFeedAPIView,
     # Admin views
     AdminOverviewAPIView,
     AdminJobModerationAPIView,
@@ -35,6 +38,11 @@ from .views import (
     AdminDisputeDismissAPIView,
     AdminPaymentsAPIView,
     AdminAnalyticsAPIView,
+    AdminCacheStatsAPIView,
+    AdminLoginMetricsAPIView,
+    AdminUserImportAPIView,
+    AsyncLoginView,
+    AsyncAdminLoginView,
 )
 
 app_name = 'auth'
@@ -42,11 +50,11 @@ app_name = 'auth'
 urlpatterns = [
     # Authentication endpoints
     path('register/', RegisterAPIView.as_view(), name='register'),
-    path('login/', LoginAPIView.as_view(), name='login'),
+    path('login/', AsyncLoginView.as_view(), name='login'),
     path('logout/', LogoutAPIView.as_view(), name='logout'),
     
     # Admin authentication
-    path('admin/login/', AdminLoginAPIView.as_view(), name='admin_login'),
+    path('admin/login/', AsyncAdminLoginView.as_view(), name='admin_login'),
     
     # Profile management (unified endpoint handles both user and role-specific profiles)
     path('profile/', ProfileAPIView.as_view(), name='profile'),
@@ -79,8 +87,14 @@ urlpatterns = [
     # Public listing endpoints
     path('jobs/', AllJobsAPIView.as_view(), name='all_jobs'),
     path('jobs/<int:job_id>/', JobDetailAPIView.as_view(), name='job_detail'),
+    path('jobs/batch/', JobBatchAPIView.as_view(), name='job_batch'),
+    path('jobs/<int:job_id>/matches/', JobMatchesAPIView.as_view(), name='job_matches'),
+    path('jobs/feed/', JobFeedAPIView.as_view(), name='job_feed'),
     path('freelancers/', AllFreelancersAPIView.as_view(), name='all_freelancers'),
     path('freelancers/<int:freelancer_id>/', FreelancerDetailAPIView.as_view(), name='freelancer_detail'),
+    path('freelancers/batch/', FreelancerBatchAPIView.as_view(), name='freelancer_batch'),
+    path('export/', ListingExportAPIView.as_view(), name='listing_export'),
+    path('export/<str:name>', ListingExportAPIView.as_view(), name='listing_export_file'),
     
     # Admin endpoints
     path('admin/overview/', AdminOverviewAPIView.as_view(), name='admin_overview'),
@@ -88,9 +102,12 @@ urlpatterns = [
     path('admin/jobs/<int:job_id>/approve/', AdminJobApproveAPIView.as_view(), name='admin_job_approve'),
     path('admin/jobs/<int:job_id>/reject/', AdminJobRejectAPIView.as_view(), name='admin_job_reject'),
     path('admin/users/', AdminUsersAPIView.as_view(), name='admin_users'),
+    path('admin/users/import/', AdminUserImportAPIView.as_view(), name='admin_users_import'),
     path('admin/disputes/', AdminDisputesAPIView.as_view(), name='admin_disputes'),
     path('admin/disputes/<int:dispute_id>/resolve/', AdminDisputeResolveAPIView.as_view(), name='admin_dispute_resolve'),
     path('admin/disputes/<int:dispute_id>/dismiss/', AdminDisputeDismissAPIView.as_view(), name='admin_dispute_dismiss'),
     path('admin/payments/', AdminPaymentsAPIView.as_view(), name='admin_payments'),
     path('admin/analytics/', AdminAnalyticsAPIView.as_view(), name='admin_analytics'),
+    path('admin/cache-stats/', AdminCacheStatsAPIView.as_view(), name='admin_cache_stats'),
+    path('admin/login-metrics/', AdminLoginMetricsAPIView.as_view(), name='admin_login_metrics'),
 ]
\ No newline at end of file
@@ -1,14 +1,25 @@
+import io
+import itertools
+import json
+
+from asgiref.sync import sync_to_async
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.views import TokenRefreshView
-from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
+from rest_framework_simplejwt.exceptions import TokenError
+from django.conf import settings
 from django.contrib.auth import update_session_auth_hash
+from django.http import JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
 
-from .models import User, Freelancer, Client, ChatThread, ChatMessage, Job
+from .models import User, Freelancer, Client, ChatThread, ChatMessage, Job, JobFeedEntry
 from payment.models import Payment
 from django.db import models
 from .serializers import (
@@ -21,6 +32,22 @@ from .serializers import (
     TokenSerializer
     , FreelancerCreateSerializer, FreelancerSerializer, ClientCreateSerializer, ClientSerializer
 )
+from .activity import record_login
+from .dashboard import dashboard_stats
+from .details import InvalidIds, freelancer_detail, freelancer_details, job_detail, job_details, parse_ids
+from .facets import job_facets
+from .feed import schedule_fan_out
+from .imports import IMPORT_FORMATS, ImportFormatError, detect_format, import_users, read_rows
+from .listings import FREELANCER_CARD_FIELDS, JOB_CARD_FIELDS, freelancer_listing_rows, job_listing_rows
+from .login import PoolSaturated, authenticate_credentials, login_metrics, reset_login_metrics
+from .matching import DEFAULT_MATCH_LIMIT, MAX_MATCH_LIMIT, recommend_freelancers
+from .refresh import coalesced_refresh
+from .search import search_freelancers, search_jobs, search_variants
+from .skills import filter_by_skills
+from .tokens import RoleRefreshToken, RoleTokenRefreshSerializer, request_identity
+from api.common.cache import cache_response, cache_stats, conditional_response, filter_signature, reset_cache_stats
+from api.common.fieldsets import InvalidFields, requested_fields, trim_fields
+from api.common.pagination import PAGINATION_PARAMS, CursorPaginator, InvalidCursor
 from api.common.responses import StandardResponseMixin, get_client_ip
 from api.common.permissions import IsAdminUser
 
@@ -38,11 +65,8 @@ class RegisterAPIView(APIView, StandardResponseMixin):
         serializer = UserRegistrationSerializer(data=request.data)
         
         if serializer.is_valid():
-            user = serializer.save()
-            
-            # Log the registration IP
-            user.last_login_ip = get_client_ip(request)
-            user.save(update_fields=['last_login_ip'])
+            # Log the registration IP with the same INSERT
+            user = serializer.save(last_login_ip=get_client_ip(request))
             
             # Return simplified user data
             user_data = {
@@ -65,92 +89,105 @@ class RegisterAPIView(APIView, StandardResponseMixin):
         }, status=status.HTTP_400_BAD_REQUEST)
 
 
-class LoginAPIView(APIView, StandardResponseMixin):
+def _login_response_data(user, ip):
+    """Record the login and mint the token pair (sync: touches the database)"""
+    record_login(user, ip, timezone.now())
+    refresh = RoleRefreshToken.for_user(user)
+    return {
+        'access': str(refresh.access_token),
+        'refresh': str(refresh),
+        'user': UserProfileSerializer(user).data
+    }
+
+
+class AsyncJSONView(View):
     """
-    API endpoint for user login
+    Base for async endpoints: a JSON or form body in, the
+    StandardResponseMixin response format out.
     """
-    permission_classes = [AllowAny]
     
-    def post(self, request):
-        """
-        Authenticate user and return JWT tokens
-        """
-        serializer = UserLoginSerializer(data=request.data)
-        
-        if serializer.is_valid():
-            user = serializer.validated_data['user']
-            
-            # Update last login and IP
-            user.last_login = timezone.now()
-            user.last_login_ip = get_client_ip(request)
-            user.save(update_fields=['last_login', 'last_login_ip'])
-            
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
-            access = refresh.access_token
-            
-            # Prepare response data
-            response_data = {
-                'access': str(access),
-                'refresh': str(refresh),
-                'user': UserProfileSerializer(user).data
-            }
-            
-            return self.success_response(
-                message="Login successful",
-                data=response_data,
-                status_code=status.HTTP_200_OK
-            )
-        
-        return self.error_response(
-            message="Login failed",
-            errors=serializer.errors,
-            status_code=status.HTTP_401_UNAUTHORIZED
-        )
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Token-authenticated API: no session, so no CSRF check (as APIView)
+        return csrf_exempt(super().as_view(**initkwargs))
+    
+    def parse_body(self, request):
+        """The request data; raises ValueError on malformed JSON"""
+        if request.content_type == 'application/json':
+            return json.loads(request.body or b'{}')
+        return request.POST
+    
+    def respond(self, success, message, status_code, data=None, errors=None):
+        body = {'success': success, 'message': message}
+        if data is not None:
+            body['data'] = data
+        if errors is not None:
+            body['errors'] = errors
+        return JsonResponse(body, status=status_code, encoder=DRFJSONEncoder)
 
 
-class AdminLoginAPIView(APIView, StandardResponseMixin):
+class AsyncLoginView(AsyncJSONView):
     """
-    API endpoint for admin-only login
+    API endpoint for user login (async)
+    
+    Passwords are verified on the bounded hashing pool (api.auth.login), so a
+    burst of logins queues there instead of on the thread that serves every
+    sync view; once that queue is full, logins are shed with 503.
     """
-    permission_classes = [AllowAny]
+    serializer_class = UserLoginSerializer
+    success_message = "Login successful"
+    failure_message = "Login failed"
+    failure_status = status.HTTP_401_UNAUTHORIZED
     
-    def post(self, request):
+    def fail(self, errors, status_code=None):
+        return self.respond(False, self.failure_message, status_code or self.failure_status, errors=errors)
+    
+    async def post(self, request):
         """
-        Authenticate admin user and return JWT tokens
+        Authenticate user and return JWT tokens
         """
-        serializer = AdminLoginSerializer(data=request.data)
+        try:
+            data = self.parse_body(request)
+        except ValueError:
+            return self.fail({'detail': 'JSON parse error'}, status.HTTP_400_BAD_REQUEST)
         
-        if serializer.is_valid():
-            user = serializer.validated_data['user']
-            
-            # Update last login and IP
-            user.last_login = timezone.now()
-            user.last_login_ip = get_client_ip(request)
-            user.save(update_fields=['last_login', 'last_login_ip'])
-            
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
-            access = refresh.access_token
-            
-            # Prepare response data
-            response_data = {
-                'access': str(access),
-                'refresh': str(refresh),
-                'user': UserProfileSerializer(user).data
-            }
-            
-            return self.success_response(
-                message="Admin login successful",
-                data=response_data,
-                status_code=status.HTTP_200_OK
+        serializer = self.serializer_class(data=data)
+        try:
+            # Field validation only; the credentials are checked below, off the event loop
+            attrs = serializer.to_internal_value(data)
+        except ValidationError as e:
+            return self.fail(e.detail)
+        
+        try:
+            user = await authenticate_credentials(attrs['username'], attrs['password'], request)
+        except PoolSaturated:
+            response = self.respond(
+                False,
+                "Too many login attempts in progress. Please retry shortly.",
+                status.HTTP_503_SERVICE_UNAVAILABLE
             )
+            response['Retry-After'] = '1'
+            return response
         
-        return self.error_response(
-            message="Admin login failed",
-            errors=serializer.errors,
-            status_code=status.HTTP_403_FORBIDDEN
-        )
+        try:
+            if not user:
+                raise ValidationError("Invalid credentials.")
+            serializer.validate_user(user)
+        except ValidationError as e:
+            return self.fail({api_settings.NON_FIELD_ERRORS_KEY: e.detail})
+        
+        response_data = await sync_to_async(_login_response_data)(user, get_client_ip(request))
+        return self.respond(True, self.success_message, status.HTTP_200_OK, data=response_data)
+
+
+class AsyncAdminLoginView(AsyncLoginView):
+    """
+    API endpoint for admin-only login (async)
+    """
+    serializer_class = AdminLoginSerializer
+    success_message = "Admin login successful"
+    failure_message = "Admin login failed"
+    failure_status = status.HTTP_403_FORBIDDEN
 
 
 class LogoutAPIView(APIView, StandardResponseMixin):
@@ -499,27 +536,43 @@ class CreateRoleProfileAPIView(APIView, StandardResponseMixin):
         return ProfileAPIView().post(request)
 
 
-class CustomTokenRefreshView(TokenRefreshView, StandardResponseMixin):
+class CustomTokenRefreshView(AsyncJSONView):
     """
     Custom token refresh view with standardized response
+    
+    Concurrent refreshes of one token (several tabs reconnecting) share a
+    single rotation; see api.auth.refresh. The view is async, so a request
+    waiting for another worker's rotation does not hold a thread.
     """
     
-    def post(self, request, *args, **kwargs):
+    async def post(self, request):
         """
         Refresh JWT token with custom response format
         """
-        serializer = self.get_serializer(data=request.data)
-        
         try:
+            data = self.parse_body(request)
+        except ValueError as e:
+            return self.respond(False, f"JSON parse error - {e}", status.HTTP_400_BAD_REQUEST, errors={})
+        
+        serializer = RoleTokenRefreshSerializer(data=data)
+        
+        @sync_to_async
+        def rotate():
             serializer.is_valid(raise_exception=True)
+            return dict(serializer.validated_data)
+        
+        try:
+            raw = data.get('refresh') if hasattr(data, 'get') else None
+            data = await coalesced_refresh(raw, rotate)
+        except ValidationError as e:
+            field, errors = next(iter(e.detail.items()))
+            return self.respond(False, f"{field}: {errors[0]}", status.HTTP_400_BAD_REQUEST, errors=e.detail)
         except TokenError as e:
-            raise InvalidToken(e.args[0])
+            response = self.respond(False, str(e.args[0]), status.HTTP_401_UNAUTHORIZED, errors={})
+            response['WWW-Authenticate'] = 'Bearer realm="api"'
+            return response
         
-        return self.success_response(
-            message="Token refreshed successfully",
-            data=serializer.validated_data,
-            status_code=status.HTTP_200_OK
-        )
+        return self.respond(True, "Token refreshed successfully", status.HTTP_200_OK, data=data)
 
 
 # ---------------------- DASHBOARD VIEWS -------------------------
@@ -545,43 +598,10 @@ class DashboardAPIView(APIView, StandardResponseMixin):
                 'role': user.role,
                 'profile_picture': user.profile_picture,
             },
-            'stats': {}
+            # One query per role, cached until a job, payment or chat message of the user changes
+            'stats': dashboard_stats(request_identity(request))
         }
         
-        if user.is_client:
-            client_profile = getattr(user, 'client_profile', None)
-            if client_profile:
-                # Get client stats - filter by actual job status
-                total_jobs_posted = client_profile.jobs.filter(status='open').count()
-                active_jobs = client_profile.jobs.filter(status='in_progress').count()  # Using 'in_progress' as that's what exists in the model
-                completed_jobs = client_profile.jobs.filter(status='completed').count()
-                total_spent = client_profile.payments.filter(status='completed').aggregate(
-                    total=models.Sum('amount')
-                )['total'] or 0
-                
-                data['stats'] = {
-                    'total_jobs_posted': total_jobs_posted,
-                    'active_jobs': active_jobs,
-                    'completed_jobs': completed_jobs,
-                    'total_spent': float(total_spent),
-                    'unread_messages': 0  # TODO: implement message counts
-                }
-        
-        elif user.is_freelancer:
-            freelancer_profile = getattr(user, 'freelancer_profile', None)
-            if freelancer_profile:
-                # Get freelancer stats
-                total_earned = freelancer_profile.payments.filter(status='completed').aggregate(
-                    total=models.Sum('amount')
-                )['total'] or 0
-                
-                data['stats'] = {
-                    'total_earned': float(total_earned),
-                    'active_jobs': 0,  # TODO: implement when job applications are added
-                    'completed_jobs': freelancer_profile.payments.filter(status='completed').count(),
-                    'unread_messages': 0  # TODO: implement message counts
-                }
-        
         return self.success_response(
             message="Dashboard data retrieved successfully",
             data=data
@@ -600,17 +620,16 @@ class JobCreateAPIView(APIView, StandardResponseMixin):
         """
         Create a new job posting
         """
-        user = request.user
+        identity = request_identity(request)
         
         # Check if user is a client
-        if not user.is_client:
+        if not identity.is_client:
             return self.error_response(
                 message="Only clients can create job postings",
                 status_code=status.HTTP_403_FORBIDDEN
             )
         
-        client_profile = getattr(user, 'client_profile', None)
-        if not client_profile:
+        if not identity.client_id:
             return self.error_response(
                 message="Client profile not found. Please complete your profile setup.",
                 status_code=status.HTTP_400_BAD_REQUEST
@@ -631,7 +650,7 @@ class JobCreateAPIView(APIView, StandardResponseMixin):
         
         try:
             job = Job.objects.create(
-                client=client_profile,
+                client_id=identity.client_id,
                 title=job_data.get('title'),
                 description=job_data.get('description'),
                 budget_min=job_data.get('budget_min'),
@@ -796,13 +815,14 @@ class PaymentHistoryAPIView(APIView, StandardResponseMixin):
         """
         Get payment history based on user role
         """
-        user = request.user
+        identity = request_identity(request)
         payments_data = []
         
-        if user.is_client:
-            client_profile = getattr(user, 'client_profile', None)
-            if client_profile:
-                payments = client_profile.payments.all().order_by('-created_at')
+        if identity.is_client:
+            if identity.client_id:
+                payments = Payment.objects.filter(client_id=identity.client_id).select_related(
+                    'job', 'freelancer__user'
+                ).order_by('-created_at')
                 for payment in payments:
                     payments_data.append({
                         'id': payment.id,
@@ -824,10 +844,11 @@ class PaymentHistoryAPIView(APIView, StandardResponseMixin):
                         'type': 'payment_made'
                     })
         
-        elif user.is_freelancer:
-            freelancer_profile = getattr(user, 'freelancer_profile', None)
-            if freelancer_profile:
-                payments = freelancer_profile.payments.all().order_by('-created_at')
+        elif identity.is_freelancer:
+            if identity.freelancer_id:
+                payments = Payment.objects.filter(freelancer_id=identity.freelancer_id).select_related(
+                    'job', 'client__user'
+                ).order_by('-created_at')
                 for payment in payments:
                     payments_data.append({
                         'id': payment.id,
@@ -876,13 +897,14 @@ class InboxAPIView(APIView, StandardResponseMixin):
         """
         Get all chat threads where user is participant
         """
-        user = request.user
+        identity = request_identity(request)
         threads_data = []
         
-        if user.is_client:
-            client_profile = getattr(user, 'client_profile', None)
-            if client_profile:
-                threads = client_profile.chat_threads.all().order_by('-created_at')
+        if identity.is_client:
+            if identity.client_id:
+                threads = ChatThread.objects.filter(client_id=identity.client_id).select_related(
+                    'freelancer__user', 'job'
+                ).order_by('-created_at')
                 for thread in threads:
                     # Get last message
                     last_message = thread.messages.last()
@@ -908,10 +930,11 @@ class InboxAPIView(APIView, StandardResponseMixin):
                         'unread_count': 0  # TODO: implement unread message counting
                     })
         
-        elif user.is_freelancer:
-            freelancer_profile = getattr(user, 'freelancer_profile', None)
-            if freelancer_profile:
-                threads = freelancer_profile.chat_threads.all().order_by('-created_at')
+        elif identity.is_freelancer:
+            if identity.freelancer_id:
+                threads = ChatThread.objects.filter(freelancer_id=identity.freelancer_id).select_related(
+                    'client__user', 'job'
+                ).order_by('-created_at')
                 for thread in threads:
                     # Get last message
                     last_message = thread.messages.last()
@@ -1113,22 +1136,30 @@ class AllJobsAPIView(APIView, StandardResponseMixin):
     """
     permission_classes = [AllowAny]
     
+    @cache_response('job_pages')
     def get(self, request):
         """
         Get all open job listings with filtering and pagination
         """
         try:
-            # Start with open jobs by default
-            jobs = Job.objects.filter(status='open').select_related('client__user').order_by('-created_at')
+            # Sparse fieldsets: ?fields=title,budget_min,... or the compact ?fields=card preset
+            from .serializers import JobListingSerializer
+            fields = requested_fields(request, JobListingSerializer.Meta.fields, presets={'card': JOB_CARD_FIELDS})
+            card = request.GET.get('fields', '').strip() == 'card'
+            
+            # Start with open jobs by default; only keys are read here, cards come from the listing projection
+            jobs = Job.objects.filter(status='open').only('id', 'created_at').order_by('-created_at')
             
             # Apply filters from query parameters
             category = request.GET.get('category')
             if category:
                 jobs = jobs.filter(category__icontains=category)
             
+            # Skill tags: ?skills=react,django&skills_match=any|all
             skills = request.GET.get('skills')
             if skills:
-                jobs = jobs.filter(skills__icontains=skills)
+                skills_match = request.GET.get('skills_match', 'any')
+                jobs = filter_by_skills(jobs, skills.split(','), match=skills_match)
             
             status_param = request.GET.get('status')
             if status_param:
@@ -1148,34 +1179,46 @@ class AllJobsAPIView(APIView, StandardResponseMixin):
                 except ValueError:
                     pass
             
-            # Pagination
-            page = int(request.GET.get('page', 1))
-            page_size = int(request.GET.get('page_size', 20))
-            start = (page - 1) * page_size
-            end = start + page_size
+            # Full-text search over title, skills, description and requirements (ranked)
+            search_term = request.GET.get('q', '').strip()
+            if search_term:
+                jobs = search_jobs(jobs, search_term)
+            
+            # Sorting: newest first by default; ?ordering=proposals_count lists jobs with the fewest proposals first
+            ordering = request.GET.get('ordering', '-created_at')
+            if ordering not in ['-created_at', 'created_at', 'proposals_count']:
+                ordering = '-created_at'
+            if search_term:
+                ordering = '-rank'
+            
+            # Keyset pagination on (ordering field, id), or on (rank, id) when searching
+            paginator = CursorPaginator(request, ordering=ordering, count_namespace='jobs')
+            jobs_page, pagination = paginator.paginate(jobs)
+            
+            # Serialize the jobs from their precomputed listing rows
+            rows = job_listing_rows(jobs_page, fields=fields, excerpt=card)
+            serializer = JobListingSerializer(rows, many=True, fields=fields)
             
-            total_count = jobs.count()
-            jobs_page = jobs[start:end]
+            response_data = {
+                'jobs': serializer.data,
+                'pagination': pagination
+            }
             
-            # Serialize the jobs
-            from .serializers import JobListSerializer
-            serializer = JobListSerializer(jobs_page, many=True)
+            # Optional facets (category, budget, duration) for the current filter set
+            if request.GET.get('facets', '').lower() in ('1', 'true', 'yes'):
+                signature = filter_signature(request.GET, exclude=PAGINATION_PARAMS + ('facets',))
+                response_data['facets'] = job_facets(jobs, signature)
             
             return self.success_response(
                 message="Jobs retrieved successfully",
-                data={
-                    'jobs': serializer.data,
-                    'pagination': {
-                        'current_page': page,
-                        'page_size': page_size,
-                        'total_count': total_count,
-                        'total_pages': (total_count + page_size - 1) // page_size,
-                        'has_next': end < total_count,
-                        'has_previous': page > 1
-                    }
-                }
+                data=response_data
             )
             
+        except (InvalidCursor, InvalidFields) as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving jobs: {str(e)}",
@@ -1190,26 +1233,38 @@ class AllFreelancersAPIView(APIView, StandardResponseMixin):
     """
     permission_classes = [AllowAny]
     
+    @cache_response('freelancer_pages')
     def get(self, request):
         """
         Get all freelancer profiles with filtering and pagination
         """
         try:
-            # Get all freelancers with user data
-            freelancers = Freelancer.objects.select_related('user').order_by('-created_at')
+            # Sparse fieldsets: ?fields=name,title,rate,... or the compact ?fields=card preset
+            from .serializers import FreelancerListingSerializer
+            fields = requested_fields(request, FreelancerListingSerializer.Meta.fields, presets={'card': FREELANCER_CARD_FIELDS})
+            card = request.GET.get('fields', '').strip() == 'card'
+            
+            # Only keys and sort columns are read here, cards come from the listing projection
+            freelancers = Freelancer.objects.only('id', 'created_at', 'rate').order_by('-created_at')
             
             # Apply filters from query parameters
             category = request.GET.get('category')
             if category:
                 freelancers = freelancers.filter(category__icontains=category)
             
+            # Skill tags: ?skills=react,django&skills_match=any|all
             skills = request.GET.get('skills')
             if skills:
-                freelancers = freelancers.filter(skills__icontains=skills)
+                skills_match = request.GET.get('skills_match', 'any')
+                freelancers = filter_by_skills(freelancers, skills.split(','), match=skills_match)
             
             location = request.GET.get('location')
             if location:
-                freelancers = freelancers.filter(location__icontains=location)
+                # "Bangalore" also matches "Bengaluru"
+                location_match = models.Q()
+                for variant in search_variants(location):
+                    location_match |= models.Q(location__icontains=variant)
+                freelancers = freelancers.filter(location_match)
             
             min_rate = request.GET.get('rate_min')
             if min_rate:
@@ -1227,37 +1282,36 @@ class AllFreelancersAPIView(APIView, StandardResponseMixin):
             
             # Ordering
             ordering = request.GET.get('ordering', '-created_at')
-            if ordering in ['-created_at', 'created_at', 'rate', '-rate']:
-                freelancers = freelancers.order_by(ordering)
+            if ordering not in ['-created_at', 'created_at', 'rate', '-rate']:
+                ordering = '-created_at'
             
-            # Pagination
-            page = int(request.GET.get('page', 1))
-            page_size = int(request.GET.get('page_size', 20))
-            start = (page - 1) * page_size
-            end = start + page_size
+            # Typo-tolerant trigram search over title, location and category (ranked)
+            search_term = request.GET.get('q', '').strip()
+            if search_term:
+                freelancers = search_freelancers(freelancers, search_term)
+                ordering = '-similarity'
             
-            total_count = freelancers.count()
-            freelancers_page = freelancers[start:end]
+            # Keyset pagination on (ordering field, id), or on (similarity, id) when searching
+            paginator = CursorPaginator(request, ordering=ordering, count_namespace='freelancers')
+            freelancers_page, pagination = paginator.paginate(freelancers)
             
-            # Serialize the freelancers
-            from .serializers import FreelancerListSerializer
-            serializer = FreelancerListSerializer(freelancers_page, many=True)
+            # Serialize the freelancers from their precomputed listing rows
+            rows = freelancer_listing_rows(freelancers_page, fields=fields, excerpt=card)
+            serializer = FreelancerListingSerializer(rows, many=True, fields=fields)
             
             return self.success_response(
                 message="Freelancers retrieved successfully",
                 data={
                     'freelancers': serializer.data,
-                    'pagination': {
-                        'current_page': page,
-                        'page_size': page_size,
-                        'total_count': total_count,
-                        'total_pages': (total_count + page_size - 1) // page_size,
-                        'has_next': end < total_count,
-                        'has_previous': page > 1
-                    }
+                    'pagination': pagination
                 }
             )
             
+        except (InvalidCursor, InvalidFields) as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving freelancers: {str(e)}",
@@ -1362,14 +1416,9 @@ class AdminJobModerationAPIView(APIView, StandardResponseMixin):
         try:
             jobs = Job.objects.filter(status='pending').select_related('client__user').order_by('-created_at')
             
-            # Pagination
-            page = int(request.GET.get('page', 1))
-            page_size = int(request.GET.get('page_size', 20))
-            start = (page - 1) * page_size
-            end = start + page_size
-            
-            total_count = jobs.count()
-            jobs_page = jobs[start:end]
+            # Keyset pagination on (created_at, id)
+            paginator = CursorPaginator(request)
+            jobs_page, pagination = paginator.paginate(jobs)
             
             jobs_data = []
             for job in jobs_page:
@@ -1395,17 +1444,15 @@ class AdminJobModerationAPIView(APIView, StandardResponseMixin):
                 message="Pending jobs retrieved successfully",
                 data={
                     'jobs': jobs_data,
-                    'pagination': {
-                        'current_page': page,
-                        'page_size': page_size,
-                        'total_count': total_count,
-                        'total_pages': (total_count + page_size - 1) // page_size,
-                        'has_next': end < total_count,
-                        'has_previous': page > 1
-                    }
+                    'pagination': pagination
                 }
             )
             
+        except InvalidCursor as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving pending jobs: {str(e)}",
@@ -1428,6 +1475,9 @@ class AdminJobApproveAPIView(APIView, StandardResponseMixin):
             job.status = 'open'
             job.save()
             
+            # Fanned out into the "jobs for you" feeds of matching freelancers in the background
+            schedule_fan_out(job.id)
+            
             return self.success_response(
                 message=f"Job '{job.title}' approved successfully",
                 data={'job_id': job.id, 'status': job.status}
@@ -1495,14 +1545,9 @@ class AdminUsersAPIView(APIView, StandardResponseMixin):
             if role_filter and role_filter in ['freelancer', 'client', 'admin']:
                 users = users.filter(role=role_filter)
             
-            # Pagination
-            page = int(request.GET.get('page', 1))
-            page_size = int(request.GET.get('page_size', 20))
-            start = (page - 1) * page_size
-            end = start + page_size
-            
-            total_count = users.count()
-            users_page = users[start:end]
+            # Keyset pagination on (created_at, id)
+            paginator = CursorPaginator(request)
+            users_page, pagination = paginator.paginate(users)
             
             users_data = []
             for user in users_page:
@@ -1553,17 +1598,15 @@ class AdminUsersAPIView(APIView, StandardResponseMixin):
                 message="Users retrieved successfully",
                 data={
                     'users': users_data,
-                    'pagination': {
-                        'current_page': page,
-                        'page_size': page_size,
-                        'total_count': total_count,
-                        'total_pages': (total_count + page_size - 1) // page_size,
-                        'has_next': end < total_count,
-                        'has_previous': page > 1
-                    }
+                    'pagination': pagination
                 }
             )
             
+        except InvalidCursor as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving users: {str(e)}",
@@ -1593,14 +1636,9 @@ class AdminDisputesAPIView(APIView, StandardResponseMixin):
             if status_filter and status_filter in ['open', 'resolved', 'dismissed']:
                 disputes = disputes.filter(status=status_filter)
             
-            # Pagination
-            page = int(request.GET.get('page', 1))
-            page_size = int(request.GET.get('page_size', 20))
-            start = (page - 1) * page_size
-            end = start + page_size
-            
-            total_count = disputes.count()
-            disputes_page = disputes[start:end]
+            # Keyset pagination on (created_at, id)
+            paginator = CursorPaginator(request)
+            disputes_page, pagination = paginator.paginate(disputes)
             
             disputes_data = []
             for dispute in disputes_page:
@@ -1632,17 +1670,15 @@ class AdminDisputesAPIView(APIView, StandardResponseMixin):
                 message="Disputes retrieved successfully",
                 data={
                     'disputes': disputes_data,
-                    'pagination': {
-                        'current_page': page,
-                        'page_size': page_size,
-                        'total_count': total_count,
-                        'total_pages': (total_count + page_size - 1) // page_size,
-                        'has_next': end < total_count,
-                        'has_previous': page > 1
-                    }
+                    'pagination': pagination
                 }
             )
             
+        except InvalidCursor as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving disputes: {str(e)}",
@@ -1762,14 +1798,9 @@ class AdminPaymentsAPIView(APIView, StandardResponseMixin):
             if date_to:
                 payments = payments.filter(created_at__lte=date_to)
             
-            # Pagination
-            page = int(request.GET.get('page', 1))
-            page_size = int(request.GET.get('page_size', 20))
-            start = (page - 1) * page_size
-            end = start + page_size
-            
-            total_count = payments.count()
-            payments_page = payments[start:end]
+            # Keyset pagination on (created_at, id)
+            paginator = CursorPaginator(request)
+            payments_page, pagination = paginator.paginate(payments)
             
             payments_data = []
             for payment in payments_page:
@@ -1802,17 +1833,15 @@ class AdminPaymentsAPIView(APIView, StandardResponseMixin):
                 message="Payments retrieved successfully",
                 data={
                     'payments': payments_data,
-                    'pagination': {
-                        'current_page': page,
-                        'page_size': page_size,
-                        'total_count': total_count,
-                        'total_pages': (total_count + page_size - 1) // page_size,
-                        'has_next': end < total_count,
-                        'has_previous': page > 1
-                    }
+                    'pagination': pagination
                 }
             )
             
+        except InvalidCursor as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving payments: {str(e)}",
@@ -1825,47 +1854,30 @@ class JobDetailAPIView(APIView, StandardResponseMixin):
     API endpoint to fetch job details by ID for public access
     """
     permission_classes = [AllowAny]
+    # Fields selectable with ?fields=
+    detail_fields = (
+        'id', 'title', 'description', 'budget_min', 'budget_max', 'duration', 'category', 'skills',
+        'skills_list', 'requirements', 'project_details', 'status', 'proposals_count', 'created_at', 'client',
+    )
     
     def get(self, request, job_id):
         """
         Get job details by ID
         """
         try:
-            # Get the job by ID, ensuring it's active/open
-            job = Job.objects.select_related('client__user').get(
-                id=job_id, 
-                status__in=['open', 'in_progress']  # Only show active jobs
-            )
+            fields = requested_fields(request, self.detail_fields)
             
-            # Prepare job data
-            job_data = {
-                'id': job.id,
-                'title': job.title,
-                'description': job.description,
-                'budget_min': float(job.budget_min) if job.budget_min else None,
-                'budget_max': float(job.budget_max) if job.budget_max else None,
-                'duration': job.duration,
-                'category': job.category,
-                'skills': job.skills,
-                'skills_list': [skill.strip() for skill in job.skills.split(',')] if job.skills else [],
-                'requirements': job.requirements,
-                'project_details': job.project_details,
-                'status': job.status,
-                'proposals_count': job.proposals_count,
-                'created_at': job.created_at.isoformat(),
-                'client': {
-                    'id': job.client.id,
-                    'name': f"{job.client.user.first_name} {job.client.user.last_name}".strip(),
-                    'username': job.client.user.username,
-                    'company_name': job.client.company_name or f"{job.client.user.first_name} {job.client.user.last_name}".strip(),
-                    'email': job.client.user.email,
-                    'created_at': job.client.user.date_joined.isoformat(),
-                }
-            }
+            # Rendered payload is cached per job (see api.auth.details)
+            job_data, hit = job_detail(job_id)
             
-            return self.success_response(
-                data=job_data,
-                message="Job details retrieved successfully"
+            return conditional_response(
+                request,
+                {
+                    'success': True,
+                    'message': "Job details retrieved successfully",
+                    'data': trim_fields(job_data, fields),
+                },
+                'HIT' if hit else 'MISS'
             )
             
         except Job.DoesNotExist:
@@ -1874,6 +1886,54 @@ class JobDetailAPIView(APIView, StandardResponseMixin):
                 status_code=status.HTTP_404_NOT_FOUND
             )
             
+        except InvalidFields as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error retrieving job details: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class JobBatchAPIView(APIView, StandardResponseMixin):
+    """
+    API endpoint to fetch several jobs by ID (?ids=1,2,3) for public access
+    """
+    permission_classes = [AllowAny]
+    detail_fields = JobDetailAPIView.detail_fields
+    
+    def get(self, request):
+        """
+        Get job details keyed by ID; inactive or unknown IDs are listed under 'missing'
+        """
+        try:
+            ids = parse_ids(request.GET.get('ids'))
+            fields = requested_fields(request, self.detail_fields)
+            
+            # One primary-key IN query for the whole batch
+            jobs = {
+                str(pk): trim_fields(data, fields)
+                for pk, data in job_details(ids).items()
+            }
+            
+            return self.success_response(
+                message="Job details retrieved successfully",
+                data={
+                    'jobs': jobs,
+                    'missing': [pk for pk in ids if str(pk) not in jobs]
+                }
+            )
+            
+        except (InvalidIds, InvalidFields) as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving job details: {str(e)}",
@@ -1886,43 +1946,31 @@ class FreelancerDetailAPIView(APIView, StandardResponseMixin):
     API endpoint to fetch freelancer details by ID for public access
     """
     permission_classes = [AllowAny]
+    # Fields selectable with ?fields=
+    detail_fields = (
+        'id', 'user_id', 'name', 'username', 'email', 'title', 'category', 'rate', 'skills', 'skills_list',
+        'bio', 'location', 'profile_picture', 'created_at', 'user_created_at', 'last_login', 'is_active',
+        'email_verified',
+    )
     
     def get(self, request, freelancer_id):
         """
         Get freelancer details by ID
         """
         try:
-            # Get the freelancer by ID with related user information
-            freelancer = Freelancer.objects.select_related('user').get(
-                id=freelancer_id,
-                user__is_active=True  # Only show active freelancers
-            )
-            
-            # Prepare freelancer data
-            freelancer_data = {
-                'id': freelancer.id,
-                'user_id': freelancer.user.id,
-                'name': f"{freelancer.user.first_name} {freelancer.user.last_name}".strip(),
-                'username': freelancer.user.username,
-                'email': freelancer.user.email,
-                'title': freelancer.title,
-                'category': freelancer.category,
-                'rate': float(freelancer.rate) if freelancer.rate else None,
-                'skills': freelancer.skills,
-                'skills_list': [skill.strip() for skill in freelancer.skills.split(',')] if freelancer.skills else [],
-                'bio': freelancer.bio,
-                'location': freelancer.location,
-                'profile_picture': freelancer.user.profile_picture,
-                'created_at': freelancer.created_at.isoformat(),
-                'user_created_at': freelancer.user.date_joined.isoformat(),
-                'last_login': freelancer.user.last_login.isoformat() if freelancer.user.last_login else None,
-                'is_active': freelancer.user.is_active,
-                'email_verified': freelancer.user.email_verified,
-            }
+            fields = requested_fields(request, self.detail_fields)
             
-            return self.success_response(
-                data=freelancer_data,
-                message="Freelancer details retrieved successfully"
+            # Rendered payload is cached per freelancer (see api.auth.details)
+            freelancer_data, hit = freelancer_detail(freelancer_id)
+            
+            return conditional_response(
+                request,
+                {
+                    'success': True,
+                    'message': "Freelancer details retrieved successfully",
+                    'data': trim_fields(freelancer_data, fields),
+                },
+                'HIT' if hit else 'MISS'
             )
             
         except Freelancer.DoesNotExist:
@@ -1931,6 +1979,12 @@ class FreelancerDetailAPIView(APIView, StandardResponseMixin):
                 status_code=status.HTTP_404_NOT_FOUND
             )
             
+        except InvalidFields as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
         except Exception as e:
             return self.error_response(
                 message=f"Error retrieving freelancer details: {str(e)}",
@@ -1938,6 +1992,263 @@ class FreelancerDetailAPIView(APIView, StandardResponseMixin):
             )
 
 
+class FreelancerBatchAPIView(APIView, StandardResponseMixin):
+    """
+    API endpoint to fetch several freelancers by ID (?ids=1,2,3) for public access
+    """
+    permission_classes = [AllowAny]
+    detail_fields = FreelancerDetailAPIView.detail_fields
+    
+    def get(self, request):
+        """
+        Get freelancer details keyed by ID; inactive or unknown IDs are listed under 'missing'
+        """
+        try:
+            ids = parse_ids(request.GET.get('ids'))
+            fields = requested_fields(request, self.detail_fields)
+            
+            # One primary-key IN query for the whole batch
+            freelancers = {
+                str(pk): trim_fields(data, fields)
+                for pk, data in freelancer_details(ids).items()
+            }
+            
+            return self.success_response(
+                message="Freelancer details retrieved successfully",
+                data={
+                    'freelancers': freelancers,
+                    'missing': [pk for pk in ids if str(pk) not in freelancers]
+                }
+            )
+            
+        except (InvalidIds, InvalidFields) as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error retrieving freelancer details: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ListingExportAPIView(APIView, StandardResponseMixin):
+    """
+    Public NDJSON feeds and sitemaps for crawlers and partner aggregators,
+    streamed from the listing projections (see api.auth.exports)
+    """
+    permission_classes = [AllowAny]
+    content_types = {
+        'ndjson': 'application/x-ndjson; charset=utf-8',
+        'xml': 'application/xml; charset=utf-8',
+    }
+    
+    def get(self, request, name=None):
+        """
+        Without a name: the export manifest (shards, row counts, file URLs).
+        With a name: stream that file, honouring If-None-Match / If-Modified-Since.
+        """
+        try:
+            import hashlib
+            from django.http import HttpResponse, StreamingHttpResponse
+            from django.utils.cache import get_conditional_response
+            from django.utils.http import http_date, quote_etag
+            from .exports import SITEMAP_INDEX_NAME, live_manifest, parse_shard_name, shard_name, shard_stats, sitemap_index, stream_shard
+            
+            if name is None:
+                manifest = live_manifest()
+                base = request.build_absolute_uri(request.path)
+                files = [
+                    {
+                        'kind': kind,
+                        'shard': int(shard),
+                        'rows': entry['rows'],
+                        'updated_at': entry['updated_at'],
+                        'ndjson': base + shard_name(kind, int(shard), 'ndjson'),
+                        'sitemap': base + shard_name(kind, int(shard), 'xml'),
+                    }
+                    for kind, shards in sorted(manifest['kinds'].items())
+                    for shard, entry in sorted(shards.items(), key=lambda item: int(item[0]))
+                    if entry['rows']
+                ]
+                return self.success_response(
+                    message="Export manifest retrieved successfully",
+                    data={
+                        'generated_at': manifest.get('generated_at'),
+                        'sitemap_index': base + SITEMAP_INDEX_NAME,
+                        'files': files
+                    }
+                )
+            
+            if name == SITEMAP_INDEX_NAME:
+                # A few hundred bytes per shard; built from one GROUP BY per kind
+                return HttpResponse(''.join(sitemap_index(live_manifest())), content_type=self.content_types['xml'])
+            
+            shard = parse_shard_name(name)
+            stats = shard_stats(shard[0], shard[1]).get(shard[1]) if shard else None
+            if not stats or not stats['rows']:
+                return self.error_response(
+                    message="Export file not found",
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            
+            # The shard's fingerprint changes whenever one of its rows does
+            kind, number, extension = shard
+            etag = quote_etag(hashlib.md5(f"{stats['fingerprint']}:{extension}".encode()).hexdigest())
+            last_modified = int(stats['updated_at'].timestamp())
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                return not_modified
+            
+            # Streamed from a server-side cursor in chunks; the shard is never loaded into memory
+            site_url = settings.PUBLIC_SITE_URL.rstrip('/')
+            response = StreamingHttpResponse(stream_shard(kind, number, extension, site_url), content_type=self.content_types[extension])
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            return response
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error retrieving export: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class JobFeedAPIView(APIView, StandardResponseMixin):
+    """
+    "Jobs for you" feed of the authenticated freelancer, newest first
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        """
+        Get a page of the freelancer's precomputed job feed
+        """
+        try:
+            freelancer_id = request_identity(request).freelancer_id
+            if not freelancer_id:
+                return self.error_response(
+                    message="Only freelancers have a job feed",
+                    status_code=status.HTTP_403_FORBIDDEN
+                )
+            
+            entries = JobFeedEntry.objects.filter(freelancer_id=freelancer_id).only('id', 'job_id', 'score', 'created_at')
+            paginator = CursorPaginator(request)
+            entries_page, pagination = paginator.paginate(entries)
+            
+            # Job cards come from the listing projection, in feed order
+            from .serializers import JobListingSerializer
+            rows = job_listing_rows(
+                [Job(pk=entry.job_id) for entry in entries_page],
+                fields=JOB_CARD_FIELDS,
+                excerpt=True
+            )
+            cards = {
+                card['id']: card
+                for card in JobListingSerializer(rows, many=True, fields=JOB_CARD_FIELDS).data
+            }
+            
+            jobs_data = []
+            for entry in entries_page:
+                if entry.job_id in cards:
+                    jobs_data.append({
+                        **cards[entry.job_id],
+                        'match_score': round(entry.score, 4),
+                        'added_at': entry.created_at.isoformat()
+                    })
+            
+            return self.success_response(
+                message="Job feed retrieved successfully",
+                data={
+                    'jobs': jobs_data,
+                    'pagination': pagination
+                }
+            )
+            
+        except InvalidCursor as e:
+            return self.error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return self.error_response(
+                message=f"Error retrieving job feed: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class JobMatchesAPIView(APIView, StandardResponseMixin):
+    """
+    Recommended freelancers for a job, ranked by skill overlap, category,
+    rate fit against the job budget and profile recency
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, job_id):
+        """
+        Get the best-matching freelancers for one of the client's jobs
+        """
+        try:
+            job = Job.objects.select_related('client').prefetch_related('skill_tags').get(id=job_id)
+            
+            user = request.user
+            if not (user.is_admin_user or (user.is_client and job.client.user_id == user.id)):
+                return self.error_response(
+                    message="Only the job owner can view matches for this job",
+                    status_code=status.HTTP_403_FORBIDDEN
+                )
+            
+            try:
+                limit = int(request.GET.get('limit', DEFAULT_MATCH_LIMIT))
+            except (TypeError, ValueError):
+                limit = DEFAULT_MATCH_LIMIT
+            limit = max(1, min(limit, MAX_MATCH_LIMIT))
+            
+            matches = recommend_freelancers(job, limit=limit)
+            
+            # Cards come from the listing projection, in match order
+            from .serializers import FreelancerListingSerializer
+            rows = freelancer_listing_rows(
+                [Freelancer(pk=freelancer_id) for freelancer_id, _, _ in matches],
+                fields=FREELANCER_CARD_FIELDS,
+                excerpt=True
+            )
+            cards = {
+                card['id']: card
+                for card in FreelancerListingSerializer(rows, many=True, fields=FREELANCER_CARD_FIELDS).data
+            }
+            
+            freelancers_data = []
+            for freelancer_id, score, components in matches:
+                if freelancer_id in cards:
+                    freelancers_data.append({
+                        **cards[freelancer_id],
+                        'match': {'score': score, **components}
+                    })
+            
+            return self.success_response(
+                message="Job matches retrieved successfully",
+                data={
+                    'job_id': job.id,
+                    'freelancers': freelancers_data
+                }
+            )
+            
+        except Job.DoesNotExist:
+            return self.error_response(
+                message="Job not found",
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error retrieving job matches: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class AdminAnalyticsAPIView(APIView, StandardResponseMixin):
     """
     Admin analytics - historical data for charts
@@ -2034,4 +2345,141 @@ class AdminAnalyticsAPIView(APIView, StandardResponseMixin):
             return self.error_response(
                 message=f"Error retrieving analytics data: {str(e)}",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+
+class AdminCacheStatsAPIView(APIView, StandardResponseMixin):
+    """
+    Admin view of response and detail cache hit/miss counters
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    
+    def get(self, request):
+        """
+        Get hit/miss counters of every tracked cache
+        """
+        try:
+            return self.success_response(
+                message="Cache statistics retrieved successfully",
+                data={'caches': cache_stats()}
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error retrieving cache statistics: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    def delete(self, request):
+        """
+        Reset the counters
+        """
+        try:
+            reset_cache_stats()
+            return self.success_response(message="Cache statistics reset")
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error resetting cache statistics: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AdminLoginMetricsAPIView(APIView, StandardResponseMixin):
+    """
+    Admin view of the async login hashing pool: queue wait vs hash time
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    
+    def get(self, request):
+        """
+        Get queue-wait and hash-time histograms and the number of shed logins
+        """
+        try:
+            return self.success_response(
+                message="Login metrics retrieved successfully",
+                data={
+                    'metrics': login_metrics(),
+                    'pool': {
+                        'workers': settings.LOGIN_HASH_WORKERS,
+                        'queue_limit': settings.LOGIN_HASH_QUEUE_LIMIT,
+                    }
+                }
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error retrieving login metrics: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    def delete(self, request):
+        """
+        Reset the counters
+        """
+        try:
+            reset_login_metrics()
+            return self.success_response(message="Login metrics reset")
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error resetting login metrics: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AdminUserImportAPIView(APIView, StandardResponseMixin):
+    """
+    Admin bulk import of users and their profiles from an uploaded CSV or NDJSON file
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    
+    def post(self, request):
+        """
+        Import the multipart ``file``; ``format`` (csv/ndjson) defaults to the
+        file extension and ``dry_run=true`` only validates. Returns the
+        per-row error report.
+        """
+        try:
+            upload = request.FILES.get('file')
+            if upload is None:
+                return self.error_response(
+                    message="Upload the users as a 'file' field (CSV or NDJSON)",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            fmt = request.data.get('format') or request.query_params.get('format')
+            if fmt and fmt not in IMPORT_FORMATS:
+                return self.error_response(
+                    message=f"Invalid format. Choose one of: {', '.join(IMPORT_FORMATS)}",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            dry_run = str(request.data.get('dry_run') or request.query_params.get('dry_run', '')).lower() in ('1', 'true', 'yes')
+            
+            lines = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+            try:
+                rows = list(itertools.islice(read_rows(lines, fmt or detect_format(upload.name)), settings.USER_IMPORT_MAX_ROWS + 1))
+            except (ImportFormatError, UnicodeDecodeError) as e:
+                return self.error_response(
+                    message=f"Could not read the file: {str(e)}",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+                return self.error_response(
+                    message=f"Files are limited to {settings.USER_IMPORT_MAX_ROWS} rows; use `manage.py import_users` for larger imports",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            # Hashed inline: a process pool has no place in a web worker
+            report = import_users(rows, workers=1, dry_run=dry_run)
+            return self.success_response(
+                message="Import validated" if dry_run else f"{report['created']} users imported",
+                data=report,
+                status_code=status.HTTP_200_OK if dry_run or not report['created'] else status.HTTP_201_CREATED
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message=f"Error importing users: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,253 @@
+"""
+Versioned cache namespaces shared by the listing endpoints.
+
+Each namespace ("jobs", "freelancers", ...) has a version number stored in the
+cache. Keys built for a namespace embed its current version, so bumping the
+version from a signal handler invalidates every derived entry at once without
+having to enumerate them.
+
+Detail pages use finer-grained object versions instead ("job:42", "user:7"):
+a cached payload records the version of every object it was rendered from and
+is only served while all of them are unchanged.
+"""
+
+import hashlib
+import json
+from functools import wraps
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+NAMESPACE_VERSION_KEY = 'ns_version:{}'
+
+RESPONSE_CACHE_TIMEOUT = 300
+
+OBJECT_VERSION_KEY = 'obj_version:{}'
+OBJECT_CACHE_KEY = 'object:{}:{}'
+OBJECT_CACHE_TIMEOUT = 3600
+
+# Stored for a ref whose version was not read before the build; real versions start at 1
+UNVERIFIED_VERSION = 0
+
+CACHE_STATS_KEY = 'cache_stats:{}:{}'
+
+# Names of the caches whose hit/miss counters are reported by cache_stats()
+_tracked_caches = []
+
+
+def namespace_version(namespace):
+    """Current version of a cache namespace (created on first use)"""
+    key = NAMESPACE_VERSION_KEY.format(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def bump_namespace(*namespaces):
+    """Invalidate everything cached under the given namespaces"""
+    for namespace in namespaces:
+        key = NAMESPACE_VERSION_KEY.format(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, timeout=None)
+
+
+def filter_signature(params, exclude=()):
+    """
+    Stable hash of request filter parameters.
+
+    Empty values are dropped and keys/values are sorted, so '?b=2&a=1' and
+    '?a=1&b=2&c=' produce the same signature.
+    """
+    normalized = sorted(
+        (key, sorted(value.strip() for value in params.getlist(key) if value.strip()))
+        for key in params.keys()
+        if key not in exclude
+    )
+    normalized = [(key, values) for key, values in normalized if values]
+    return hashlib.sha1(json.dumps(normalized).encode()).hexdigest()
+
+
+def namespaced_key(prefix, namespace, signature):
+    """Cache key bound to the current version of a namespace"""
+    return f'{prefix}:{namespace}:v{namespace_version(namespace)}:{signature}'
+
+
+def _etag_for(data):
+    """Strong ETag: identical data always renders to identical JSON bytes"""
+    body = json.dumps(data, cls=JSONEncoder, sort_keys=True, separators=(',', ':'))
+    return '"{}"'.format(hashlib.sha1(body.encode()).hexdigest())
+
+
+def _etag_matches(request, etag):
+    header = request.META.get('HTTP_IF_NONE_MATCH', '')
+    if header.strip() == '*':
+        return True
+    # If-None-Match uses the weak comparison function (RFC 9110, 13.1.2)
+    candidates = (tag.strip() for tag in header.split(','))
+    return etag in (tag[2:] if tag.startswith('W/') else tag for tag in candidates)
+
+
+def record_cache_access(name, hit):
+    """Count a hit or miss for the named cache"""
+    key = CACHE_STATS_KEY.format(name, 'hits' if hit else 'misses')
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def cache_stats():
+    """Hit/miss counters of every tracked cache"""
+    keys = {
+        (name, kind): CACHE_STATS_KEY.format(name, kind)
+        for name in _tracked_caches for kind in ('hits', 'misses')
+    }
+    counters = cache.get_many(list(keys.values()))
+    stats = {}
+    for name in _tracked_caches:
+        hits = counters.get(keys[(name, 'hits')], 0)
+        misses = counters.get(keys[(name, 'misses')], 0)
+        stats[name] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else None,
+        }
+    return stats
+
+
+def reset_cache_stats():
+    cache.delete_many([
+        CACHE_STATS_KEY.format(name, kind) for name in _tracked_caches for kind in ('hits', 'misses')
+    ])
+
+
+def _track(name):
+    if name not in _tracked_caches:
+        _tracked_caches.append(name)
+
+
+def conditional_response(request, data, cache_status, etag=None):
+    """
+    200 response carrying a strong ETag, or 304 Not Modified when the client's
+    If-None-Match already matches it.
+    """
+    etag = etag or _etag_for(data)
+    if _etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data)
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    response['X-Cache'] = cache_status
+    return response
+
+
+def cache_response(*namespaces, timeout=RESPONSE_CACHE_TIMEOUT):
+    """
+    Cache successful responses of a public GET handler.
+
+    Entries are keyed by view, URL kwargs and normalized query parameters and
+    tied to the current version of each namespace, so bumping any of them
+    from a signal handler drops the entry. Responses carry a strong ETag and
+    a matching If-None-Match is answered with 304 Not Modified.
+
+    Only for views whose output does not depend on the requesting user.
+    """
+    def decorator(handler):
+        stats_name = 'response:' + handler.__qualname__.split('.')[0]
+        _track(stats_name)
+
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            versions = '.'.join(f'{ns}{namespace_version(ns)}' for ns in namespaces)
+            route = ','.join(f'{name}={value}' for name, value in sorted(kwargs.items()))
+            key = f'response:{type(self).__name__}:{versions}:{route}:{filter_signature(request.GET)}'
+
+            cached = cache.get(key)
+            record_cache_access(stats_name, hit=cached is not None)
+            if cached is not None:
+                data, etag = cached
+                return conditional_response(request, data, 'HIT', etag)
+
+            response = handler(self, request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            etag = _etag_for(response.data)
+            cache.set(key, (response.data, etag), timeout)
+            return conditional_response(request, response.data, 'MISS', etag)
+        return wrapper
+    return decorator
+
+
+# ------------------------------------------------------------ object caches
+
+def object_ref(kind, pk):
+    return f'{kind}:{pk}'
+
+
+def bump_objects(kind, ids):
+    """Invalidate every cached payload rendered from the given objects"""
+    for pk in ids:
+        try:
+            cache.incr(OBJECT_VERSION_KEY.format(object_ref(kind, pk)))
+        except ValueError:
+            pass  # no version yet, so nothing cached depends on it
+
+
+def _object_versions(refs):
+    """Current versions of the given objects, creating missing ones"""
+    keys = {ref: OBJECT_VERSION_KEY.format(ref) for ref in refs}
+    found = cache.get_many(list(keys.values()))
+    versions = {}
+    for ref, key in keys.items():
+        if key not in found:
+            cache.add(key, 1, timeout=None)
+            found[key] = cache.get(key, 1)
+        versions[ref] = found[key]
+    return versions
+
+
+def cache_object(name, kind, timeout=OBJECT_CACHE_TIMEOUT):
+    """
+    Cache the payload built for one object of the given kind ("job", ...).
+
+    The decorated ``build(pk)`` returns ``(data, refs)`` where ``refs`` lists
+    the other ``object_ref``s the payload was rendered from (e.g. its owner).
+    The wrapped function returns ``(data, hit)``; cached data is served until
+    ``bump_objects`` is called for any of those refs. Lookups that raise
+    (e.g. DoesNotExist) are not cached.
+
+    Versions are read before ``build`` runs, so a change racing the build
+    invalidates the entry. The refs read are the object's own and those of
+    its previous entry; a ref the build names for the first time is stored
+    unverified, which makes the next lookup rebuild with it known.
+    """
+    _track(name)
+
+    def decorator(build):
+        @wraps(build)
+        def wrapper(pk):
+            key = OBJECT_CACHE_KEY.format(name, pk)
+            cached = cache.get(key)
+            if cached is not None:
+                data, versions = cached
+                current = cache.get_many([OBJECT_VERSION_KEY.format(ref) for ref in versions])
+                if all(current.get(OBJECT_VERSION_KEY.format(ref)) == version for ref, version in versions.items()):
+                    record_cache_access(name, hit=True)
+                    return data, True
+
+            record_cache_access(name, hit=False)
+            own_ref = object_ref(kind, pk)
+            known = _object_versions({own_ref, *(cached[1] if cached is not None else ())})
+            data, refs = build(pk)
+            versions = {ref: known.get(ref, UNVERIFIED_VERSION) for ref in [own_ref, *refs]}
+            cache.set(key, (data, versions), timeout)
+            return data, False
+        return wrapper
+    return decorator
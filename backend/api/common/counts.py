@@ -0,0 +1,74 @@
+"""
+Cached and approximate row counts for listing totals
+"""
+
+import json
+
+from django.core.cache import cache
+from django.db import connection
+
+from .cache import namespaced_key
+
+COUNT_CACHE_TIMEOUT = 300
+
+# Below this many rows an exact COUNT is cheap and estimates are noisy
+ESTIMATE_MIN_ROWS = 10000
+
+
+def table_row_estimate(model):
+    """
+    Planner's row estimate for a whole table (pg_class.reltuples), or None if
+    the table has never been analyzed.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] < 0:
+        return None
+    return row[0]
+
+
+def query_row_estimate(queryset):
+    """
+    Planner's row estimate for a queryset, derived from reltuples and column
+    statistics via EXPLAIN (no rows are read).
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def listing_count(queryset, namespace=None, signature=None, estimate=False):
+    """
+    Total for a listing query. Returns (count, exact).
+
+    ``estimate=True`` marks a query without user-supplied filters: a bare table
+    is estimated from reltuples, and a base-filtered one (e.g. open jobs) from
+    the planner. Estimates are only used on tables large enough for them to be
+    meaningful. Otherwise the exact COUNT is cached per namespace version and
+    filter signature, so signal handlers can invalidate it.
+    """
+    if estimate and connection.vendor == 'postgresql':
+        if not queryset.query.where:
+            approx = table_row_estimate(queryset.model)
+        else:
+            approx = query_row_estimate(queryset)
+        if approx is not None and approx >= ESTIMATE_MIN_ROWS:
+            return approx, False
+
+    if namespace is None:
+        return queryset.count(), True
+
+    key = namespaced_key('listing_count', namespace, signature)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, COUNT_CACHE_TIMEOUT)
+    return count, True
@@ -0,0 +1,54 @@
+"""
+Sparse fieldsets (?fields=) for read endpoints.
+
+Clients pass a comma-separated list of response fields, or the name of a
+preset such as "card", and get only those keys back. Views use the parsed
+list to restrict the columns they read (``.only()`` / ``.defer()``) as well as
+to trim the payload.
+"""
+
+
+class InvalidFields(ValueError):
+    """Raised when ?fields= names a field the endpoint does not expose"""
+
+
+def requested_fields(request, available, presets=None):
+    """
+    Parse ``?fields=`` against the fields an endpoint exposes.
+
+    Returns None when the parameter is absent (full payload), otherwise a
+    tuple of field names in the endpoint's own order. A single value matching
+    a key of ``presets`` expands to that preset.
+    """
+    raw = request.GET.get('fields', '').strip()
+    if not raw:
+        return None
+    if presets and raw in presets:
+        return tuple(presets[raw])
+
+    names = {name.strip() for name in raw.split(',') if name.strip()}
+    unknown = names - set(available)
+    if unknown:
+        raise InvalidFields(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(name for name in available if name in names)
+
+
+def trim_fields(data, fields):
+    """Keep only the requested keys of a response dict (no-op when fields is None)"""
+    if fields is None:
+        return data
+    return {key: value for key, value in data.items() if key in fields}
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Serializer mixin accepting ``fields=`` to drop every other field.
+
+        JobListingSerializer(rows, many=True, fields=('id', 'title'))
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
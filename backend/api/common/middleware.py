@@ -0,0 +1,39 @@
+"""
+Async-capable wrappers for third-party middleware.
+
+A single sync-only middleware makes Django run the whole request chain, async
+views included, on the one shared thread it uses for sync code under ASGI.
+WhiteNoise is sync-only, so without this wrapper the async login views would
+still queue behind every other request.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoiseMiddleware that stays async when the rest of the stack is"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    def static_response(self, request):
+        static_file = self.find_file(request.path_info) if self.autorefresh else self.files.get(request.path_info)
+        return self.serve(static_file, request) if static_file is not None else None
+
+    async def __acall__(self, request):
+        if request.path_info.startswith(self.static_prefix):
+            # File lookups and opens block, so they run off the event loop
+            response = await sync_to_async(self.static_response, thread_sensitive=False)(request)
+            if response is not None:
+                return response
+        return await self.get_response(request)
@@ -0,0 +1,157 @@
+"""
+Keyset (cursor) pagination shared by the listing endpoints.
+
+Pages are addressed by an opaque cursor holding the sort value and id of the
+last row served, so fetching page N costs the same as fetching page 1 and no
+OFFSET or COUNT(*) is issued unless the caller asks for a total.
+"""
+
+import base64
+import binascii
+import json
+from decimal import Decimal
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+
+from .cache import filter_signature
+from .counts import listing_count
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Query parameters that shape the page but not the result set: totals and
+# facets are shared by every page, ordering, sparse fieldset and legacy ?page=
+PAGINATION_PARAMS = ('cursor', 'page', 'page_size', 'include_total', 'ordering', 'fields')
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor that cannot be decoded"""
+
+
+def _to_json(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+class CursorPaginator:
+    """
+    Paginates a queryset on (ordering field, id).
+
+    Query parameters:
+        cursor         opaque cursor from a previous response's ``next_cursor``
+        page_size      rows per page, capped at ``max_page_size``
+        include_total  "true" to also return ``total_count``
+
+    Totals go through ``listing_count``: when ``count_namespace`` is given the
+    exact count is cached per filter signature, and requests without filters
+    may be answered with an estimate (``total_count_exact`` is then false).
+
+    Null sort values follow Postgres' defaults (last when ascending, first when
+    descending) so plain B-tree indexes can serve the ordering.
+    """
+
+    def __init__(self, request, ordering='-created_at', default_page_size=DEFAULT_PAGE_SIZE,
+                 max_page_size=MAX_PAGE_SIZE, count_namespace=None):
+        self.request = request
+        self.count_namespace = count_namespace
+        self.descending = ordering.startswith('-')
+        self.field = ordering.lstrip('-')
+        self.ordering = ordering
+        self.page_size = self._parse_page_size(default_page_size, max_page_size)
+        self.include_total = request.GET.get('include_total', '').lower() in ('1', 'true', 'yes')
+        self.cursor = self._decode(request.GET.get('cursor'))
+
+    def _parse_page_size(self, default, maximum):
+        try:
+            size = int(self.request.GET.get('page_size', default))
+        except (TypeError, ValueError):
+            size = default
+        return max(1, min(size, maximum))
+
+    def _decode(self, raw):
+        if not raw:
+            return None
+        try:
+            padded = raw + '=' * (-len(raw) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            if data['o'] != self.ordering:
+                raise InvalidCursor('Cursor does not match the requested ordering')
+            return data['v'], int(data['id'])
+        except (KeyError, TypeError, ValueError, binascii.Error, UnicodeDecodeError):
+            raise InvalidCursor('Invalid pagination cursor')
+
+    def _encode(self, row):
+        payload = {'o': self.ordering, 'v': _to_json(getattr(row, self.field)), 'id': row.pk}
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+    def _is_nullable(self, queryset):
+        try:
+            return queryset.model._meta.get_field(self.field).null
+        except FieldDoesNotExist:
+            return False  # annotations such as search rank are never null
+
+    def _order_by(self, queryset):
+        if self.descending:
+            return queryset.order_by(F(self.field).desc(), '-id')
+        return queryset.order_by(F(self.field).asc(), 'id')
+
+    def _after_cursor(self, nullable):
+        """Filter selecting the rows that sort strictly after the cursor row"""
+        value, last_id = self.cursor
+        field = self.field
+        id_after = Q(id__lt=last_id) if self.descending else Q(id__gt=last_id)
+
+        if value is None:
+            # Nulls come first when descending and last when ascending
+            after = Q(**{f'{field}__isnull': True}) & id_after
+            if self.descending:
+                after |= Q(**{f'{field}__isnull': False})
+            return after
+
+        beyond = Q(**{f'{field}__lt' if self.descending else f'{field}__gt': value})
+        after = beyond | (Q(**{field: value}) & id_after)
+        if nullable and not self.descending:
+            after |= Q(**{f'{field}__isnull': True})
+        return after
+
+    def paginate(self, queryset):
+        """
+        Return (rows, pagination) for the current request.
+        """
+        page_qs = self._order_by(queryset)
+        if self.cursor is not None:
+            page_qs = page_qs.filter(self._after_cursor(self._is_nullable(queryset)))
+
+        rows = list(page_qs[:self.page_size + 1])
+        has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        pagination = {
+            'page_size': self.page_size,
+            'has_next': has_next,
+            'has_previous': self.cursor is not None,
+            'next_cursor': self._encode(rows[-1]) if has_next else None,
+        }
+        if self.include_total:
+            total, exact = self._total(queryset)
+            pagination['total_count'] = total
+            pagination['total_count_exact'] = exact
+        return rows, pagination
+
+    def _total(self, queryset):
+        params = self.request.GET
+        filtered = any(
+            value.strip()
+            for key in params.keys() if key not in PAGINATION_PARAMS
+            for value in params.getlist(key)
+        )
+        return listing_count(
+            queryset.order_by(),
+            namespace=self.count_namespace,
+            signature=filter_signature(params, exclude=PAGINATION_PARAMS),
+            estimate=not filtered,
+        )
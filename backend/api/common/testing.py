@@ -0,0 +1,99 @@
+"""
+Test helpers for query plans.
+
+QueryPlanMixin runs a request, picks the statement it sent to a given table
+and EXPLAINs it, so tests can assert that a view's main query is served by
+an index. Seed enough rows for the planner to prefer the index, then call
+analyze() so it has statistics for them.
+"""
+
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.auth.models import Client, Freelancer, User
+
+INDEX_SCANS = ('Index Scan', 'Index Only Scan', 'Bitmap Index Scan')
+
+
+def seed_profiles(clients, freelancers):
+    """Create ``clients`` client and ``freelancers`` freelancer users; returns both profile lists"""
+    users = User.objects.bulk_create(
+        [User(username=f'client{i}', email=f'client{i}@example.com', role='client') for i in range(clients)]
+        + [User(username=f'freelancer{i}', email=f'freelancer{i}@example.com', role='freelancer') for i in range(freelancers)]
+    )
+    return (
+        Client.objects.bulk_create([Client(user=user) for user in users[:clients]]),
+        Freelancer.objects.bulk_create([
+            Freelancer(user=user, rate=10 + i % 90, category='Development') for i, user in enumerate(users[clients:])
+        ]),
+    )
+
+
+def spread_timestamps(model, field='created_at'):
+    """bulk_create stamps every row with the same auto_now_add time; give each row its own minute"""
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.get_field(field).column)
+    with connection.cursor() as cursor:
+        cursor.execute(f"UPDATE {table} SET {column} = NOW() - id * INTERVAL '1 minute'")
+
+
+def plan_nodes(plan):
+    """Every node of an EXPLAIN (FORMAT JSON) plan tree"""
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from plan_nodes(child)
+
+
+class QueryPlanMixin:
+    """For django.test.TestCase subclasses"""
+
+    @staticmethod
+    def analyze(*models):
+        with connection.cursor() as cursor:
+            for model in models:
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+
+    def main_query(self, send, model, contains=''):
+        """SQL of the first statement reading ``model``'s table (and containing ``contains``) while ``send()`` runs"""
+        table = f'FROM {connection.ops.quote_name(model._meta.db_table)}'
+        with CaptureQueriesContext(connection) as queries:
+            response = send()
+        self.assertLess(response.status_code, 400, getattr(response, 'data', response))
+        for query in queries.captured_queries:
+            sql = query['sql']
+            if table in sql and contains in sql and sql.lstrip().upper().startswith('SELECT'):
+                return sql
+        self.fail(f'No query read {model._meta.db_table}')
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]['Plan']
+
+    def assertUsesIndex(self, sql, model, index=None, node_types=INDEX_SCANS):
+        """
+        The plan reads ``model``'s table through ``index`` (any of its
+        indexes if None) with one of ``node_types``, and never sequentially.
+        """
+        table = model._meta.db_table
+        names = {index} if index else {
+            name for name, info in connection.introspection.get_constraints(connection.cursor(), table).items()
+            if info['index']
+        }
+        nodes = list(plan_nodes(self.explain(sql)))
+        message = '\n'.join(
+            f"{node['Node Type']} {node.get('Index Name') or node.get('Relation Name') or ''}".rstrip() for node in nodes
+        )
+        self.assertFalse(
+            any(node['Node Type'] == 'Seq Scan' and node.get('Relation Name') == table for node in nodes),
+            f'Sequential scan on {table}:\n{message}',
+        )
+        self.assertTrue(
+            any(node['Node Type'] in node_types and node.get('Index Name') in names for node in nodes),
+            f'No {" / ".join(node_types)} of {index or table}:\n{message}',
+        )
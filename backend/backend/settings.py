@@ -46,6 +46,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'whitenoise.runserver_nostatic',  # Add for static files
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Full-text search fields and GIN indexes
     
     # Third party apps
     'rest_framework',
@@ -63,7 +64,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',  # Add for static files
+    'api.common.middleware.AsyncWhiteNoiseMiddleware',  # WhiteNoise static files, async-capable
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -170,7 +171,8 @@ AUTH_USER_MODEL = 'api_auth.User'
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # SimpleJWT with the user and role-profile ids served from cache
+        'api.auth.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -191,7 +193,7 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=30),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    'UPDATE_LAST_LOGIN': False,  # Login views record it through api.auth.activity
     
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
@@ -216,6 +218,9 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_EXP_CLAIM': 'refresh_exp',
     'SLIDING_TOKEN_LIFETIME': timedelta(minutes=60),
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
+    
+    # Re-stamps the role / client_id / freelancer_id claims (api.auth.tokens)
+    'TOKEN_REFRESH_SERIALIZER': 'api.auth.tokens.RoleTokenRefreshSerializer',
 }
 
 # CORS Configuration
@@ -242,6 +247,37 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Shared cache (listing counts, response caches). Redis keeps entries and
+# invalidations consistent across workers; set CACHE_BACKEND to
+# django.core.cache.backends.locmem.LocMemCache for single-process development.
+CACHES = {
+    "default": {
+        "BACKEND": config('CACHE_BACKEND', default='django.core.cache.backends.redis.RedisCache'),
+        "LOCATION": config('CACHE_LOCATION', default=config('REDIS_URL', default='redis://localhost:6379')),
+        "KEY_PREFIX": "freelancehub",
+        "TIMEOUT": 300,
+    },
+}
+
+# Public listing export: the endpoint streams NDJSON feeds and sitemaps from the database;
+# `manage.py export_listings` can also write them to EXPORT_ROOT for static hosting
+EXPORT_ROOT = config('EXPORT_ROOT', default=os.path.join(BASE_DIR, 'exports'))
+PUBLIC_SITE_URL = config('PUBLIC_SITE_URL', default='https://freelance-marketplace-frontend.onrender.com')
+EXPORT_PUBLIC_URL = config('EXPORT_PUBLIC_URL', default='https://freelance-marketplace-backend.onrender.com/api/auth/export')
+
+# In-process filter of blacklisted refresh tokens, kept in sync over Redis pub/sub (api.auth.blacklist)
+TOKEN_BLACKLIST_FILTER_ENABLED = config('TOKEN_BLACKLIST_FILTER_ENABLED', default=True, cast=bool)
+TOKEN_BLACKLIST_FILTER_REDIS_URL = config('REDIS_URL', default='redis://localhost:6379')
+
+# Async login views: password hashing threads and how many attempts may wait for one (api.auth.login)
+LOGIN_HASH_WORKERS = config('LOGIN_HASH_WORKERS', default=min(4, os.cpu_count() or 1), cast=int)
+LOGIN_HASH_QUEUE_LIMIT = config('LOGIN_HASH_QUEUE_LIMIT', default=32, cast=int)
+
+# Bulk user import (api.auth.imports): password hashing processes of `manage.py import_users`,
+# and the row limit of the admin upload, which hashes inline (~0.4 s per password) within the request timeout
+USER_IMPORT_HASH_WORKERS = config('USER_IMPORT_HASH_WORKERS', default=min(4, os.cpu_count() or 1), cast=int)
+USER_IMPORT_MAX_ROWS = config('USER_IMPORT_MAX_ROWS', default=50, cast=int)
+
 # Razorpay settings
 RAZORPAY_KEY_ID = config('RAZORPAY_KEY_ID', default='')
 RAZORPAY_KEY_SECRET = config('RAZORPAY_KEY_SECRET', default='')
@@ -4,10 +4,15 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from api.auth.authentication import get_cached_user
+from api.auth.dashboard import invalidate_dashboard_stats
+from api.auth.tokens import token_identity
 from .models import ChatThread, ChatMessage
 from .serializers import ChatMessageSerializer
+from .unread import sync_unread
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -21,6 +26,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
         self.thread_id = self.scope['url_route']['kwargs']['thread_id']
         self.room_group_name = f'chat_{self.thread_id}'
         self.user = None
+        self.identity = None
         
         # Authenticate user from query string token
         await self.authenticate_user()
@@ -194,6 +200,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
             try:
                 access_token = AccessToken(token)
                 user_id = access_token['user_id']
+                self.identity = token_identity(access_token)
                 self.user = await self.get_user_by_id(user_id)
             except (InvalidToken, TokenError, KeyError):
                 logger.warning(f"Invalid token for thread {self.thread_id}")
@@ -204,17 +211,24 @@ class ChatConsumer(AsyncWebsocketConsumer):
     
     @database_sync_to_async
     def get_user_by_id(self, user_id):
-        """Get user by ID from database"""
+        """Get user by ID from the authentication user cache"""
         try:
-            return User.objects.get(id=user_id)
-        except User.DoesNotExist:
+            return get_cached_user(int(user_id))
+        except (TypeError, ValueError):
             return None
     
     @database_sync_to_async
     def is_thread_participant(self):
         """Check if current user is a participant in the thread"""
+        # Profile ids from the token claims: one indexed lookup, no profile rows
+        identity = self.identity
+        if identity is not None and (identity.client_id or identity.freelancer_id):
+            return ChatThread.objects.filter(
+                models.Q(client_id=identity.client_id) | models.Q(freelancer_id=identity.freelancer_id),
+                id=self.thread_id
+            ).exists()
         try:
-            thread = ChatThread.objects.get(id=self.thread_id)
+            thread = ChatThread.objects.select_related('client', 'freelancer').get(id=self.thread_id)
             return thread.is_participant(self.user)
         except ChatThread.DoesNotExist:
             return False
@@ -253,11 +267,17 @@ class ChatConsumer(AsyncWebsocketConsumer):
     def mark_messages_as_read(self, message_ids):
         """Mark specified messages as read"""
         try:
-            ChatMessage.objects.filter(
+            updated = ChatMessage.objects.filter(
                 id__in=message_ids,
                 thread_id=self.thread_id
             ).exclude(
                 sender=self.user  # Don't mark own messages as read
             ).update(is_read=True)
+            if updated:
+                # update() skips post_save, so the unread counter and the cached dashboard are refreshed here
+                sync_unread(self.thread_id, self.user.id)
+                participants = ChatThread.objects.filter(id=self.thread_id).values_list('client_id', 'freelancer_id').first()
+                if participants:
+                    invalidate_dashboard_stats(client_ids=[participants[0]], freelancer_ids=[participants[1]])
         except Exception as e:
             logger.error(f"Error marking messages as read: {str(e)}")
\ No newline at end of file
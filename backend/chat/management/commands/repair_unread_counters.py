@@ -0,0 +1,37 @@
+"""
+Recompute the per-user unread message counters from the messages themselves.
+
+Threads are processed in primary-key ranges; each range is one short
+transaction. Safe to run while users are chatting.
+
+Usage:
+    python manage.py repair_unread_counters
+    python manage.py repair_unread_counters --batch-size 500 --after-id 12000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from chat.models import ChatThread
+from chat.unread import repair_unread_counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute unread message counters where they differ from the unread messages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Thread id range per transaction')
+        parser.add_argument('--after-id', type=int, default=0, help='Resume after this primary key')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        max_id = ChatThread.objects.aggregate(max_id=Max('pk'))['max_id'] or 0
+        start = options['after_id'] + 1
+        fixed = 0
+        while start <= max_id:
+            drifted = repair_unread_counters(start, start + batch_size)
+            fixed += len(drifted)
+            if drifted:
+                self.stdout.write(f'  fixed {len(drifted)} counters in threads [{start}, {start + batch_size})')
+            start += batch_size
+        self.stdout.write(self.style.SUCCESS(f'Repaired unread counters: {fixed} counters corrected'))
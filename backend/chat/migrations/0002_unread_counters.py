@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 05:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('unread', models.PositiveIntegerField(default=0)),
+                ('thread', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='unread_counters', to='chat.chatthread')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='unread_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'new_chat_unread_counters',
+                'constraints': [models.UniqueConstraint(fields=('user', 'thread'), name='unread_counters_user_thread')],
+            },
+        ),
+        # Start from the current unread messages; later drift is fixed by `manage.py repair_unread_counters`
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO new_chat_unread_counters (user_id, thread_id, unread)
+                SELECT p.user_id, p.thread_id, COUNT(m.id)
+                FROM (
+                    SELECT t.id AS thread_id, c.user_id FROM new_chat_threads t JOIN clients c ON c.id = t.client_id
+                    UNION
+                    SELECT t.id AS thread_id, f.user_id FROM new_chat_threads t JOIN freelancers f ON f.id = t.freelancer_id
+                ) AS p
+                JOIN new_chat_messages m ON m.thread_id = p.thread_id AND NOT m.is_read AND m.sender_id <> p.user_id
+                GROUP BY p.user_id, p.thread_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from api.auth.models import Client, Freelancer, Job
 
@@ -76,10 +76,12 @@ class ChatMessage(models.Model):
         return f"Message {self.id} by {self.sender.username} in thread {self.thread.id}"
 
     def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        # Update thread's last_message_at when a new message is added
-        self.thread.last_message_at = self.sent_at
-        self.thread.save(update_fields=['last_message_at'])
+        # The unread counters (chat.unread) are bumped from post_save in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # Update thread's last_message_at when a new message is added
+            self.thread.last_message_at = self.sent_at
+            self.thread.save(update_fields=['last_message_at'])
 
     def mark_as_read(self):
         """Mark this message as read"""
@@ -104,3 +106,20 @@ class MessageRead(models.Model):
 
     def __str__(self):
         return f"{self.user.username} read message {self.message.id}"
+
+
+class UnreadCounter(models.Model):
+    """Unread messages per user and thread, maintained by chat.unread"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='unread_counters')
+    thread = models.ForeignKey(ChatThread, on_delete=models.CASCADE, related_name='unread_counters')
+    unread = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'new_chat_unread_counters'
+        constraints = [
+            # Also serves the per-user total (user_id is the leading column)
+            models.UniqueConstraint(fields=['user', 'thread'], name='unread_counters_user_thread'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} has {self.unread} unread in thread {self.thread_id}"
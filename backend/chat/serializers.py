@@ -100,9 +100,12 @@ class ChatThreadSerializer(serializers.ModelSerializer):
     
     def get_unread_count(self, obj):
         """Get unread message count for the current user"""
+        if hasattr(obj, 'user_unread'):
+            return obj.user_unread  # annotated by chat.unread.with_unread()
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return obj.messages.filter(is_read=False).exclude(sender=request.user).count()
+            counter = obj.unread_counters.filter(user=request.user).first()
+            return counter.unread if counter else 0
         return 0
     
     def get_participant_info(self, obj):
@@ -0,0 +1,25 @@
+"""
+Model signal handlers for the chat app
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import ChatMessage, ChatThread
+from .unread import record_message, sync_unread
+
+
+@receiver(post_save, sender=ChatMessage)
+def count_unread_message(sender, instance, created, update_fields=None, **kwargs):
+    """New messages are unread for the other participants; mark_as_read() saves only is_read"""
+    if created:
+        record_message(instance)
+    elif update_fields is None or 'is_read' in update_fields:
+        sync_unread(instance.thread_id)
+
+
+@receiver(post_delete, sender=ChatMessage)
+def uncount_deleted_message(sender, instance, origin=None, **kwargs):
+    """A deleted thread takes its counters with it, so there is nothing to recount"""
+    if not instance.is_read and not isinstance(origin, ChatThread):
+        sync_unread(instance.thread_id)
@@ -1,3 +1,51 @@
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from api.common.testing import QueryPlanMixin, seed_profiles, spread_timestamps
+
+from .models import ChatMessage, ChatThread, UnreadCounter
+
+
+class ChatQueryPlanTests(QueryPlanMixin, TestCase):
+    """The main query of each chat view is answered from an index"""
+
+    @classmethod
+    def setUpTestData(cls):
+        clients, freelancers = seed_profiles(clients=100, freelancers=100)
+        threads = ChatThread.objects.bulk_create([
+            ChatThread(client=clients[i % len(clients)], freelancer=freelancers[i // len(clients)])
+            for i in range(2000)
+        ])
+        ChatMessage.objects.bulk_create([
+            ChatMessage(thread=thread, sender=(thread.client if i % 2 else thread.freelancer).user, message=f'Message {i}')
+            for thread in threads
+            for i in range(5)
+        ])
+        UnreadCounter.objects.bulk_create([
+            UnreadCounter(user=thread.client.user, thread=thread, unread=2) for thread in threads
+        ] + [
+            UnreadCounter(user=thread.freelancer.user, thread=thread, unread=3) for thread in threads
+        ])
+        spread_timestamps(ChatMessage, 'sent_at')
+        cls.client_user = clients[0].user
+        cls.thread = threads[0]
+        cls.analyze(ChatThread, ChatMessage, UnreadCounter)
+
+    def setUp(self):
+        cache.clear()
+        self.api = APIClient()
+        self.api.force_authenticate(self.client_user)
+
+    def test_thread_list(self):
+        sql = self.main_query(lambda: self.api.get('/api/chat/threads/'), ChatThread, contains='ORDER BY')
+        self.assertUsesIndex(sql, ChatThread)
+
+    def test_thread_messages(self):
+        url = f'/api/chat/threads/{self.thread.pk}/messages/'
+        sql = self.main_query(lambda: self.api.get(url), ChatMessage, contains='ORDER BY')
+        self.assertUsesIndex(sql, ChatMessage)
+
+    def test_unread_count(self):
+        sql = self.main_query(lambda: self.api.get('/api/chat/unread-count/'), UnreadCounter)
+        self.assertUsesIndex(sql, UnreadCounter)
@@ -0,0 +1,141 @@
+"""
+Per-user, per-thread unread message counters (UnreadCounter).
+
+Unread counts used to be computed on every poll: the unread-count endpoint
+scanned new_chat_messages through a subquery over all of the user's threads,
+and the thread list ran one COUNT per thread. They are now maintained as
+rows of new_chat_unread_counters:
+
+* record_message() adds one to the counter of every participant other than
+  the sender, in the transaction that inserts the message (a single
+  INSERT ... ON CONFLICT DO UPDATE);
+* sync_unread() recounts a thread's stored counters after messages in it
+  are marked read or deleted. It reads only that thread's messages, so it
+  stays exact without tracking which of the marked messages were unread,
+  and locks the counters before recounting, so it never overwrites an
+  increment that was committed while it waited;
+* unread_total() and with_unread() answer both endpoints from the counter
+  table's (user_id, thread_id) index.
+
+repair_unread_counters() recomputes the counters of a range of threads from
+the messages themselves (``manage.py repair_unread_counters``).
+"""
+
+from django.db import connection, transaction
+from django.db.models import IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from api.auth.models import Client, Freelancer
+
+from .models import ChatMessage, ChatThread, UnreadCounter
+
+
+def _table(model):
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def _participants_sql(thread_filter):
+    """(thread_id, user_id) of both participants of the threads matching ``thread_filter``"""
+    return (
+        f'SELECT t.id AS thread_id, c.user_id FROM {_table(ChatThread)} AS t '
+        f'JOIN {_table(Client)} AS c ON c.id = t.client_id WHERE {thread_filter} '
+        f'UNION '
+        f'SELECT t.id AS thread_id, f.user_id FROM {_table(ChatThread)} AS t '
+        f'JOIN {_table(Freelancer)} AS f ON f.id = t.freelancer_id WHERE {thread_filter}'
+    )
+
+
+def record_message(message):
+    """Count a new message as unread for everyone in its thread but the sender"""
+    counters = _table(UnreadCounter)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {counters} (user_id, thread_id, unread) '
+            f'SELECT p.user_id, p.thread_id, 1 FROM ({_participants_sql("t.id = %s")}) AS p '
+            f'WHERE p.user_id <> %s '
+            f'ON CONFLICT (user_id, thread_id) DO UPDATE SET unread = {counters}.unread + 1',
+            [message.thread_id, message.thread_id, message.sender_id],
+        )
+
+
+def sync_unread(thread_id, user_id=None):
+    """Recount the stored counters of a thread (only ``user_id``'s, if given)"""
+    counters = _table(UnreadCounter)
+    condition = 'uc.thread_id = %s'
+    params = [thread_id]
+    if user_id is not None:
+        condition += ' AND uc.user_id = %s'
+        params.append(user_id)
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Lock the counters first, which waits for any record_message() holding them to
+        # commit; the recount is a separate statement, so its snapshot includes those
+        # messages. Recounting in the locking UPDATE itself would count from a snapshot
+        # taken before the wait and overwrite their increments.
+        cursor.execute(
+            f'SELECT uc.user_id FROM {counters} AS uc WHERE {condition} ORDER BY uc.user_id FOR UPDATE',
+            params,
+        )
+        cursor.execute(
+            f'UPDATE {counters} AS uc SET unread = ('
+            f'SELECT COUNT(*) FROM {_table(ChatMessage)} AS m '
+            f'WHERE m.thread_id = uc.thread_id AND NOT m.is_read AND m.sender_id <> uc.user_id'
+            f') WHERE {condition}',
+            params,
+        )
+
+
+def unread_total(user_id):
+    """Unread messages across all of the user's threads"""
+    return UnreadCounter.objects.filter(user_id=user_id).aggregate(total=Coalesce(Sum('unread'), 0))['total']
+
+
+def with_unread(threads, user_id):
+    """Annotate a ChatThread queryset with ``user_unread``, the user's unread count per thread"""
+    return threads.annotate(user_unread=Coalesce(
+        Subquery(
+            UnreadCounter.objects.filter(thread=OuterRef('pk'), user_id=user_id).values('unread')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    ))
+
+
+def repair_unread_counters(start_id, end_id):
+    """
+    Recompute the counters of threads with start_id <= id < end_id from their
+    messages. Only counters that drifted are written; returns them as
+    {(user_id, thread_id): unread}.
+    """
+    counters = _table(UnreadCounter)
+    thread_filter = 't.id >= %s AND t.id < %s'
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Blocks new messages' increments (not reads) until the batch commits,
+        # so none is counted both here and by record_message()
+        cursor.execute(f'LOCK TABLE {counters} IN SHARE ROW EXCLUSIVE MODE')
+        cursor.execute(
+            f'SELECT p.user_id, p.thread_id, COUNT(m.id) FROM ({_participants_sql(thread_filter)}) AS p '
+            f'JOIN {_table(ChatMessage)} AS m '
+            f'ON m.thread_id = p.thread_id AND NOT m.is_read AND m.sender_id <> p.user_id '
+            f'GROUP BY p.user_id, p.thread_id',
+            [start_id, end_id, start_id, end_id],
+        )
+        actual = {(user_id, thread_id): unread for user_id, thread_id, unread in cursor.fetchall()}
+        stored = {
+            (user_id, thread_id): unread
+            for user_id, thread_id, unread in UnreadCounter.objects.filter(
+                thread_id__gte=start_id, thread_id__lt=end_id
+            ).values_list('user_id', 'thread_id', 'unread')
+        }
+
+        drifted = {
+            key: actual.get(key, 0)
+            for key in actual.keys() | stored.keys()
+            if actual.get(key, 0) != stored.get(key, 0)
+        }
+        if drifted:
+            UnreadCounter.objects.bulk_create(
+                [UnreadCounter(user_id=user_id, thread_id=thread_id, unread=unread)
+                 for (user_id, thread_id), unread in drifted.items()],
+                update_conflicts=True, unique_fields=['user', 'thread'], update_fields=['unread'],
+            )
+    return drifted
@@ -2,12 +2,18 @@ from rest_framework import generics, status, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from django.db.models import Q, Max, Count
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
-from api.auth.models import Client, Freelancer, Job
+from api.auth.models import Client, Freelancer, Job, Proposal
+from api.auth.dashboard import invalidate_dashboard_stats
+from api.auth.proposals import submit_proposal
+from api.auth.tokens import request_identity
 from .models import ChatThread, ChatMessage, MessageRead
+from .unread import sync_unread, unread_total, with_unread
 from .serializers import (
     ChatThreadSerializer, ChatThreadCreateSerializer,
     ChatMessageSerializer, ChatMessageCreateSerializer,
@@ -23,15 +29,24 @@ class ChatThreadListCreateView(generics.ListCreateAPIView):
     
     def get_queryset(self):
         user = self.request.user
-        return ChatThread.objects.filter(
-            Q(client__user=user) | Q(freelancer__user=user)
+        identity = request_identity(self.request)
+        # Profile ids from the token: served by the client_id / freelancer_id indexes,
+        # where matching through the profiles' user_id forced a scan of every thread
+        participant = Q(pk__in=[])
+        if identity.client_id:
+            participant |= Q(client_id=identity.client_id)
+        if identity.freelancer_id:
+            participant |= Q(freelancer_id=identity.freelancer_id)
+        threads = ChatThread.objects.filter(
+            participant
         ).select_related(
             'client__user', 'freelancer__user', 'job'
         ).prefetch_related(
             'messages'
         ).annotate(
             last_message_time=Max('messages__sent_at')
-        ).order_by('-last_message_at')
+        )
+        return with_unread(threads, user.id).order_by('-last_message_at')
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -60,9 +75,10 @@ class ChatThreadDetailView(generics.RetrieveUpdateDestroyAPIView):
     
     def get_queryset(self):
         user = self.request.user
-        return ChatThread.objects.filter(
+        threads = ChatThread.objects.filter(
             Q(client__user=user) | Q(freelancer__user=user)
         ).select_related('client__user', 'freelancer__user', 'job')
+        return with_unread(threads, user.id)
     
     def perform_update(self, serializer):
         # Only allow updating certain fields
@@ -158,6 +174,10 @@ def mark_messages_read(request, thread_id):
     
     # Update read status
     updated_count = messages.update(is_read=True)
+    if updated_count:
+        # update() skips post_save, so the unread counter and the cached dashboard are refreshed here
+        sync_unread(thread.id, user.id)
+        invalidate_dashboard_stats(client_ids=[thread.client_id], freelancer_ids=[thread.freelancer_id])
     
     # Create read receipts
     for message in messages:
@@ -234,15 +254,7 @@ def get_thread_by_participants(request):
 def get_unread_message_count(request):
     """Get total unread message count for current user"""
     user = request.user
-    
-    unread_count = ChatMessage.objects.filter(
-        thread__in=ChatThread.objects.filter(
-            Q(client__user=user) | Q(freelancer__user=user)
-        ),
-        is_read=False
-    ).exclude(sender=user).count()
-    
-    return Response({'unread_count': unread_count})
+    return Response({'unread_count': unread_total(user.id)})
 
 
 @api_view(['POST'])
@@ -635,50 +647,86 @@ def proposal_chat(request):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Get job
+        # Get job; proposals are only taken while it is open
         try:
-            job = Job.objects.get(id=job_id)
+            job = Job.objects.get(id=job_id, status='open')
         except Job.DoesNotExist:
             return Response(
-                {'error': 'Job not found'}, 
+                {'error': 'Job not found or not open for proposals'}, 
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Check if thread already exists between freelancer and job client
-        existing_thread = ChatThread.objects.filter(
-            client=job.client,
-            freelancer=freelancer_profile,
-            job=job
-        ).first()
-        
-        if existing_thread:
-            thread = existing_thread
-            created = False
+        # Same checks as the column: finite, at most 10 digits with 2 decimals
+        bid_amount = request.data.get('bid_amount')
+        if bid_amount not in (None, ''):
+            try:
+                bid_amount = Proposal._meta.get_field('bid_amount').clean(str(bid_amount), None)
+            except ValidationError as e:
+                return Response(
+                    {'error': f"bid_amount: {' '.join(e.messages)}"}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
         else:
-            # Create new thread with job context
-            thread = ChatThread.objects.create(
-                client=job.client,
-                freelancer=freelancer_profile,
-                job=job,
-                is_active=True
+            bid_amount = None
+        
+        # Plain text or nothing, as the column stores it
+        cover_letter = request.data.get('cover_letter')
+        try:
+            if cover_letter is not None and not isinstance(cover_letter, str):
+                raise ValidationError('Must be a string.')
+            cover_letter = Proposal._meta.get_field('cover_letter').clean(cover_letter, None)
+        except ValidationError as e:
+            return Response(
+                {'error': f"cover_letter: {' '.join(e.messages)}"}, 
+                status=status.HTTP_400_BAD_REQUEST
             )
-            created = True
-            
-            # Create system message
-            system_message = ChatMessage.objects.create(
-                thread=thread,
-                sender=user,
-                message=f"Freelancer {user.get_full_name() or user.username} has submitted a proposal for job: {job.title}.",
-                message_type='system',
-                metadata={
-                    'action': 'proposal_submitted',
-                    'job_id': job.id,
-                    'job_title': job.title,
-                    'freelancer_name': user.get_full_name() or user.username,
-                    'client_name': job.client.user.get_full_name() or job.client.user.username
-                }
+        
+        # The proposal and its thread are committed together, so a failure leaves neither behind
+        with transaction.atomic():
+            # Record the proposal (once per job and freelancer); this also bumps job.proposals_count
+            proposal, proposal_created = submit_proposal(
+                job,
+                freelancer_profile,
+                cover_letter=cover_letter,
+                bid_amount=bid_amount
             )
             
+            # Check if thread already exists between freelancer and job client
+            existing_thread = ChatThread.objects.filter(
+                client=job.client,
+                freelancer=freelancer_profile,
+                job=job
+            ).first()
+            
+            if existing_thread:
+                thread = existing_thread
+                created = False
+            else:
+                # Create new thread with job context
+                thread = ChatThread.objects.create(
+                    client=job.client,
+                    freelancer=freelancer_profile,
+                    job=job,
+                    is_active=True
+                )
+                created = True
+                
+                # Create system message
+                system_message = ChatMessage.objects.create(
+                    thread=thread,
+                    sender=user,
+                    message=f"Freelancer {user.get_full_name() or user.username} has submitted a proposal for job: {job.title}.",
+                    message_type='system',
+                    metadata={
+                        'action': 'proposal_submitted',
+                        'job_id': job.id,
+                        'job_title': job.title,
+                        'freelancer_name': user.get_full_name() or user.username,
+                        'client_name': job.client.user.get_full_name() or job.client.user.username
+                    }
+                )
+        
+        if created:
             # Broadcast system message to chat
             channel_layer = get_channel_layer()
             room_group_name = f'chat_{thread.id}'
@@ -707,6 +755,8 @@ def proposal_chat(request):
         return Response({
             'thread': serializer.data,
             'created': created,
+            'proposal_id': proposal.id,
+            'proposal_created': proposal_created,
             'redirect_url': f'/dashboard/inbox/{thread.id}'
         })
         
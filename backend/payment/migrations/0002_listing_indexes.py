@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built CONCURRENTLY so existing tables stay writable
+    atomic = False
+
+    dependencies = [
+        ('payment', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['client', 'status'], name='payments_client_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['freelancer', 'status'], name='payments_freelancer_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['razorpay_order_id'], name='payments_rzp_order_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-17 05:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built CONCURRENTLY so existing tables stay writable; the
+    # covering replacements are in place before the old indexes are dropped
+    atomic = False
+
+    dependencies = [
+        ('payment', '0002_listing_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['client', '-created_at'], name='payments_client_recent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['freelancer', '-created_at'], name='payments_freelancer_recent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['client', 'status'], include=('amount',), name='payments_client_totals_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['freelancer', 'status'], include=('amount',), name='payments_freelancer_totals_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['-created_at', '-id'], name='payments_created_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='payment',
+            name='payments_client_status_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='payment',
+            name='payments_freelancer_status_idx',
+        ),
+        # The plain client_id / freelancer_id indexes are redundant with the per-party composites
+        migrations.AlterField(
+            model_name='payment',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='api_auth.client'),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='freelancer',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='api_auth.freelancer'),
+        ),
+    ]
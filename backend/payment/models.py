@@ -5,8 +5,9 @@ from api.auth.models import Job, Client, Freelancer
 class Payment(models.Model):
     """Tracks transactions between clients and freelancers"""
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='payments')
-    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='payments')
-    freelancer = models.ForeignKey(Freelancer, on_delete=models.CASCADE, related_name='payments')
+    # Indexed through the per-party composite indexes below, which lead with these columns
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='payments', db_index=False)
+    freelancer = models.ForeignKey(Freelancer, on_delete=models.CASCADE, related_name='payments', db_index=False)
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     currency = models.CharField(max_length=10, default='INR')
     payment_method = models.CharField(max_length=50, blank=True, null=True, help_text='e.g. credit_card, paypal, stripe, wallet')
@@ -24,6 +25,18 @@ class Payment(models.Model):
 
     class Meta:
         db_table = 'payments'
+        indexes = [
+            # Payment history per party, newest first (optionally filtered by status)
+            models.Index(fields=['client', '-created_at'], name='payments_client_recent_idx'),
+            models.Index(fields=['freelancer', '-created_at'], name='payments_freelancer_recent_idx'),
+            # Dashboard totals: SUM(amount) per party and status, from the index alone
+            models.Index(fields=['client', 'status'], include=['amount'], name='payments_client_totals_idx'),
+            models.Index(fields=['freelancer', 'status'], include=['amount'], name='payments_freelancer_totals_idx'),
+            # Admin payment monitoring: ORDER BY created_at DESC, id DESC
+            models.Index(fields=['-created_at', '-id'], name='payments_created_idx'),
+            # Razorpay verification looks payments up by order id
+            models.Index(fields=['razorpay_order_id'], name='payments_rzp_order_idx'),
+        ]
 
     def __str__(self):
         return f"Payment {self.id}: {self.amount} {self.currency} ({self.status})"
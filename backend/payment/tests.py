@@ -1,3 +1,72 @@
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from api.auth.models import Job, User
+from api.common.testing import QueryPlanMixin, seed_profiles, spread_timestamps
+
+from .models import Payment
+
+PAYMENT_STATUSES = ['completed', 'completed', 'completed', 'pending', 'failed']
+
+
+class PaymentQueryPlanTests(QueryPlanMixin, TestCase):
+    """The main query of each payment list is answered from an index (migration 0003)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        clients, freelancers = seed_profiles(clients=100, freelancers=100)
+        jobs = Job.objects.bulk_create([
+            Job(client=clients[i % len(clients)], title=f'Job {i}', description='Seeded job', status='completed')
+            for i in range(2000)
+        ])
+        Payment.objects.bulk_create([
+            Payment(
+                job=jobs[i % len(jobs)], client_id=jobs[i % len(jobs)].client_id, freelancer=freelancers[i % 97],
+                amount=100 + i % 500, status=PAYMENT_STATUSES[i % len(PAYMENT_STATUSES)], razorpay_order_id=f'order_{i}',
+            )
+            for i in range(10000)
+        ])
+        spread_timestamps(Payment)
+        cls.client_user = clients[0].user
+        cls.freelancer_user = freelancers[0].user
+        cls.admin = User.objects.create(username='admin', email='admin@example.com', role='admin', is_staff=True)
+        cls.analyze(Job, Payment)
+
+    def setUp(self):
+        cache.clear()
+        self.api = APIClient()
+
+    def get(self, url, user, **params):
+        self.api.force_authenticate(user)
+        return lambda: self.api.get(url, params)
+
+    def test_client_payment_list(self):
+        sql = self.main_query(self.get('/api/payment/list/', self.client_user), Payment, contains='ORDER BY')
+        self.assertUsesIndex(sql, Payment, 'payments_client_recent_idx')
+
+    def test_freelancer_payment_list(self):
+        sql = self.main_query(self.get('/api/payment/list/', self.freelancer_user), Payment, contains='ORDER BY')
+        self.assertUsesIndex(sql, Payment, 'payments_freelancer_recent_idx')
+
+    def test_payment_list_by_status(self):
+        # (freelancer, status) narrows to few enough rows that sorting them beats the ordered scan
+        sql = self.main_query(self.get('/api/payment/list/', self.freelancer_user, status='completed'), Payment, contains='ORDER BY')
+        self.assertUsesIndex(sql, Payment)
+
+    def test_client_payment_history(self):
+        # The whole history, unpaginated: any of the client_id-led indexes will do
+        sql = self.main_query(self.get('/api/auth/payments/history/', self.client_user), Payment)
+        self.assertUsesIndex(sql, Payment)
+
+    def test_admin_payments(self):
+        sql = self.main_query(self.get('/api/auth/admin/payments/', self.admin), Payment)
+        self.assertUsesIndex(sql, Payment, 'payments_created_idx')
+
+    def test_admin_payments_by_status(self):
+        sql = self.main_query(self.get('/api/auth/admin/payments/', self.admin, status='pending'), Payment)
+        self.assertUsesIndex(sql, Payment, 'payments_created_idx')
+
+    def test_order_lookup(self):
+        sql = str(Payment.objects.filter(razorpay_order_id='order_42').query).replace('order_42', "'order_42'")
+        self.assertUsesIndex(sql, Payment, 'payments_rzp_order_idx')
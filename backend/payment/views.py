@@ -10,6 +10,7 @@ import logging
 
 from api.auth.models import Job, Client, Freelancer
 from .models import Payment
+from api.auth.tokens import request_identity
 from api.common.responses import StandardResponseMixin
 from .serializers import (
     PaymentCreateSerializer, PaymentVerifySerializer, 
@@ -50,10 +51,9 @@ class CreatePaymentOrderView(APIView, StandardResponseMixin):
             # Get related objects
             job = get_object_or_404(Job, id=job_id)
             
-            # Get client profile - handle case where it might not exist
-            try:
-                client = request.user.client_profile
-            except AttributeError:
+            # Client profile id comes from the token - handle case where it might not exist
+            client_id = request_identity(request).client_id
+            if not client_id:
                 return self.error_response(
                     message="Client profile not found. Only clients can create payments.",
                     status_code=status.HTTP_403_FORBIDDEN
@@ -73,7 +73,7 @@ class CreatePaymentOrderView(APIView, StandardResponseMixin):
             with transaction.atomic():
                 payment = Payment.objects.create(
                     job=job,
-                    client=client,
+                    client_id=client_id,
                     freelancer=freelancer,
                     amount=amount,
                     currency='INR',
@@ -90,8 +90,8 @@ class CreatePaymentOrderView(APIView, StandardResponseMixin):
                 'payment_id': payment.id,
                 'receipt': razorpay_order['receipt'],
                 'client_info': {
-                    'name': client.user.get_full_name() or client.user.username,
-                    'email': client.user.email,
+                    'name': request.user.get_full_name() or request.user.username,
+                    'email': request.user.email,
                 },
                 'job_info': {
                     'id': job.id,
@@ -213,13 +213,13 @@ class PaymentListView(APIView, StandardResponseMixin):
     def get(self, request):
         """Get user's payment history"""
         try:
-            user = request.user
+            identity = request_identity(request)
             
             # Determine user type and filter payments accordingly
-            if hasattr(user, 'client_profile'):
-                payments = Payment.objects.filter(client=user.client_profile)
-            elif hasattr(user, 'freelancer_profile'):
-                payments = Payment.objects.filter(freelancer=user.freelancer_profile)
+            if identity.client_id:
+                payments = Payment.objects.filter(client_id=identity.client_id)
+            elif identity.freelancer_id:
+                payments = Payment.objects.filter(freelancer_id=identity.freelancer_id)
             else:
                 return self.error_response(
                     message="User profile not found",
@@ -31,6 +31,7 @@ import {
 } from "lucide-react";
 import adminService, { PendingJob } from "@/services/adminService";
 import { toast } from "@/hooks/use-toast";
+import { useCursorPages } from "@/hooks/useCursorPages";
 
 export const AdminJobs = () => {
   const [jobs, setJobs] = useState<PendingJob[]>([]);
@@ -41,8 +42,8 @@ export const AdminJobs = () => {
   const [showJobDetails, setShowJobDetails] = useState(false);
   const [showActionDialog, setShowActionDialog] = useState(false);
   const [actionType, setActionType] = useState<"approve" | "reject">("approve");
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
+  const { currentPage, totalPages, hasNext, cursorFor, onPage } =
+    useCursorPages();
 
   // Load pending jobs
   const loadPendingJobs = async (page: number = 1) => {
@@ -51,14 +52,14 @@ export const AdminJobs = () => {
       setError(null);
 
       const response = await adminService.getPendingJobs({
-        page,
+        cursor: cursorFor(page),
+        include_total: true,
         page_size: 10,
       });
 
       if (response.success) {
         setJobs(response.data.jobs);
-        setCurrentPage(response.data.pagination.current_page);
-        setTotalPages(response.data.pagination.total_pages);
+        onPage(page, response.data.pagination);
       } else {
         setError("Failed to load pending jobs");
       }
@@ -312,7 +313,7 @@ export const AdminJobs = () => {
             <Button
               variant="outline"
               onClick={() => loadPendingJobs(currentPage + 1)}
-              disabled={currentPage === totalPages || loading}
+              disabled={!hasNext || loading}
             >
               Next
             </Button>
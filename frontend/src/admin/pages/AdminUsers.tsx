@@ -50,6 +50,7 @@ import {
 } from "lucide-react";
 import adminService, { AdminUser } from "@/services/adminService";
 import { toast } from "@/hooks/use-toast";
+import { useCursorPages } from "@/hooks/useCursorPages";
 
 export const AdminUsers = () => {
   const [users, setUsers] = useState<AdminUser[]>([]);
@@ -57,8 +58,8 @@ export const AdminUsers = () => {
   const [error, setError] = useState<string | null>(null);
   const [selectedUser, setSelectedUser] = useState<AdminUser | null>(null);
   const [showUserDetails, setShowUserDetails] = useState(false);
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
+  const { currentPage, totalPages, hasNext, cursorFor, onPage } =
+    useCursorPages();
   const [roleFilter, setRoleFilter] = useState<string>("all");
 
   // Load users
@@ -68,7 +69,8 @@ export const AdminUsers = () => {
       setError(null);
 
       const filters = {
-        page,
+        cursor: cursorFor(page),
+        include_total: true,
         page_size: 20,
         ...(role && role !== "all" && { role }),
       };
@@ -77,8 +79,7 @@ export const AdminUsers = () => {
 
       if (response.success) {
         setUsers(response.data.users);
-        setTotalPages(response.data.pagination.total_pages);
-        setCurrentPage(response.data.pagination.current_page);
+        onPage(page, response.data.pagination);
       } else {
         setError(response.message || "Failed to load users");
       }
@@ -334,7 +335,7 @@ export const AdminUsers = () => {
                       roleFilter === "all" ? undefined : roleFilter
                     )
                   }
-                  disabled={currentPage === totalPages}
+                  disabled={!hasNext}
                 >
                   Next
                 </Button>
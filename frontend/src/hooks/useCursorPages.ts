@@ -0,0 +1,49 @@
+import { useRef, useState } from "react";
+
+export interface CursorPagination {
+  page_size: number;
+  has_next: boolean;
+  has_previous: boolean;
+  next_cursor: string | null;
+  total_count?: number; // only with include_total=true
+  total_count_exact?: boolean;
+}
+
+/**
+ * Numbered Previous/Next paging on top of the API's keyset cursors.
+ *
+ * Listing endpoints page with an opaque `cursor` instead of a page number,
+ * so this remembers the cursor that opens each page visited so far. Send
+ * `cursorFor(page)` with the request and pass the response's pagination to
+ * `onPage(page, pagination)`.
+ */
+export function useCursorPages() {
+  const cursors = useRef<(string | undefined)[]>([undefined]);
+  const [currentPage, setCurrentPage] = useState(1);
+  const [totalPages, setTotalPages] = useState(1);
+  const [totalCount, setTotalCount] = useState(0);
+  const [hasNext, setHasNext] = useState(false);
+
+  const cursorFor = (page: number) =>
+    page > 1 ? cursors.current[page - 1] : undefined;
+
+  const onPage = (page: number, pagination: CursorPagination) => {
+    // Later pages start after this page's rows, so their old cursors are stale
+    cursors.current = cursors.current.slice(0, page);
+    if (pagination.next_cursor) {
+      cursors.current[page] = pagination.next_cursor;
+    }
+
+    const counted =
+      pagination.total_count !== undefined
+        ? Math.ceil(pagination.total_count / pagination.page_size)
+        : 0;
+    setCurrentPage(page);
+    setHasNext(pagination.has_next);
+    setTotalCount(pagination.total_count ?? 0);
+    // Totals may be estimates; has_next is authoritative for the last page
+    setTotalPages(pagination.has_next ? Math.max(page + 1, counted) : page);
+  };
+
+  return { currentPage, totalPages, totalCount, hasNext, cursorFor, onPage };
+}
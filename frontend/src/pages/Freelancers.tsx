@@ -15,6 +15,7 @@ import { Search } from "lucide-react";
 import publicListingsService, {
   Freelancer,
 } from "@/services/publicListingsService";
+import { useCursorPages } from "@/hooks/useCursorPages";
 
 // Transform API Freelancer data to FreelancerCard props
 const transformFreelancerData = (freelancer: Freelancer) => ({
@@ -40,9 +41,8 @@ const Freelancers = () => {
   const [categories, setCategories] = useState<string[]>(["All Categories"]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [totalCount, setTotalCount] = useState(0);
+  const { currentPage, totalPages, totalCount, hasNext, cursorFor, onPage } =
+    useCursorPages();
 
   // Fetch freelancers from API
   const fetchFreelancers = async (page: number = 1) => {
@@ -51,9 +51,11 @@ const Freelancers = () => {
       setError(null);
 
       const filters = {
-        page,
+        cursor: cursorFor(page),
+        include_total: true,
         page_size: 12,
-        ...(searchQuery && { skills: searchQuery }), // Search in skills for now
+        fields: "card", // Compact card payload with truncated text
+        ...(searchQuery && { q: searchQuery }), // Typo-tolerant search over title, location and category
         ...(selectedCategory !== "All Categories" && {
           category: selectedCategory,
         }),
@@ -63,9 +65,7 @@ const Freelancers = () => {
 
       if (response.success) {
         setFreelancers(response.data.freelancers);
-        setTotalPages(response.data.pagination.total_pages);
-        setTotalCount(response.data.pagination.total_count);
-        setCurrentPage(response.data.pagination.current_page);
+        onPage(page, response.data.pagination);
       } else {
         setError("Failed to fetch freelancers");
       }
@@ -244,7 +244,7 @@ const Freelancers = () => {
               <Button
                 variant="outline"
                 onClick={() => fetchFreelancers(currentPage + 1)}
-                disabled={currentPage === totalPages}
+                disabled={!hasNext}
               >
                 Next
               </Button>
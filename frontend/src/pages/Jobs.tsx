@@ -14,6 +14,7 @@ import {
 import { Badge } from "@/components/ui/badge";
 import { Search, MapPin, DollarSign, Clock } from "lucide-react";
 import publicListingsService, { Job } from "@/services/publicListingsService";
+import { useCursorPages } from "@/hooks/useCursorPages";
 
 const Jobs = () => {
   const [searchTerm, setSearchTerm] = useState("");
@@ -22,9 +23,8 @@ const Jobs = () => {
   const [categories, setCategories] = useState<string[]>(["All"]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [totalCount, setTotalCount] = useState(0);
+  const { currentPage, totalPages, totalCount, hasNext, cursorFor, onPage } =
+    useCursorPages();
 
   // Fetch jobs from API
   const fetchJobs = async (page: number = 1) => {
@@ -33,9 +33,11 @@ const Jobs = () => {
       setError(null);
 
       const filters = {
-        page,
+        cursor: cursorFor(page),
+        include_total: true,
         page_size: 12,
-        ...(searchTerm && { skills: searchTerm }), // Search in skills for now
+        fields: "card", // Compact card payload with truncated text
+        ...(searchTerm && { q: searchTerm }), // Ranked full-text search
         ...(selectedCategory !== "All" && { category: selectedCategory }),
       };
 
@@ -43,9 +45,7 @@ const Jobs = () => {
 
       if (response.success) {
         setJobs(response.data.jobs);
-        setTotalPages(response.data.pagination.total_pages);
-        setTotalCount(response.data.pagination.total_count);
-        setCurrentPage(response.data.pagination.current_page);
+        onPage(page, response.data.pagination);
       } else {
         setError("Failed to fetch jobs");
       }
@@ -250,7 +250,7 @@ const Jobs = () => {
               <Button
                 variant="outline"
                 onClick={() => fetchJobs(currentPage + 1)}
-                disabled={currentPage === totalPages}
+                disabled={!hasNext}
               >
                 Next
               </Button>
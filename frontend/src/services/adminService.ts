@@ -1,4 +1,5 @@
 import api from "./api";
+import type { CursorPagination } from "@/hooks/useCursorPages";
 
 // ======================== TYPES ========================
 
@@ -80,14 +81,8 @@ export interface PendingJob {
   created_at: string;
 }
 
-export interface PaginationInfo {
-  current_page: number;
-  page_size: number;
-  total_count: number;
-  total_pages: number;
-  has_next: boolean;
-  has_previous: boolean;
-}
+// Keyset pagination: request the next page with `cursor=next_cursor`
+export type PaginationInfo = CursorPagination;
 
 export interface PendingJobsResponse {
   success: boolean;
@@ -218,13 +213,15 @@ export interface DisputeActionResponse {
 // Filter types
 export interface AdminUserFilters {
   role?: string;
-  page?: number;
+  cursor?: string;
+  include_total?: boolean;
   page_size?: number;
 }
 
 export interface AdminDisputeFilters {
   status?: string;
-  page?: number;
+  cursor?: string;
+  include_total?: boolean;
   page_size?: number;
 }
 
@@ -232,12 +229,14 @@ export interface AdminPaymentFilters {
   status?: string;
   date_from?: string;
   date_to?: string;
-  page?: number;
+  cursor?: string;
+  include_total?: boolean;
   page_size?: number;
 }
 
 export interface AdminJobFilters {
-  page?: number;
+  cursor?: string;
+  include_total?: boolean;
   page_size?: number;
 }
 
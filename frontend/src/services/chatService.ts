@@ -280,6 +280,8 @@ class ChatService {
   async createProposalChat(jobId: number): Promise<{
     thread: ChatThreadEnhanced;
     created: boolean;
+    proposal_id: number;
+    proposal_created: boolean;
     redirect_url: string;
   }> {
     const response = await api.post(`${this.baseUrl}/proposal-chat/`, {
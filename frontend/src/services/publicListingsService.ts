@@ -1,4 +1,5 @@
 import api from "./api";
+import type { CursorPagination } from "@/hooks/useCursorPages";
 
 // ======================== TYPES ========================
 
@@ -38,6 +39,15 @@ export interface JobDetailResponse {
   data: JobDetail;
 }
 
+export interface JobBatchResponse {
+  success: boolean;
+  message: string;
+  data: {
+    jobs: Record<string, JobDetail>;
+    missing: number[];
+  };
+}
+
 export interface Freelancer {
   id: number;
   name: string;
@@ -68,13 +78,34 @@ export interface FreelancerDetailResponse {
   data: FreelancerDetail;
 }
 
-export interface PaginationInfo {
-  current_page: number;
-  page_size: number;
-  total_count: number;
-  total_pages: number;
-  has_next: boolean;
-  has_previous: boolean;
+export interface FreelancerBatchResponse {
+  success: boolean;
+  message: string;
+  data: {
+    freelancers: Record<string, FreelancerDetail>;
+    missing: number[];
+  };
+}
+
+// Keyset pagination: request the next page with `cursor=next_cursor`
+export type PaginationInfo = CursorPagination;
+
+export interface FacetValue {
+  value: string | null;
+  count: number;
+}
+
+export interface BudgetBucket {
+  range: string;
+  min: number | null;
+  max: number | null;
+  count: number;
+}
+
+export interface JobFacets {
+  categories: FacetValue[];
+  budget: BudgetBucket[];
+  duration: FacetValue[];
 }
 
 export interface JobsResponse {
@@ -83,6 +114,7 @@ export interface JobsResponse {
   data: {
     jobs: Job[];
     pagination: PaginationInfo;
+    facets?: JobFacets;
   };
 }
 
@@ -96,24 +128,32 @@ export interface FreelancersResponse {
 }
 
 export interface JobFilters {
+  q?: string;
   category?: string;
   skills?: string;
   status?: string;
   min_budget?: number;
   max_budget?: number;
-  page?: number;
+  ordering?: "-created_at" | "created_at" | "proposals_count";
+  cursor?: string;
+  include_total?: boolean;
   page_size?: number;
+  facets?: boolean;
+  fields?: string;
 }
 
 export interface FreelancerFilters {
+  q?: string;
   category?: string;
   skills?: string;
   location?: string;
   rate_min?: number;
   rate_max?: number;
   ordering?: string;
-  page?: number;
+  cursor?: string;
+  include_total?: boolean;
   page_size?: number;
+  fields?: string;
 }
 
 // ======================== SERVICE ========================
@@ -158,9 +198,9 @@ export const publicListingsService = {
   // Get job categories (derived from existing jobs)
   async getJobCategories(): Promise<string[]> {
     try {
-      const response = await this.getAllJobs({ page_size: 1000 }); // Get many jobs to extract categories
-      const filteredCategories = response.data.jobs
-        .map((job) => job.category)
+      const response = await this.getAllJobs({ page_size: 1, facets: true }); // Category facet covers every open job
+      const filteredCategories = (response.data.facets?.categories ?? [])
+        .map((facet) => facet.value)
         .filter((category): category is string =>
           Boolean(category && category.trim() !== "")
         );
@@ -242,6 +282,24 @@ export const publicListingsService = {
     const response = await api.get(`/auth/freelancers/${freelancerId}/`);
     return response.data;
   },
+
+  // Get several jobs in one request, keyed by id
+  async getJobsByIds(jobIds: number[]): Promise<JobBatchResponse> {
+    const response = await api.get("/auth/jobs/batch/", {
+      params: { ids: jobIds.join(",") },
+    });
+    return response.data;
+  },
+
+  // Get several freelancers in one request, keyed by id
+  async getFreelancersByIds(
+    freelancerIds: number[]
+  ): Promise<FreelancerBatchResponse> {
+    const response = await api.get("/auth/freelancers/batch/", {
+      params: { ids: freelancerIds.join(",") },
+    });
+    return response.data;
+  },
 };
 
 export default publicListingsService;